@@ -0,0 +1,40 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from BBDown_GUI.linebuffer import LineBuffer
+
+# 每隔 FLUSH_INTERVAL 毫秒向界面推送一次，每次最多 FLUSH_MAX_LINES 行
+FLUSH_INTERVAL = 80
+FLUSH_MAX_LINES = 200
+
+class OutputBatcher(QObject):
+    """把子进程输出攒成批，按固定频率送到界面线程
+
+    put() 和 exit() 可以在任意线程调用；output_signal 和 finished_signal
+    只在界面线程由定时器发出，界面刷新频率因此与子进程的输出速度无关。
+    """
+    output_signal = pyqtSignal(list)
+    finished_signal = pyqtSignal(int)
+    def __init__(self, interval=FLUSH_INTERVAL, max_lines=FLUSH_MAX_LINES, parent=None):
+        super(OutputBatcher, self).__init__(parent)
+        self.max_lines = max_lines
+        self.buffer = LineBuffer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+        self.returncode = None
+    def put(self, line):
+        self.buffer.put(line)
+    # 子进程结束后调用，剩余的行送完后发出 finished_signal
+    def exit(self, returncode):
+        self.returncode = returncode
+    def start(self):
+        self.timer.start()
+    def flush(self):
+        # 先读退出码再取行，保证 finished_signal 之前所有输出都已送出
+        returncode = self.returncode
+        lines = self.buffer.drain(self.max_lines)
+        if lines:
+            self.output_signal.emit(lines)
+        if returncode is not None and not len(self.buffer):
+            self.timer.stop()
+            self.finished_signal.emit(returncode)
@@ -0,0 +1,59 @@
+"""监视剪贴板：复制哔哩哔哩地址或 ID 时发出 found 信号
+
+由 QClipboard.dataChanged 触发，不轮询。最近见过的地址保存在 LRU 中，
+重复复制同一个视频不会再次加入队列。
+"""
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from BBDown_GUI.ids import find_links
+
+# 记住最近的地址数
+SEEN_SIZE = 1000
+# 超过这个长度的剪贴板文本不解析（复制整篇文章、日志等）
+MAX_TEXT = 100000
+
+
+class ClipboardWatcher(QObject):
+    # 新出现的规范化地址列表
+    found = pyqtSignal(list)
+
+    def __init__(self, parent=None, size=SEEN_SIZE):
+        super(ClipboardWatcher, self).__init__(parent)
+        self.size = size
+        self.seen = OrderedDict()
+        self.watching = False
+
+    def start(self):
+        if not self.watching:
+            QApplication.clipboard().dataChanged.connect(self.changed)
+            self.watching = True
+
+    def stop(self):
+        if self.watching:
+            QApplication.clipboard().dataChanged.disconnect(self.changed)
+            self.watching = False
+
+    def remember(self, entry):
+        """记录地址，最近已见过时返回 False"""
+        if entry in self.seen:
+            self.seen.move_to_end(entry)
+            return False
+        self.seen[entry] = None
+        if len(self.seen) > self.size:
+            self.seen.popitem(last=False)
+        return True
+
+    def changed(self):
+        clipboard = QApplication.clipboard()
+        # 本程序自己复制的内容（如输出窗口中的命令）不处理
+        if clipboard.ownsClipboard():
+            return
+        text = clipboard.text()
+        if not text or len(text) > MAX_TEXT:
+            return
+        entries = [entry for entry in find_links(text) if self.remember(entry)]
+        if entries:
+            self.found.emit(entries)
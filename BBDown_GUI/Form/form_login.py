@@ -1,66 +1,97 @@
 import os
-import time
-import subprocess
 
 from PyQt5.QtWidgets import QMainWindow
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QTimer, QFileSystemWatcher
 
 from BBDown_GUI.UI.ui_qrcode import Ui_Form_QRcode
-from BBDown_GUI.tool import get_workdir, get_bbdowndir, resource_path
+from BBDown_GUI.tool import get_workdir, get_bbdowndir
+from BBDown_GUI.supervisor import get_supervisor
+from BBDown_GUI.Form.batcher import OutputBatcher
+from BBDown_GUI.Form.resources import get_icon, FAVICON
 
 workdir = get_workdir()
 
-class workthread(QThread):
-    signal = pyqtSignal(str)
-    def __init__(self, arg):
-        super(workthread, self).__init__()
-        self.arg = arg
-    def run(self):
-        for _ in range(181):
-            time.sleep(1)
-            if (((self.arg == "login") and (os.path.exists(os.path.join(workdir, "BBDown.data")))) or
-               ((self.arg == "logintv") and (os.path.exists(os.path.join(workdir, "BBDownTV.data"))))):
-                self.signal.emit("登录成功")
-                time.sleep(1)
-                self.signal.emit("关闭窗口")
-                break
-            elif os.path.exists(os.path.join(workdir, "qrcode.png")):
-                self.signal.emit("请扫描二维码")
-            else:
-                self.signal.emit("未获取到信息")
+# 登录二维码的有效时间（秒）
+LOGIN_TIMEOUT = 181
 
 class FormLogin(QMainWindow, Ui_Form_QRcode):
     def __init__(self, arg):
         super(FormLogin, self).__init__()
         self.arg = arg
         self.setupUi(self)
-        icon = QIcon()
-        icon.addPixmap(QPixmap(resource_path("./UI/favicon.ico")), QIcon.Normal, QIcon.Off)
-        self.setWindowIcon(icon)
+        self.setWindowIcon(get_icon(FAVICON))
         self.label_QR.setScaledContents(True)
-        if (arg == "login") and (os.path.exists(os.path.join(workdir, "BBDown.data"))):
-            os.remove(os.path.join(workdir, "BBDown.data"))
-        if (arg == "logintv") and (os.path.exists(os.path.join(workdir, "BBDownTV.data"))):
-            os.remove(os.path.join(workdir, "BBDownTV.data"))
+        # qrcode.png 和登录数据保存在应用工作目录
+        self.qrcode_path = os.path.join(workdir, "qrcode.png")
+        self.data_path = os.path.join(workdir, "BBDownTV.data" if arg == "logintv" else "BBDown.data")
+        if os.path.exists(self.data_path):
+            os.remove(self.data_path)
+        # 旧的二维码不再有效，等待 BBDown 重新生成
+        if os.path.exists(self.qrcode_path):
+            os.remove(self.qrcode_path)
+        self.qrcode_stat = None
+        self.logged_in = False
         env = os.environ.copy()
         env["LANG"] = "C.UTF-8"
-        self.p = subprocess.Popen(
+        self.batcher = OutputBatcher(parent=self)
+        self.batcher.output_signal.connect(self.parse_output)
+        self.batcher.finished_signal.connect(self.login_finished)
+        self.batcher.start()
+        self.process = get_supervisor().spawn(
             [get_bbdowndir(), self.arg],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            env=env,
+            self.batcher.put,
+            self.batcher.exit,
             cwd=workdir,
-            universal_newlines=True
+            env=env,
+            timeout=LOGIN_TIMEOUT
         )
         self.execute()
     def execute(self):
-        self.work = workthread(self.arg)
-        self.work.start()
-        self.work.signal.connect(self.display)
+        # 监听工作目录，登录数据或二维码文件一出现就立即处理，不再轮询
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.addPath(workdir)
+        self.watcher.directoryChanged.connect(self.check)
+        self.watcher.fileChanged.connect(self.load_qrcode)
+        self.check()
+    def check(self):
+        if self.logged_in:
+            return
+        if os.path.exists(self.data_path):
+            self.logged_in = True
+            self.display("登录成功")
+            QTimer.singleShot(1000, lambda: self.display("关闭窗口"))
+        elif os.path.exists(self.qrcode_path):
+            if self.qrcode_path not in self.watcher.files():
+                self.watcher.addPath(self.qrcode_path)
+            self.load_qrcode()
+    # 二维码文件变化时才重新解码
+    def load_qrcode(self):
+        try:
+            st = os.stat(self.qrcode_path)
+        except OSError:
+            return
+        if (st.st_mtime_ns, st.st_size) == self.qrcode_stat:
+            return
+        pixmap = QPixmap(self.qrcode_path)
+        if pixmap.isNull():
+            # 文件还没写完，等下一次变化通知
+            return
+        self.qrcode_stat = (st.st_mtime_ns, st.st_size)
+        self.label_QR.setPixmap(pixmap)
+        self.display("请扫描二维码")
+    # 文件通知不可用时（如网络磁盘），根据 BBDown 的输出判断进度
+    def parse_output(self, lines):
+        for line in lines:
+            if "登录成功" in line or "二维码" in line:
+                self.check()
+            if "过期" in line:
+                self.display("二维码已过期")
+    def login_finished(self, returncode):
+        self.check()
+        if not self.logged_in:
+            self.display("二维码已过期" if self.process.timed_out else "未获取到信息")
     def display(self, s):
-        # qrcode.png 保存在应用工作目录
-        self.label_QR.setPixmap(QPixmap(os.path.join(workdir, "qrcode.png")))
         self.label.setText(s)
         if s == "关闭窗口":
-            self.close()
\ No newline at end of file
+            self.close()
@@ -1,69 +1,47 @@
 import os
 import sys
-import subprocess
-import json
+import time
 
-from PyQt5.QtWidgets import QMainWindow, QFileDialog
-from PyQt5.QtGui import QPixmap, QIcon
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QMessageBox, QInputDialog, QWidget
 
 from BBDown_GUI.UI.ui_main import Ui_Form_main
+from BBDown_GUI.UI.ui_advanced import Ui_Form_advanced
+# 登录、下载、关于、队列窗口在第一次打开时才导入，减少启动时间
 
-from BBDown_GUI.Form.form_login import FormLogin
-from BBDown_GUI.Form.form_output import FormOutput
-from BBDown_GUI.Form.form_about import FormAbout
-
-from BBDown_GUI.tool import resource_path, get_workdir, get_bbdowndir
+from BBDown_GUI.tool import get_workdir, get_bbdowndir, add_exe_suffix
+from BBDown_GUI.options import BBDownOptions, default_config, format_argv
+from BBDown_GUI.config import SCHEMA, ConfigWriter, load_config
+from BBDown_GUI.profiles import ProfileStore
+from BBDown_GUI.Form.resources import get_icon, FAVICON
 
 
 def is_windows():
     """检测是否为 Windows 平台"""
     return sys.platform == "win32"
 
-
-def add_exe_suffix(filename):
-    """根据平台动态添加 .exe 后缀"""
-    if is_windows():
-        if not filename.endswith(".exe"):
-            return filename + ".exe"
-    return filename
-
 workdir = get_workdir()
 bbdowndir = get_bbdowndir()
 
+# 取值类型 -> 控件的读取方法、设置方法、变化信号
+ACCESSORS = {
+    bool: ("isChecked", "setChecked", "toggled"),
+    str: ("text", "setText", "textChanged"),
+    int: ("currentIndex", "setCurrentIndex", "currentIndexChanged"),
+}
+
+# 选项变化后等待这么久（毫秒）再保存，连续输入只写一次
+SAVE_DELAY = 500
+
 
 class FormMain(QMainWindow, Ui_Form_main):
     def __init__(self):
-        def Load(self):
-            f = open(os.path.join(workdir, "config.json"), "r", encoding="utf-8")
-            config = json.loads(f.read())
-            f.close()
-            for item in config:
-                if item == "advanced":
-                    self.advanced = config[item]
-                    if self.advanced:
-                        self.pushButton_advanced.setText("简易选项<")
-                        self.resize(1560, 500)
-                        self.advanced = True
-                    else:
-                        self.pushButton_advanced.setText("高级选项>")
-                        self.resize(620, 400)
-                        self.advanced = False
-                elif type(config[item]) == type(True):
-                    exec(f'self.{item}.setChecked({config[item]})')
-                elif type(config[item]) == type(''):
-                    exec(f'self.{item}.setText(r"{config[item]}")')
-                elif type(config[item]) == type(0):
-                    exec(f'self.{item}.setCurrentIndex({config[item]})')
-        
         super(FormMain, self).__init__()
         self.setupUi(self)
-        icon = QIcon()
-        icon.addPixmap(QPixmap(resource_path("./UI/favicon.ico")), QIcon.Normal, QIcon.Off)
-        self.setWindowIcon(icon)
+        self.setWindowIcon(get_icon(FAVICON))
         self.pushButton_login.clicked.connect(self.login)
         self.pushButton_logintv.clicked.connect(self.logintv)
         self.lineEdit_ffmpeg.setText(os.path.join(workdir, add_exe_suffix("ffmpeg")))
-        self.lineEdit_aria2c_path.setText(os.path.join(workdir, add_exe_suffix("aria2c")))
         self.lineEdit_dir.setText(os.path.join(workdir, "Download"))
         self.lineEdit_bbdown.setText(bbdowndir)
         self.pushButton_ffmpeg.clicked.connect(self.ffmpegpath)
@@ -73,20 +51,44 @@ class FormMain(QMainWindow, Ui_Form_main):
         self.pushButton_download.clicked.connect(self.download)
         self.pushButton_advanced.clicked.connect(self.advanced)
         self.advanced = False
+        # 高级选项面板第一次展开时才创建，创建前它的选项保存在 advanced_config 中
+        self.widget_advanced = None
+        self.advanced_config = {}
+        # 所有下载共用一个输出窗口，第一次下载时创建
+        self.win_output = None
         self.pushButton_about.clicked.connect(self.about)
+        self.pushButton_queue.clicked.connect(self.queue)
+        config_path = os.path.join(workdir, "config.json")
         try:
-            Load(self)
-        except:
-            # 当之前没有保存过任何参数时，界面为默认
-            self.resize(620, 400)
+            config, saved = load_config(config_path)
+        except (OSError, ValueError, TypeError, KeyError):
+            # config.json 损坏时界面为默认，下次保存时覆盖
+            config, saved = default_config(), None
+        self.config_writer = ConfigWriter(config_path, saved)
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY)
+        self.save_timer.timeout.connect(self.save_config)
+        self.connect_config_signals(self)
+        self.apply_config(config)
+        # 下载方案：启动时只读取方案名称
+        self.profiles = ProfileStore()
+        self.refresh_profiles()
+        self.comboBox_profile.activated.connect(self.switch_profile)
+        self.pushButton_profile_save.clicked.connect(self.save_profile)
+        self.pushButton_profile_delete.clicked.connect(self.delete_profile)
+        # 上次关闭或崩溃时未完成的队列任务，界面显示后继续下载
+        QTimer.singleShot(0, self.resume_queue)
 
     # 登录（网页端）
     def login(self):
+        from BBDown_GUI.Form.form_login import FormLogin
         self.win_login = FormLogin("login")
         self.win_login.show()  
 
     # 登录（tv端）
     def logintv(self):
+        from BBDown_GUI.Form.form_login import FormLogin
         self.win_login = FormLogin("logintv")
         self.win_login.show()   
 
@@ -103,6 +105,7 @@ class FormMain(QMainWindow, Ui_Form_main):
         if is_windows():
             os.startfile(path)
         else:
+            import subprocess
             subprocess.run(['xdg-open', path])
 
     # 设置BBDown位置
@@ -112,189 +115,197 @@ class FormMain(QMainWindow, Ui_Form_main):
         global bbdowndir
         bbdowndir = self.lineEdit_bbdown.text()
 
-    # 获取下载参数（有返回值）
-    def arg(self):
-        args = ''
-
-        # 下载地址
-        args += f' "{self.lineEdit_url.text()}" '
-
-        # 画质选择
-        if self.radioButton_dfn_priority.isChecked():
-            pass
-        elif self.radioButton_dfn_1080P.isChecked():
-            args += ' --dfn-priority "1080P 高清" '
-        elif self.radioButton_dfn_720P.isChecked():
-            args += ' --dfn-priority "720P 高清" '
-        elif self.radioButton_dfn_480P.isChecked():
-            args += ' --dfn-priority "480P 清晰" '
-        elif self.radioButton_dfn_360P.isChecked():
-            args += ' --dfn-priority "360P 流畅" '
-        elif self.radioButton_dfn_more.isChecked():
-            if self.comboBox_dfn_more.currentIndex()!=0:
-                dfn = self.comboBox_dfn_more.itemText(self.comboBox_dfn_more.currentIndex())
-                args += f' --dfn-priority "{dfn}"'
-        
-        # 下载源选择
-        if self.comboBox_source.currentIndex()!=0:
-            choice = ['', '-tv', '-app', '-intl']
-            args += ' ' + choice[self.comboBox_source.currentIndex()] + ' '
-        
-        # 下载视频编码选择
-        if self.comboBox_encoding.currentIndex()!=0:
-            choice = ['', 'AVC', 'AV1', 'HEVC']
-            args += ' --encoding-priority ' + choice[self.comboBox_encoding.currentIndex()] + ' '
-
-        # 指定FFmpeg路径
-        if self.checkBox_ffmpeg.isChecked():
-            args += f' --ffmpeg-path "{self.lineEdit_ffmpeg.text()}" '
-
-        # 下载分P选项
-        if self.radioButton_p_current.isChecked():
-            pass
-        elif self.radioButton_p_all.isChecked():
-            args += ' -p ALL '
-        elif self.radioButton_p_new.isChecked():
-            args += ' -p NEW '
-
-        # 高级选项
-        if self.advanced:
-            # 下载选项
-            if self.checkBox_audio_only.isChecked():
-                args += ' --audio-only '
-            if self.checkBox_video_only.isChecked():
-                args += ' --video-only '
-            if self.checkBox_sub_only.isChecked():
-                args += ' --sub-only '
-            if self.checkBox_danmaku.isChecked():
-                args += ' -dd '
-
-            # 交互选项
-            if self.checkBox_ia.isChecked():
-                args += ' -ia '
-            if self.checkBox_info.isChecked():
-                args += ' -info '
-            if self.checkBox_hs.isChecked():
-                args += ' -hs '
-            if self.checkBox_debug.isChecked():
-                args += ' --debug '
-
-            # Cookies
-            if self.checkBox_token.isChecked():
-                args += f' -token "{self.lineEdit_token.text()}" '
-            if self.checkBox_c.isChecked():
-                args += f' -c "{self.lineEdit_c.text()}" '
-
-            # 跳过选项
-            if self.checkBox_skip_subtitle.isChecked():
-                args += ' --skip-subtitle '
-            if self.checkBox_skip_cover.isChecked():
-                args += ' --skip-cover '
-            if self.checkBox_skip_mux.isChecked():
-                args += ' --skip-mux '
-            if self.checkBox_skip_ai.isChecked():
-                args += ' --skip-ai true '
-            else:
-                args += ' --skip-ai false '
-
-            # MP4box
-            if self.checkBox_mp4box.isChecked():
-                args += ' --use-mp4box '
-            if self.checkBox_mp4box_path.isChecked():
-                args += f' --mp4box-path "{self.lineEdit_mp4box_path.text()}" '
-
-            # 其他
-            if self.checkBox_mt.isChecked():
-                args += ' -mt true '
-            else:
-                args += ' -mt false '
-            if self.checkBox_force_http.isChecked():
-                args += ' --force-http  true '
+    # 获取下载参数（有返回值），url 为空时使用视频地址输入框；参数有误时提示并返回 None
+    def arg(self, url=None):
+        try:
+            return BBDownOptions.from_config(self.collect(), url)
+        except ValueError as e:
+            QMessageBox.warning(self, "参数错误", str(e))
+            return None
+
+    # 收集界面选项，格式与 config.json 一致
+    def collect(self):
+        config = {}
+        for name, kind in SCHEMA.items():
+            widget = getattr(self, name, None)
+            if widget is None:
+                # 高级选项面板尚未创建，取保存的值或控件初始值
+                config[name] = self.advanced_config.get(name, kind())
             else:
-                args += ' --force-http  false '
-            if self.checkBox_language.isChecked():
-                args += f' --language {self.lineEdit_language.text()} '
-
-            # 分P
-            if self.checkBox_p_show_all.isChecked():
-                args += ' --show-all '
-            if self.checkBox_p.isChecked():
-                args += f' -p {self.lineEdit_p.text()} '
-            if self.checkBox_p_delay.isChecked():
-                args += f' --delay-per-page {self.lineEdit_p_delay.text()} '
-
-            # aria2c
-            if self.checkBox_use_aria2c.isChecked():
-                args += ' --use-aria2c '
-            if self.checkBox_aria2c_path.isChecked():
-                args += f' --aria2c-path "{self.lineEdit_aria2c_path.text()}" '
-            if self.checkBox_aria2c_proxy.isChecked():
-                args += f' --aria2c-proxy {self.lineEdit_aria2c_proxy.text()} '
-            if self.checkBox_aria2c_args.isChecked():
-                args += f' --aria2c-args "{self.lineEdit_aria2c_args.text()}" '
-
-            # 文件名选项
-            if self.checkBox_F.isChecked():
-                args += f' -F "{self.lineEdit_F.text()}" '
-            if self.checkBox_M.isChecked():
-                args += f' -M "{self.lineEdit_M.text()}" '
-            
-            # 代理
-            if self.checkBox_enable_proxy.isChecked():
-                if self.checkBox_host.isChecked():
-                    args += f' --host {self.lineEdit_host.text()} '
-                if self.checkBox_ep_host.isChecked():
-                    args += f' --ep-host {self.lineEdit_ep_host.text()} '
-                if self.checkBox_area.isChecked():
-                    args += f' --area {self.lineEdit_area.text()} '
-
-        # 下载路径
-        args += f' --work-dir "{self.lineEdit_dir.text()}" '
-
-        return args
+                config[name] = getattr(widget, ACCESSORS[kind][0])()
+        config["advanced"] = self.advanced
+        return config
+
+    # 把选项一次性应用到界面，期间不触发保存，全部设置完再重绘
+    def apply_config(self, config):
+        self.setUpdatesEnabled(False)
+        self.apply_widgets(config)
+        self.set_advanced(config.get("advanced", False))
+        self.setUpdatesEnabled(True)
+
+    def apply_widgets(self, config):
+        for name, kind in SCHEMA.items():
+            if name not in config:
+                continue
+            widget = getattr(self, name, None)
+            if widget is None:
+                self.advanced_config[name] = config[name]
+                continue
+            blocked = widget.blockSignals(True)
+            getattr(widget, ACCESSORS[kind][1])(config[name])
+            widget.blockSignals(blocked)
+
+    # ui 中的控件变化时保存选项
+    def connect_config_signals(self, ui):
+        for name, kind in SCHEMA.items():
+            widget = getattr(ui, name, None)
+            if widget is not None:
+                getattr(widget, ACCESSORS[kind][2]).connect(self.config_changed)
+
+    # 创建高级选项面板，并应用此前保存的选项
+    def build_advanced(self):
+        self.widget_advanced = QWidget(self)
+        self.widget_advanced.setGeometry(620, 0, 940, 500)
+        ui = Ui_Form_advanced()
+        ui.setupUi(self.widget_advanced)
+        # 与简易界面的控件一样作为窗口的属性访问
+        self.__dict__.update(vars(ui))
+        config, self.advanced_config = self.advanced_config, {}
+        self.apply_widgets(config)
+        self.connect_config_signals(ui)
+        self.widget_advanced.show()
+
+    def refresh_profiles(self, current=None):
+        self.comboBox_profile.clear()
+        self.comboBox_profile.addItems(self.profiles.names())
+        self.comboBox_profile.setCurrentIndex(self.comboBox_profile.findText(current) if current else -1)
+
+    # 切换下载方案（视频地址保持不变）
+    def switch_profile(self, index):
+        name = self.comboBox_profile.itemText(index)
+        config = self.profiles.get(name)
+        if config is None:
+            self.refresh_profiles()
+            return
+        self.apply_config(config)
+        self.config_changed()
+
+    # 把当前选项保存为下载方案，同名时覆盖
+    def save_profile(self):
+        name, ok = QInputDialog.getText(self, "保存方案", "方案名称", text=self.comboBox_profile.currentText())
+        name = name.strip()
+        if not ok or not name:
+            return
+        self.profiles.save(name, self.collect())
+        self.refresh_profiles(name)
+
+    def delete_profile(self):
+        name = self.comboBox_profile.currentText()
+        if not name:
+            return
+        if QMessageBox.question(self, "删除方案", f"确定删除方案“{name}”吗？") != QMessageBox.Yes:
+            return
+        self.profiles.delete(name)
+        self.refresh_profiles()
+
+    def config_changed(self, *_):
+        self.save_timer.start()
+
+    # 在后台线程保存选项，内容没有变化时不写文件
+    def save_config(self):
+        self.save_timer.stop()
+        self.config_writer.save(self.collect())
+
+    def closeEvent(self, event):
+        self.save_config()
+        self.config_writer.flush(2)
+        super(FormMain, self).closeEvent(event)
 
     def param(self):
-        args = self.arg()
-        self.lineEdit_param.setText(args)
+        options = self.arg()
+        if options is not None:
+            self.lineEdit_param.setText(format_argv(options.to_argv()))
 
     # 开始下载
     def download(self):
-        def Save():
-            config = {}
-            for i in dir(self):
-                if i[:9]=="checkBox_":
-                    exec(f"config[i] = self.{i}.isChecked()")
-                elif i[:12]=="radioButton_":
-                    exec(f"config[i] = self.{i}.isChecked()")
-                elif i[:9]=="lineEdit_":
-                    exec(f"config[i] = self.{i}.text()")
-                elif i[:9]=="comboBox_":
-                    exec(f"config[i] = self.{i}.currentIndex()")
-            config["advanced"] = self.advanced
-            f = open(os.path.join(workdir, "config.json"), "w", encoding="utf-8")
-            f.write(json.dumps(config, indent=4))
-            f.close()
-
-        Save()
-        args = self.arg()
-
-        self.win_output = FormOutput(args)
-        self.win_output.show()
-
+        self.save_config()
+        options = self.arg()
+        if options is None:
+            return
+
+        # 仅解析时优先使用缓存的结果
+        if options.only_show_info:
+            from BBDown_GUI.metadata import get_metadata, format_info
+            info = get_metadata().get(options)
+            if info is not None:
+                minutes = int((time.time() - info.fetched) // 60)
+                if QMessageBox.question(self, "下载", f"{minutes} 分钟前已解析过该视频，使用缓存的结果吗？") == QMessageBox.Yes:
+                    self.output_console().add_cached(options, format_info(info))
+                    return
+
+        from BBDown_GUI.history import get_history
+        record = get_history().find(options)
+        if record is not None:
+            if record["finished"] is None:
+                # 没有下载记录，文件索引中找到了这个画质的文件
+                text = "该目录中已有相同画质的文件，仍然下载吗？"
+            else:
+                finished = time.strftime("%Y-%m-%d %H:%M", time.localtime(record["finished"]))
+                text = f"{finished} 已按相同的画质下载到该目录，仍然下载吗？"
+            if QMessageBox.question(self, "下载", text) != QMessageBox.Yes:
+                return
+        console = self.output_console()
+        try:
+            work = console.add(options)
+        except OSError as e:
+            QMessageBox.warning(self, "下载", f"无法创建暂存目录: {e}")
+            return
+        console.show_job(work)
+
+    def output_console(self):
+        if self.win_output is None:
+            from BBDown_GUI.Form.form_output import FormOutput
+            self.win_output = FormOutput()
+        return self.win_output
+
+
+    # 下载队列
+    def queue(self):
+        if not hasattr(self, "win_queue"):
+            from BBDown_GUI.Form.form_queue import FormQueue
+            self.win_queue = FormQueue(self.collect, self.profiles, self.output_console)
+        self.win_queue.show()
+        self.win_queue.activateWindow()
+
+    def resume_queue(self):
+        from BBDown_GUI.journal import get_journal
+        try:
+            pending = get_journal().recover()
+        except OSError:
+            return
+        if pending:
+            self.queue()
+            self.win_queue.resume(pending)
 
     # 高级选项
     def advanced(self):
-        if not self.advanced:
+        self.set_advanced(not self.advanced)
+        self.config_changed()
+
+    def set_advanced(self, advanced):
+        if advanced and self.widget_advanced is None:
+            self.build_advanced()
+        if advanced:
             self.pushButton_advanced.setText("简易选项<")
             self.resize(1560, 500)
-            self.advanced = True
         else:
             self.pushButton_advanced.setText("高级选项>")
             self.resize(620, 400)
-            self.advanced = False
+        self.advanced = advanced
 
 
     # 关于
     def about(self):
+        from BBDown_GUI.Form.form_about import FormAbout
         self.win_about = FormAbout()
         self.win_about.show()
\ No newline at end of file
@@ -1,76 +1,307 @@
 import os
-import platform
-import signal
-import subprocess
-import shlex
+import threading
+import time
 
-from PyQt5.QtWidgets import QMainWindow
-from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtWidgets import QMainWindow, QListWidgetItem
+from PyQt5.QtCore import QObject
 
 from BBDown_GUI.UI.ui_output import Ui_Form_output
-from BBDown_GUI.tool import get_bbdowndir, resource_path, log
+from BBDown_GUI.Form.log_view import LogBuffer, MAX_LINES
+from BBDown_GUI.Form.batcher import OutputBatcher
+from BBDown_GUI.tool import get_bbdowndir, log
+from BBDown_GUI.supervisor import get_supervisor
+from BBDown_GUI.options import format_argv
+from BBDown_GUI.history import get_history, find_outputs
+from BBDown_GUI.tempfiles import get_cleaner, parse_aid, remove_temp
+from BBDown_GUI.metadata import get_metadata
+from BBDown_GUI.muxer import staged_options, publish
+from BBDown_GUI.progress import ProgressParser, format_speed, format_eta, PART, STAGE, PROGRESS, MUX, DONE, FAILED
+from BBDown_GUI.Form.resources import get_icon, FAVICON
 
-class DownloadThread(QThread):
-    output_signal = pyqtSignal(str)
-    def __init__(self, args, cwd=None) -> None:
+class DownloadProcess(QObject):
+    """一个 BBDown 下载进程，由共用的 Supervisor 管理，不再单独占用线程"""
+    def __init__(self, argv, cwd=None, options=None, target=None) -> None:
         super().__init__()
+        self.argv = argv
+        self.cwd = cwd
+        self.options = options
+        # 下载到暂存目录（options.work_dir）时为原来的参数：下载成功后把暂存目录中的文件移到原来的下载目录，
+        # 按原来的参数写入下载记录；下载队列的任务由 Engine 写入，不给出
+        self.target = target
+        self.process = None
+        self.started = None
+        self.stopped = False
+        # 下载成功后移到下载目录的输出文件
+        self.files = []
+        # 各分P 选择的视频流，由下载队列从输出中解析，写入下载记录时记录文件的画质和编码
+        self.streams = {}
+        # 视频的 aid，被停止时只清理以它命名的临时文件夹
+        self.aid = None
+        # 输出先进入缓冲区，由界面线程的定时器批量取出
+        self.batcher = OutputBatcher(parent=self)
+        self.output_signal = self.batcher.output_signal
+        self.finished = self.batcher.finished_signal
+        # 给出 options 时，下载成功后写入下载记录，被停止时清理临时文件
+        if options is not None:
+            self.finished.connect(self.record)
+            # 仅解析（-info）的结果缓存下来，之后规划分P 和画质时不必重新解析
+            if options.only_show_info:
+                self.info_lines = []
+                self.output_signal.connect(self.info_lines.extend)
+            if options.work_dir:
+                self.output_signal.connect(self.find_aid)
+                self.finished.connect(self.release)
+    def start(self):
         # Set up environment for UTF-8 encoding
         env = os.environ.copy()
         env["LANG"] = "C.UTF-8"
         # Use list arguments and avoid shell=True for cross-platform compatibility
-        cmd_list = [get_bbdowndir()] + shlex.split(args)
-        self.p = subprocess.Popen(
-            cmd_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            env=env,
-            universal_newlines=True,
-            cwd=cwd
-        )
-    def run(self):
-        # Read the output line by line and display it in real-time
-        while True:
-            out = self.p.stdout.readline()
-            if out == '' and self.p.poll() is not None:
-                break
-            if out:
-                self.output_signal.emit(out)
-                
+        cmd_list = [get_bbdowndir()] + self.argv
+        self.started = time.time()
+        if self.options is not None and self.options.work_dir:
+            get_cleaner().begin(self.options.work_dir)
+        self.batcher.start()
+        self.process = get_supervisor().spawn(cmd_list, self.batcher.put, self.batcher.exit, cwd=self.cwd, env=env)
+    def stop(self):
+        # 结束整个进程组，子进程退出后 finished 照常发出
+        self.stopped = True
+        self.process.cancel()
+    def record(self, returncode):
+        if returncode != 0:
+            return
+        if self.options.only_show_info:
+            get_metadata().add_output(self.options, self.info_lines)
+        elif self.target is not None:
+            # 暂存目录中的文件都属于这次下载
+            try:
+                self.files = publish(self.target, find_outputs(self.options.work_dir, 0))
+            except OSError as e:
+                self.output_signal.emit([f"[BBDown_GUI] 无法移到下载目录: {e}"])
+                return
+            get_history().add(self.target, self.files, streams=self.streams)
+    def find_aid(self, lines):
+        if self.aid is not None:
+            return
+        for line in lines:
+            self.aid = parse_aid(line)
+            if self.aid is not None:
+                return
+    def release(self, returncode):
+        aid = self.aid
+        if aid is None and self.stopped:
+            # 停止前没有输出 aid 时使用缓存的视频信息
+            info = get_metadata().get(self.options, ttl=float("inf"))
+            aid = info.aid if info is not None else None
+        stopped = get_cleaner().end(self.options.work_dir, self.started, self.stopped, aid)
+        for aid, since in (stopped or {}).items():
+            # 临时文件夹可能很大，在后台线程中删除
+            threading.Thread(target=remove_temp, args=(self.options.work_dir, aid, since), daemon=True).start()
+        if self.target is not None and not find_outputs(self.options.work_dir, 0):
+            # 删除空的暂存目录；下载失败时留下的文件下次下载相同参数时继续使用
+            publish(self.target, [])
+
+class ConsoleJob:
+    """输出窗口中的一个下载任务：日志缓冲区和当前进度"""
+    def __init__(self, work, title, max_lines=MAX_LINES, argv=None):
+        # 显示缓存的解析结果时 work 为 None
+        self.work = work
+        self.argv = work.argv if work is not None else argv
+        self.title = title
+        self.log = LogBuffer(max_lines)
+        self.parser = ProgressParser()
+        self.stage = "等待中"
+        self.progress = 0
+        self.speed = ""
+        self.stopped = False
+        self.finished = False
+        # 已从输出窗口中清除
+        self.removed = False
+        self.item = QListWidgetItem(title)
+
+
 class FormOutput(QMainWindow, Ui_Form_output):
-    def __init__(self, args):
+    """所有下载任务共用的输出窗口
+
+    左侧列出任务，只有选中的任务写入日志框，其余任务的日志保存在各自的 LogBuffer 中，
+    切换时一次性载入，因此无论同时下载多少个任务都只有一个窗口和一个文本文档。
+    """
+    def __init__(self, max_lines=MAX_LINES):
         super(FormOutput, self).__init__()
         self.setupUi(self)
-        self.args = args
-        icon = QIcon()
-        icon.addPixmap(QPixmap(resource_path("./UI/favicon.ico")), QIcon.Normal, QIcon.Off)
-        self.setWindowIcon(icon)
-        self.lineEdit_cmd.setText(self.args)
-        self.lineEdit_cmd.setCursorPosition(0) # Set the cursor to the beginning
+        self.max_lines = max_lines
+        self.plainTextEdit_output.set_max_lines(max_lines)
+        self.setWindowIcon(get_icon(FAVICON))
+        # 与列表中的行一一对应
+        self.jobs = []
+        self.current = None
+        self.listWidget_jobs.currentRowChanged.connect(self.select)
         self.pushButton_stop.clicked.connect(self.stop)
-        self.flag_stop = False
-        self.execute()
-    def execute(self):
-        self.work = DownloadThread(self.args)
-        self.work.start()
-        self.work.output_signal.connect(self.display)
-    def display(self, message):
-        self.textEdit_output.setText(self.textEdit_output.toPlainText() + message.strip() + '\n')
-        self.textEdit_output.verticalScrollBar().setValue(self.textEdit_output.verticalScrollBar().maximum())
-    def stop(self):
-        if self.flag_stop == True:
+        self.pushButton_clear.clicked.connect(self.clear_finished)
+        self.select(-1)
+
+    # 启动一个下载任务并显示在输出窗口中
+    def add(self, options):
+        """无法创建暂存目录时抛出 OSError"""
+        if options.only_show_info:
+            work = DownloadProcess(options.to_argv(), options=options)
+        else:
+            # 下载到单独的暂存目录，下载记录只包含这次下载的文件；BBDown 照常混流
+            staged = staged_options(options, skip_mux=False)
+            work = DownloadProcess(staged.to_argv(), options=staged, target=options)
+        self.attach(work, options.url)
+        work.start()
+        return work
+
+    # 显示缓存的 -info 结果，不启动 BBDown
+    def add_cached(self, options, lines):
+        job = ConsoleJob(None, options.url, self.max_lines, options.to_argv())
+        job.finished = True
+        job.stage = "已完成（缓存）"
+        job.progress = self.progressBar.maximum()
+        job.log.write_lines([line + "\n" for line in lines])
+        self.jobs.append(job)
+        self.listWidget_jobs.addItem(job.item)
+        self.update_item(job)
+        self.listWidget_jobs.setCurrentRow(len(self.jobs) - 1)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    # 把已创建的下载进程加入输出窗口（下载队列使用），需在 work.start() 之前调用
+    def attach(self, work, title):
+        job = ConsoleJob(work, title, self.max_lines)
+        self.jobs.append(job)
+        self.listWidget_jobs.addItem(job.item)
+        self.update_item(job)
+        work.output_signal.connect(lambda lines, job=job: self.job_output(job, lines))
+        work.finished.connect(lambda returncode, job=job: self.job_finished(job, returncode))
+        if self.current is None:
+            self.listWidget_jobs.setCurrentRow(len(self.jobs) - 1)
+        return job
+
+    # 显示窗口并选中 work 对应的任务
+    def show_job(self, work):
+        for row, job in enumerate(self.jobs):
+            if job.work is work:
+                self.listWidget_jobs.setCurrentRow(row)
+                break
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def select(self, row):
+        self.current = self.jobs[row] if row >= 0 else None
+        job = self.current
+        if job is None:
+            self.plainTextEdit_output.clear()
+            self.lineEdit_cmd.clear()
+            self.pushButton_stop.setEnabled(False)
+            self.label_stage.setText("等待中")
+            self.progressBar.setValue(0)
+            self.label_speed.setText("")
             return
+        self.plainTextEdit_output.show_buffer(job.log)
+        self.lineEdit_cmd.setText(format_argv(job.argv))
+        self.lineEdit_cmd.setCursorPosition(0) # Set the cursor to the beginning
+        self.pushButton_stop.setEnabled(not job.finished and not job.stopped)
+        self.refresh()
+
+    # 刷新选中任务的进度条和速度
+    def refresh(self):
+        job = self.current
+        self.label_stage.setText(job.stage)
+        self.progressBar.setValue(job.progress)
+        self.label_speed.setText(job.speed)
+
+    def write(self, job, line):
+        job.log.write(line)
+        if job is self.current:
+            self.plainTextEdit_output.write(line)
+
+    def job_output(self, job, lines):
+        job.log.write_lines(lines)
+        if job is self.current:
+            self.plainTextEdit_output.write_lines(lines)
+        for line in lines:
+            event = job.parser.feed(line)
+            if event is not None:
+                self.show_progress(job, event)
+
+    def job_finished(self, job, returncode):
+        job.finished = True
+        if not job.stopped:
+            self.show_progress(job, job.parser.finish(returncode))
         else:
-            # Use cross-platform process termination method
-            try:
-                pid = self.work.p.pid
-                if platform.system() != 'Windows':
-                    os.killpg(os.getpgid(pid), signal.SIGTERM)
-                else:
-                    os.kill(pid, signal.SIGTERM)
-            except ProcessLookupError:
-                pass
-            self.display("")
-            self.display("")
-            self.display(log("[BBDown_GUI] 下载已停止"))
-            self.flag_stop = True
\ No newline at end of file
+            self.write(job, "")
+            self.write(job, "")
+            self.write(job, log("[BBDown_GUI] 下载已停止"))
+            job.stage = "已停止"
+            self.update_item(job)
+            if job is self.current:
+                self.refresh()
+        if job is self.current:
+            self.pushButton_stop.setEnabled(False)
+
+    # 根据解析出的事件更新任务的进度，选中的任务同时刷新进度条
+    def show_progress(self, job, event):
+        if event.kind == PART:
+            job.stage = f"P{event.value}"
+        elif event.kind == STAGE:
+            job.stage = f"P{job.parser.part or 1} {event.value}"
+            job.progress = 0
+            job.speed = ""
+        elif event.kind == PROGRESS:
+            percent, speed, eta = event.value
+            job.progress = int(percent * 10)
+            job.speed = format_speed(speed) if speed is not None else ""
+            if eta is not None:
+                job.speed += f"  剩余 {format_eta(eta)}"
+        elif event.kind == MUX:
+            job.stage = "混流中"
+            job.progress = self.progressBar.maximum()
+            job.speed = ""
+        elif event.kind == DONE:
+            job.stage = "已完成"
+            job.progress = self.progressBar.maximum()
+            job.speed = ""
+        elif event.kind == FAILED:
+            job.stage = "失败"
+        else:
+            return
+        self.update_item(job)
+        if job is self.current:
+            self.refresh()
+
+    def update_item(self, job):
+        job.item.setText(f"{job.title}\n{job.stage}")
+
+    def stop(self):
+        self.stop_job(self.current)
+
+    # 停止 work 对应的任务（下载队列使用）
+    def stop_work(self, work):
+        for job in self.jobs:
+            if job.work is work:
+                self.stop_job(job)
+                break
+
+    def stop_job(self, job):
+        if job is None or job.stopped or job.finished:
+            return
+        job.work.stop()
+        job.stopped = True
+        # 进程组全部退出后在 job_finished 中改为“已停止”
+        job.stage = "正在停止"
+        job.speed = ""
+        self.update_item(job)
+        if job is self.current:
+            self.pushButton_stop.setEnabled(False)
+            self.refresh()
+
+    # 从列表中移除已结束的任务，释放它们的日志
+    def clear_finished(self):
+        for row in range(len(self.jobs) - 1, -1, -1):
+            if self.jobs[row].finished:
+                # 先移出列表再删除行，删除行时会切换选中的任务
+                self.jobs.pop(row).removed = True
+                self.listWidget_jobs.takeItem(row)
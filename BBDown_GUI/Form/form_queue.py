@@ -0,0 +1,370 @@
+import sqlite3
+import time
+from collections import deque
+
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QTableWidgetItem, QMessageBox
+
+from BBDown_GUI.UI.ui_queue import Ui_Form_queue
+from BBDown_GUI.Form.form_output import DownloadProcess
+from BBDown_GUI.engine import Engine, JobSettings, DOWNLOADED, DUPLICATE
+from BBDown_GUI.jobqueue import split_urls, STATUS_TEXT, STOPPED
+from BBDown_GUI.limits import parse_windows
+from BBDown_GUI.options import BBDownOptions
+from BBDown_GUI.importer import iter_file, unique
+from BBDown_GUI.metadata import probe_options
+from BBDown_GUI.postprocess import get_postprocessor, parse_steps
+from BBDown_GUI.muxer import get_mux_queue
+from BBDown_GUI.tool import log
+from BBDown_GUI.Form.resources import get_icon, FAVICON
+
+# 导入时每批最多处理的时间（秒），处理完一批回到事件循环，界面不会卡住
+IMPORT_SLICE = 0.02
+# 一次加入不超过这么多地址时（粘贴、剪贴板）可以使用额外的名额，不必等待大批量任务
+QUICK_ADD = 3
+
+
+class ImportTask:
+    """一次导入：地址来源（迭代器）、读取选项时确定的参数和统计"""
+    def __init__(self, urls, config, profile, priority, settings, name=None, quiet=False, resumed=False):
+        self.urls = urls
+        self.config = config
+        self.profile = profile
+        self.priority = priority
+        # 加入的任务共用的设置（JobSettings）
+        self.settings = settings
+        # 从文件导入时为文件名，可以中途停止
+        self.name = name
+        # 不弹出导入结果（来自剪贴板时）
+        self.quiet = quiet
+        # urls 为队列日志中未完成的任务（JournalEntry）
+        self.resumed = resumed
+        self.added = 0
+        self.duplicate = 0
+        self.done = 0
+        self.invalid = []
+        # 加入时出错（读取下载记录失败等）的地址数，显示在各自的行中
+        self.failed = 0
+        self.stopped = False
+        self.error = None
+
+
+class FormQueue(QMainWindow, Ui_Form_queue):
+    # 混流、后处理结束（在 Supervisor 线程、进程池的线程中发出），由界面线程调用 Engine 的回调
+    deliver_signal = pyqtSignal(object, object)
+
+    def __init__(self, collect, profiles, console):
+        super(FormQueue, self).__init__()
+        self.setupUi(self)
+        # collect() 返回主界面当前的选项；选择了下载方案时改用方案中的选项
+        self.collect = collect
+        self.profiles = profiles
+        # console() 返回共用的输出窗口，任务的日志在那里查看
+        self.console = console
+        self.setWindowIcon(get_icon(FAVICON))
+        self.tableWidget_jobs.setColumnWidth(0, 420)
+        self.tableWidget_jobs.setColumnWidth(1, 100)
+        self.tableWidget_jobs.setColumnWidth(2, 60)
+        self.engine = Engine(self, self.spinBox_concurrency.value())
+        self.rows = {}
+        self.processes = {}
+        # 任务在输出窗口中的日志，后处理的输出也写在那里
+        self.logs = {}
+        self.imports = deque()
+        self.import_timer = QTimer(self)
+        self.import_timer.setInterval(0)
+        self.import_timer.timeout.connect(self.import_batch)
+        self.clipboard_watcher = None
+        self.pushButton_add.clicked.connect(self.add)
+        self.pushButton_import.clicked.connect(self.import_file)
+        self.pushButton_stop_all.clicked.connect(self.stop_all)
+        self.spinBox_concurrency.valueChanged.connect(self.set_concurrency)
+        self.spinBox_connections.valueChanged.connect(self.set_connections)
+        self.lineEdit_limit.editingFinished.connect(self.set_windows)
+        self.tableWidget_jobs.cellDoubleClicked.connect(self.show_log)
+        self.checkBox_clipboard.toggled.connect(self.watch_clipboard)
+        self.lineEdit_post.editingFinished.connect(self.set_post_steps)
+        self.spinBox_post_workers.valueChanged.connect(get_postprocessor().set_workers)
+        self.deliver_signal.connect(lambda callback, args: callback(*args))
+        self.spinBox_mux_workers.valueChanged.connect(get_mux_queue().set_workers)
+
+    # 每次打开窗口时刷新方案列表
+    def showEvent(self, event):
+        current = self.comboBox_profile.currentText()
+        self.comboBox_profile.clear()
+        self.comboBox_profile.addItem("当前选项")
+        self.comboBox_profile.addItems(self.profiles.names())
+        self.comboBox_profile.setCurrentIndex(max(0, self.comboBox_profile.findText(current)))
+        super(FormQueue, self).showEvent(event)
+
+    # 从文件导入地址，正在导入时再次点击则停止
+    def import_file(self):
+        if any(task.name for task in self.imports):
+            self.stop_import()
+            return
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "选择文件", "", "地址列表 (*.txt *.csv *.json);;文本文件 (*.txt);;CSV (*.csv);;JSON (*.json);;所有文件 (*.*)")
+        if not filepath:
+            return
+        # 逐行读取并去重，文件内容不会全部读入内存
+        self.enqueue(unique(iter_file(filepath)), filepath)
+
+    # 加入队列
+    def add(self):
+        urls = split_urls(self.plainTextEdit_urls.toPlainText())
+        self.enqueue(iter(urls), express=len(urls) <= QUICK_ADD)
+        self.plainTextEdit_urls.clear()
+
+    # 监视剪贴板，窗口关闭后仍然有效
+    def watch_clipboard(self, checked):
+        if self.clipboard_watcher is None:
+            from BBDown_GUI.Form.clipboard_watcher import ClipboardWatcher
+            self.clipboard_watcher = ClipboardWatcher(self)
+            self.clipboard_watcher.found.connect(lambda urls: self.enqueue(iter(urls), quiet=True, express=True))
+        if checked:
+            self.clipboard_watcher.start()
+        else:
+            self.clipboard_watcher.stop()
+
+    def enqueue(self, urls, name=None, quiet=False, express=False):
+        # 同一批地址只读取一次选项
+        profile = None
+        if self.comboBox_profile.currentIndex() > 0:
+            profile = self.comboBox_profile.currentText()
+            config = self.profiles.get(profile)
+            if config is None:
+                QMessageBox.warning(self, "下载队列", f"方案“{profile}”已被删除")
+                return
+        else:
+            config = self.collect()
+        settings = self.settings(self.checkBox_skip_done.isChecked(), self.checkBox_verify_files.isChecked(), express)
+        self.imports.append(ImportTask(urls, config, profile, self.spinBox_priority.value(), settings, name, quiet))
+        if name:
+            self.pushButton_import.setText("停止导入")
+        self.import_timer.start()
+
+    # 继续上次未完成的任务（由主界面在启动时调用）
+    def resume(self, entries):
+        self.imports.append(ImportTask(iter(entries), None, None, 0, self.settings(True, True), resumed=True))
+        self.import_timer.start()
+
+    def settings(self, skip_done, verify_files, express=False):
+        return JobSettings(skip_done, verify_files, express, self.spinBox_split.value(), self.spinBox_split_jobs.value(),
+                           self.checkBox_defer_mux.isChecked())
+
+    # 停止从文件导入；all_imports 时同时停止粘贴、剪贴板和继续上次任务的导入
+    def stop_import(self, all_imports=False):
+        for task in self.imports:
+            if task.stopped or not (task.name or all_imports):
+                continue
+            task.stopped = True
+            if task.resumed:
+                # 还没有加入的任务同样记为已停止，下次启动时不再继续（无法写入时下次照常继续）
+                try:
+                    for entry in task.urls:
+                        self.engine.journal.end(entry.key, STOPPED)
+                    self.engine.journal.flush()
+                except OSError:
+                    pass
+            elif task.name:
+                task.urls.close()
+        # 剩余部分在下一批时结束
+        if self.imports:
+            self.import_timer.start()
+
+    # 处理当前导入的下一批地址
+    def import_batch(self):
+        task = self.imports[0]
+        finished = task.stopped
+        self.tableWidget_jobs.setUpdatesEnabled(False)
+        deadline = time.monotonic() + IMPORT_SLICE
+        try:
+            while not finished and time.monotonic() < deadline:
+                url = next(task.urls, None)
+                if url is None:
+                    finished = True
+                    break
+                if task.resumed:
+                    self.enqueue_entry(task, url)
+                else:
+                    self.enqueue_url(task, url)
+        except (OSError, ValueError) as e:
+            task.error = str(e)
+            finished = True
+        finally:
+            self.tableWidget_jobs.setUpdatesEnabled(True)
+        try:
+            # 一批任务的日志只落盘一次
+            self.engine.journal.flush()
+        except OSError as e:
+            task.error = f"无法写入队列日志: {e}"
+            finished = True
+        self.schedule()
+        if task.name:
+            self.setWindowTitle(f"下载队列 - 正在导入（已加入 {task.added} 个）")
+        if not finished:
+            return
+        self.imports.popleft()
+        if not self.imports:
+            self.import_timer.stop()
+        if not any(t.name for t in self.imports):
+            self.pushButton_import.setText("从文件导入")
+            self.setWindowTitle("下载队列")
+        self.import_finished(task)
+
+    def enqueue_url(self, task, url):
+        try:
+            options = BBDownOptions.from_config(task.config, url)
+        except ValueError as e:
+            task.invalid.append(f"{url}: {e}")
+            return
+        try:
+            job = self.engine.add(options, task.settings, task.priority, task.profile, task)
+        except (OSError, sqlite3.Error) as e:
+            # 读取下载记录、写入队列日志出错时只有这个地址加入失败
+            self.add_failed(task, url, task.profile, task.priority, e)
+            return
+        self.added(task, job)
+
+    # 恢复上次未完成的任务，跳过已下载完成的分P
+    def enqueue_entry(self, task, entry):
+        try:
+            job = self.engine.add_entry(entry, task.settings, task)
+        except ValueError as e:
+            task.invalid.append(str(e))
+            return
+        except (OSError, sqlite3.Error) as e:
+            # 队列日志中仍然没有结束记录，下次启动时再继续
+            self.add_failed(task, entry.options.get("url"), entry.profile, entry.priority, e)
+            return
+        self.added(task, job)
+
+    def added(self, task, job):
+        if job == DOWNLOADED:
+            task.done += 1
+            return
+        if job == DUPLICATE:
+            task.duplicate += 1
+            return
+        task.added += 1
+        self.rows[job.id] = self.insert_row(job.url, job.profile, job.priority, STATUS_TEXT[job.status])
+
+    def add_failed(self, task, url, profile, priority, error):
+        task.failed += 1
+        self.insert_row(url, profile, priority, f"加入失败（{error}）")
+
+    def insert_row(self, url, profile, priority, status):
+        row = self.tableWidget_jobs.rowCount()
+        self.tableWidget_jobs.insertRow(row)
+        self.tableWidget_jobs.setItem(row, 0, QTableWidgetItem(url))
+        self.tableWidget_jobs.setItem(row, 1, QTableWidgetItem(profile or "当前选项"))
+        self.tableWidget_jobs.setItem(row, 2, QTableWidgetItem(str(priority)))
+        self.tableWidget_jobs.setItem(row, 3, QTableWidgetItem(status))
+        return row
+
+    def import_finished(self, task):
+        if task.quiet or not (task.name or task.invalid or task.failed or task.error or task.duplicate or task.done):
+            return
+        message = f"已加入 {task.added} 个任务，跳过 {task.duplicate} 个重复任务，{task.done} 个已下载的任务"
+        if task.failed:
+            message += f"，{task.failed} 个加入失败（原因见各自的行）"
+        if task.invalid:
+            message += f"，{len(task.invalid)} 个地址参数有误：\n" + "\n".join(task.invalid[:10])
+        if task.stopped:
+            message = "导入已停止\n" + message
+        elif task.error:
+            message = f"导入失败：{task.error}\n" + message
+        QMessageBox.information(self, "下载队列", message)
+
+    def set_concurrency(self, value):
+        self.engine.queue.concurrency = value
+        self.schedule()
+
+    # 连接数和限速在任务启动时写入参数，已经开始的任务不变
+    def set_connections(self, value):
+        self.engine.limits.connections = value
+
+    def set_windows(self):
+        try:
+            self.engine.limits.windows = parse_windows(self.lineEdit_limit.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "下载队列", str(e))
+
+    # 后处理步骤在任务下载完成时读取，已经开始处理的任务不变
+    def set_post_steps(self):
+        try:
+            self.engine.post_steps = parse_steps(self.lineEdit_post.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "下载队列", str(e))
+
+    # 有空闲名额就启动下一个任务
+    def schedule(self):
+        self.engine.schedule()
+
+    # 以下由 Engine 调用
+    def launch(self, job, options, record):
+        title = f"[{job.id}] {job.url}"
+        if job.parent is not None:
+            title = f"[{job.parent.id}] {job.url} P{job.options.pages}"
+        # BBDown 无法启动（路径错误等）时以返回码 -1 结束；下载记录由 Engine 写入
+        work = DownloadProcess(options.to_argv(), options=record)
+        console_job = self.console().attach(work, title)
+        work.output_signal.connect(lambda lines, job=job: self.job_output(job, lines))
+        work.finished.connect(lambda returncode, job=job, work=work: self.engine.finished(job, returncode, work.stopped))
+        self.processes[job.id] = work
+        self.logs[job.id] = console_job
+        if job.parent is not None:
+            # 双击拆分的任务时查看最近开始的子任务
+            self.processes[job.parent.id] = work
+            self.logs[job.parent.id] = console_job
+        work.start()
+
+    # 以 -info 解析分P 列表，结果由 DownloadProcess 写入缓存，结束后再拆分
+    def probe(self, job):
+        options = probe_options(job.options)
+        work = DownloadProcess(options.to_argv(), options=options)
+        self.console().attach(work, f"[{job.id}] {job.url} 解析分P")
+        work.finished.connect(lambda returncode, job=job, work=work: self.engine.probe_finished(job, returncode, work.stopped))
+        self.processes[job.id] = work
+        work.start()
+        self.show_status(job, "解析分P")
+
+    def show_status(self, job, text):
+        self.tableWidget_jobs.item(self.rows[job.id], 3).setText(text)
+
+    # 混流、后处理的输出写在任务在输出窗口中的日志里，日志已被清除时不再写入
+    def write_log(self, job, text):
+        console_job = self.logs.get(job.id)
+        if console_job is None:
+            return
+        if console_job.removed:
+            self.logs.pop(job.id)
+            return
+        self.console().write(console_job, log(text))
+
+    # 任务结束后不再保留进程和日志，输出窗口清除已结束的任务时释放日志
+    def release(self, job):
+        self.processes.pop(job.id, None)
+        self.logs.pop(job.id, None)
+
+    def deliver(self, callback, *args):
+        self.deliver_signal.emit(callback, args)
+
+    # 状态栏显示当前分P和进度，一批输出只刷新一次
+    def job_output(self, job, lines):
+        text = self.engine.output(job, lines)
+        if text is not None:
+            self.show_status(job.parent or job, text)
+
+    # 取消排队中的任务，停止正在下载的任务（结束各自的进程组）
+    def stop_all(self):
+        self.stop_import(True)
+        for job in self.engine.stop():
+            self.console().stop_work(self.processes[job.id])
+
+    # 双击任务在输出窗口中查看日志
+    def show_log(self, row, column):
+        for job_id, job_row in self.rows.items():
+            if job_row == row and job_id in self.processes:
+                self.console().show_job(self.processes[job_id])
+                break
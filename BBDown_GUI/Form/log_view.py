@@ -0,0 +1,72 @@
+from collections import deque
+
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtGui import QTextCursor
+
+# 默认最多保留的日志行数，超出后丢弃最早的行
+MAX_LINES = 5000
+
+class LogBuffer:
+    """不显示的任务的日志：与 LogView 相同的规则，只保存为字符串队列"""
+    def __init__(self, max_lines=MAX_LINES):
+        self.lines = deque(maxlen=max_lines)
+        self.overwrite = False
+
+    def write(self, line):
+        text = line.rstrip("\r\n")
+        if not self.overwrite:
+            self.lines.append(text)
+        elif text:
+            self.lines[-1] = text
+        self.overwrite = line.endswith("\r")
+
+    def write_lines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+class LogView(QPlainTextEdit):
+    """只追加、有行数上限的日志窗口
+
+    以 \\r 结尾的行（BBDown 的进度条）会在下一行到来时被原地覆盖，
+    因此无论下载多久，占用的内存和重绘开销都保持不变。
+    """
+    def __init__(self, parent=None, max_lines=MAX_LINES):
+        super(LogView, self).__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+        self.overwrite = False
+
+    def set_max_lines(self, max_lines):
+        self.setMaximumBlockCount(max_lines)
+
+    # 写入一行原始输出（保留行尾的 \r 或 \n）
+    def write(self, line):
+        text = line.rstrip("\r\n")
+        # 进度条后的空行只表示换行，与终端行为一致，不擦除进度
+        if not self.overwrite:
+            self.appendPlainText(text)
+        elif text:
+            self.replace_last(text)
+        self.overwrite = line.endswith("\r")
+
+    def write_lines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    # 切换显示的任务：一次性载入该任务的日志
+    def show_buffer(self, buffer):
+        self.setPlainText("\n".join(buffer.lines))
+        self.overwrite = buffer.overwrite
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def replace_last(self, text):
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        cursor = QTextCursor(self.document().lastBlock())
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
@@ -0,0 +1,37 @@
+"""进程内共用的图标和图片
+
+按 resource_path() 得到的完整路径缓存，打包后（_MEIPASS）与源码运行都适用。
+每个文件只解码一次，各窗口共用同一个 QPixmap / QIcon（Qt 的隐式共享，不会复制图像数据）。
+需要在 QApplication 创建之后使用。
+"""
+from PyQt5.QtGui import QPixmap, QIcon
+
+from BBDown_GUI.tool import resource_path
+
+FAVICON = "./UI/favicon.ico"
+
+_pixmaps = {}
+_icons = {}
+
+
+def get_pixmap(relative_path):
+    path = resource_path(relative_path)
+    pixmap = _pixmaps.get(path)
+    if pixmap is None:
+        pixmap = _pixmaps[path] = QPixmap(path)
+    return pixmap
+
+
+def get_icon(relative_path=FAVICON):
+    path = resource_path(relative_path)
+    icon = _icons.get(path)
+    if icon is None:
+        icon = _icons[path] = QIcon()
+        icon.addPixmap(get_pixmap(relative_path), QIcon.Normal, QIcon.Off)
+    return icon
+
+
+def preload(*relative_paths):
+    """启动时预先解码，之后打开窗口不再读取文件"""
+    for relative_path in relative_paths or (FAVICON,):
+        get_icon(relative_path)
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'advanced.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form_advanced(object):
+    def setupUi(self, Form_advanced):
+        Form_advanced.setObjectName("Form_advanced")
+        Form_advanced.resize(940, 500)
+        self.groupBox_4 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_4.setGeometry(QtCore.QRect(180, 180, 181, 131))
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.verticalLayoutWidget_10 = QtWidgets.QWidget(self.groupBox_4)
+        self.verticalLayoutWidget_10.setGeometry(QtCore.QRect(10, 20, 160, 101))
+        self.verticalLayoutWidget_10.setObjectName("verticalLayoutWidget_10")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_10)
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.checkBox_mp4box = QtWidgets.QCheckBox(self.verticalLayoutWidget_10)
+        self.checkBox_mp4box.setObjectName("checkBox_mp4box")
+        self.verticalLayout_10.addWidget(self.checkBox_mp4box)
+        self.checkBox_mp4box_path = QtWidgets.QCheckBox(self.verticalLayoutWidget_10)
+        self.checkBox_mp4box_path.setObjectName("checkBox_mp4box_path")
+        self.verticalLayout_10.addWidget(self.checkBox_mp4box_path)
+        self.lineEdit_mp4box_path = QtWidgets.QLineEdit(self.verticalLayoutWidget_10)
+        self.lineEdit_mp4box_path.setObjectName("lineEdit_mp4box_path")
+        self.verticalLayout_10.addWidget(self.lineEdit_mp4box_path)
+        self.groupBox_5 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_5.setGeometry(QtCore.QRect(380, 20, 211, 141))
+        self.groupBox_5.setObjectName("groupBox_5")
+        self.verticalLayoutWidget_13 = QtWidgets.QWidget(self.groupBox_5)
+        self.verticalLayoutWidget_13.setGeometry(QtCore.QRect(10, 20, 187, 113))
+        self.verticalLayoutWidget_13.setObjectName("verticalLayoutWidget_13")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_13)
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.checkBox_token = QtWidgets.QCheckBox(self.verticalLayoutWidget_13)
+        self.checkBox_token.setObjectName("checkBox_token")
+        self.verticalLayout_9.addWidget(self.checkBox_token)
+        self.lineEdit_token = QtWidgets.QLineEdit(self.verticalLayoutWidget_13)
+        self.lineEdit_token.setPlaceholderText("")
+        self.lineEdit_token.setObjectName("lineEdit_token")
+        self.verticalLayout_9.addWidget(self.lineEdit_token)
+        self.verticalLayout_13.addLayout(self.verticalLayout_9)
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.checkBox_c = QtWidgets.QCheckBox(self.verticalLayoutWidget_13)
+        self.checkBox_c.setObjectName("checkBox_c")
+        self.verticalLayout_8.addWidget(self.checkBox_c)
+        self.lineEdit_c = QtWidgets.QLineEdit(self.verticalLayoutWidget_13)
+        self.lineEdit_c.setPlaceholderText("")
+        self.lineEdit_c.setObjectName("lineEdit_c")
+        self.verticalLayout_8.addWidget(self.lineEdit_c)
+        self.verticalLayout_13.addLayout(self.verticalLayout_8)
+        self.groupBox_6 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_6.setGeometry(QtCore.QRect(10, 20, 141, 141))
+        self.groupBox_6.setObjectName("groupBox_6")
+        self.verticalLayoutWidget_6 = QtWidgets.QWidget(self.groupBox_6)
+        self.verticalLayoutWidget_6.setGeometry(QtCore.QRect(10, 30, 121, 99))
+        self.verticalLayoutWidget_6.setObjectName("verticalLayoutWidget_6")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_6)
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.checkBox_audio_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
+        self.checkBox_audio_only.setObjectName("checkBox_audio_only")
+        self.verticalLayout_6.addWidget(self.checkBox_audio_only)
+        self.checkBox_video_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
+        self.checkBox_video_only.setObjectName("checkBox_video_only")
+        self.verticalLayout_6.addWidget(self.checkBox_video_only)
+        self.checkBox_sub_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
+        self.checkBox_sub_only.setObjectName("checkBox_sub_only")
+        self.verticalLayout_6.addWidget(self.checkBox_sub_only)
+        self.checkBox_danmaku = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
+        self.checkBox_danmaku.setObjectName("checkBox_danmaku")
+        self.verticalLayout_6.addWidget(self.checkBox_danmaku)
+        self.groupBox_7 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_7.setGeometry(QtCore.QRect(610, 20, 311, 291))
+        self.groupBox_7.setObjectName("groupBox_7")
+        self.verticalLayoutWidget_4 = QtWidgets.QWidget(self.groupBox_7)
+        self.verticalLayoutWidget_4.setGeometry(QtCore.QRect(10, 30, 291, 251))
+        self.verticalLayoutWidget_4.setObjectName("verticalLayoutWidget_4")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_4)
+        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.checkBox_F = QtWidgets.QCheckBox(self.verticalLayoutWidget_4)
+        self.checkBox_F.setObjectName("checkBox_F")
+        self.verticalLayout.addWidget(self.checkBox_F)
+        self.lineEdit_F = QtWidgets.QLineEdit(self.verticalLayoutWidget_4)
+        self.lineEdit_F.setObjectName("lineEdit_F")
+        self.verticalLayout.addWidget(self.lineEdit_F)
+        self.verticalLayout_14.addLayout(self.verticalLayout)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.checkBox_M = QtWidgets.QCheckBox(self.verticalLayoutWidget_4)
+        self.checkBox_M.setObjectName("checkBox_M")
+        self.verticalLayout_2.addWidget(self.checkBox_M)
+        self.lineEdit_M = QtWidgets.QLineEdit(self.verticalLayoutWidget_4)
+        self.lineEdit_M.setObjectName("lineEdit_M")
+        self.verticalLayout_2.addWidget(self.lineEdit_M)
+        self.verticalLayout_14.addLayout(self.verticalLayout_2)
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.label_val = QtWidgets.QLabel(self.verticalLayoutWidget_4)
+        self.label_val.setObjectName("label_val")
+        self.verticalLayout_18.addWidget(self.label_val)
+        self.plainTextEdit = QtWidgets.QPlainTextEdit(self.verticalLayoutWidget_4)
+        self.plainTextEdit.setReadOnly(True)
+        self.plainTextEdit.setObjectName("plainTextEdit")
+        self.verticalLayout_18.addWidget(self.plainTextEdit)
+        self.verticalLayout_14.addLayout(self.verticalLayout_18)
+        self.groupBox_8 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_8.setGeometry(QtCore.QRect(10, 320, 191, 171))
+        self.groupBox_8.setObjectName("groupBox_8")
+        self.verticalLayoutWidget_12 = QtWidgets.QWidget(self.groupBox_8)
+        self.verticalLayoutWidget_12.setGeometry(QtCore.QRect(10, 20, 174, 141))
+        self.verticalLayoutWidget_12.setObjectName("verticalLayoutWidget_12")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_12)
+        self.verticalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.checkBox_p_show_all = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
+        self.checkBox_p_show_all.setObjectName("checkBox_p_show_all")
+        self.verticalLayout_12.addWidget(self.checkBox_p_show_all)
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.checkBox_p = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
+        self.checkBox_p.setObjectName("checkBox_p")
+        self.verticalLayout_5.addWidget(self.checkBox_p)
+        self.lineEdit_p = QtWidgets.QLineEdit(self.verticalLayoutWidget_12)
+        self.lineEdit_p.setObjectName("lineEdit_p")
+        self.verticalLayout_5.addWidget(self.lineEdit_p)
+        self.verticalLayout_12.addLayout(self.verticalLayout_5)
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.checkBox_p_delay = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
+        self.checkBox_p_delay.setObjectName("checkBox_p_delay")
+        self.verticalLayout_11.addWidget(self.checkBox_p_delay)
+        self.lineEdit_p_delay = QtWidgets.QLineEdit(self.verticalLayoutWidget_12)
+        self.lineEdit_p_delay.setObjectName("lineEdit_p_delay")
+        self.verticalLayout_11.addWidget(self.lineEdit_p_delay)
+        self.verticalLayout_12.addLayout(self.verticalLayout_11)
+        self.groupBox_9 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_9.setGeometry(QtCore.QRect(170, 20, 201, 141))
+        self.groupBox_9.setObjectName("groupBox_9")
+        self.verticalLayoutWidget_15 = QtWidgets.QWidget(self.groupBox_9)
+        self.verticalLayoutWidget_15.setGeometry(QtCore.QRect(10, 30, 181, 99))
+        self.verticalLayoutWidget_15.setObjectName("verticalLayoutWidget_15")
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_15)
+        self.verticalLayout_15.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.checkBox_ia = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
+        self.checkBox_ia.setObjectName("checkBox_ia")
+        self.verticalLayout_15.addWidget(self.checkBox_ia)
+        self.checkBox_info = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
+        self.checkBox_info.setObjectName("checkBox_info")
+        self.verticalLayout_15.addWidget(self.checkBox_info)
+        self.checkBox_hs = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
+        self.checkBox_hs.setObjectName("checkBox_hs")
+        self.verticalLayout_15.addWidget(self.checkBox_hs)
+        self.checkBox_debug = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
+        self.checkBox_debug.setObjectName("checkBox_debug")
+        self.verticalLayout_15.addWidget(self.checkBox_debug)
+        self.groupBox_10 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_10.setGeometry(QtCore.QRect(10, 180, 151, 131))
+        self.groupBox_10.setObjectName("groupBox_10")
+        self.verticalLayoutWidget_16 = QtWidgets.QWidget(self.groupBox_10)
+        self.verticalLayoutWidget_16.setGeometry(QtCore.QRect(10, 20, 135, 99))
+        self.verticalLayoutWidget_16.setObjectName("verticalLayoutWidget_16")
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_16)
+        self.verticalLayout_16.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.checkBox_skip_subtitle = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
+        self.checkBox_skip_subtitle.setObjectName("checkBox_skip_subtitle")
+        self.verticalLayout_16.addWidget(self.checkBox_skip_subtitle)
+        self.checkBox_skip_cover = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
+        self.checkBox_skip_cover.setObjectName("checkBox_skip_cover")
+        self.verticalLayout_16.addWidget(self.checkBox_skip_cover)
+        self.checkBox_skip_mux = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
+        self.checkBox_skip_mux.setObjectName("checkBox_skip_mux")
+        self.verticalLayout_16.addWidget(self.checkBox_skip_mux)
+        self.checkBox_skip_ai = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
+        self.checkBox_skip_ai.setObjectName("checkBox_skip_ai")
+        self.verticalLayout_16.addWidget(self.checkBox_skip_ai)
+        self.groupBox_11 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_11.setGeometry(QtCore.QRect(370, 180, 221, 131))
+        self.groupBox_11.setObjectName("groupBox_11")
+        self.verticalLayoutWidget_17 = QtWidgets.QWidget(self.groupBox_11)
+        self.verticalLayoutWidget_17.setGeometry(QtCore.QRect(10, 20, 201, 104))
+        self.verticalLayoutWidget_17.setObjectName("verticalLayoutWidget_17")
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_17)
+        self.verticalLayout_17.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.checkBox_mt = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
+        self.checkBox_mt.setChecked(True)
+        self.checkBox_mt.setObjectName("checkBox_mt")
+        self.verticalLayout_17.addWidget(self.checkBox_mt)
+        self.checkBox_force_http = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
+        self.checkBox_force_http.setChecked(True)
+        self.checkBox_force_http.setObjectName("checkBox_force_http")
+        self.verticalLayout_17.addWidget(self.checkBox_force_http)
+        self.checkBox_language = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
+        self.checkBox_language.setObjectName("checkBox_language")
+        self.verticalLayout_17.addWidget(self.checkBox_language)
+        self.lineEdit_language = QtWidgets.QLineEdit(self.verticalLayoutWidget_17)
+        self.lineEdit_language.setObjectName("lineEdit_language")
+        self.verticalLayout_17.addWidget(self.lineEdit_language)
+        self.groupBox_12 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_12.setGeometry(QtCore.QRect(220, 320, 341, 171))
+        self.groupBox_12.setObjectName("groupBox_12")
+        self.verticalLayoutWidget_7 = QtWidgets.QWidget(self.groupBox_12)
+        self.verticalLayoutWidget_7.setGeometry(QtCore.QRect(10, 20, 321, 144))
+        self.verticalLayoutWidget_7.setObjectName("verticalLayoutWidget_7")
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_7)
+        self.verticalLayout_19.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.checkBox_use_aria2c = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
+        self.checkBox_use_aria2c.setObjectName("checkBox_use_aria2c")
+        self.verticalLayout_19.addWidget(self.checkBox_use_aria2c)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.checkBox_aria2c_path = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
+        self.checkBox_aria2c_path.setObjectName("checkBox_aria2c_path")
+        self.horizontalLayout_6.addWidget(self.checkBox_aria2c_path)
+        self.lineEdit_aria2c_path = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
+        self.lineEdit_aria2c_path.setText("")
+        self.lineEdit_aria2c_path.setReadOnly(False)
+        self.lineEdit_aria2c_path.setObjectName("lineEdit_aria2c_path")
+        self.horizontalLayout_6.addWidget(self.lineEdit_aria2c_path)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_6)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.checkBox_aria2c_proxy = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
+        self.checkBox_aria2c_proxy.setObjectName("checkBox_aria2c_proxy")
+        self.horizontalLayout_7.addWidget(self.checkBox_aria2c_proxy)
+        self.lineEdit_aria2c_proxy = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
+        self.lineEdit_aria2c_proxy.setObjectName("lineEdit_aria2c_proxy")
+        self.horizontalLayout_7.addWidget(self.lineEdit_aria2c_proxy)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_7)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.checkBox_aria2c_args = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
+        self.checkBox_aria2c_args.setObjectName("checkBox_aria2c_args")
+        self.horizontalLayout_8.addWidget(self.checkBox_aria2c_args)
+        self.lineEdit_aria2c_args = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
+        self.lineEdit_aria2c_args.setObjectName("lineEdit_aria2c_args")
+        self.horizontalLayout_8.addWidget(self.lineEdit_aria2c_args)
+        self.verticalLayout_19.addLayout(self.horizontalLayout_8)
+        self.groupBox_13 = QtWidgets.QGroupBox(Form_advanced)
+        self.groupBox_13.setGeometry(QtCore.QRect(580, 320, 341, 171))
+        self.groupBox_13.setObjectName("groupBox_13")
+        self.verticalLayoutWidget = QtWidgets.QWidget(self.groupBox_13)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(10, 20, 321, 141))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.checkBox_enable_proxy = QtWidgets.QCheckBox(self.verticalLayoutWidget)
+        self.checkBox_enable_proxy.setChecked(True)
+        self.checkBox_enable_proxy.setObjectName("checkBox_enable_proxy")
+        self.verticalLayout_3.addWidget(self.checkBox_enable_proxy)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.checkBox_host = QtWidgets.QCheckBox(self.verticalLayoutWidget)
+        self.checkBox_host.setObjectName("checkBox_host")
+        self.horizontalLayout_9.addWidget(self.checkBox_host)
+        self.lineEdit_host = QtWidgets.QLineEdit(self.verticalLayoutWidget)
+        self.lineEdit_host.setObjectName("lineEdit_host")
+        self.horizontalLayout_9.addWidget(self.lineEdit_host)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.checkBox_ep_host = QtWidgets.QCheckBox(self.verticalLayoutWidget)
+        self.checkBox_ep_host.setObjectName("checkBox_ep_host")
+        self.horizontalLayout_11.addWidget(self.checkBox_ep_host)
+        self.lineEdit_ep_host = QtWidgets.QLineEdit(self.verticalLayoutWidget)
+        self.lineEdit_ep_host.setObjectName("lineEdit_ep_host")
+        self.horizontalLayout_11.addWidget(self.lineEdit_ep_host)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_11)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.checkBox_area = QtWidgets.QCheckBox(self.verticalLayoutWidget)
+        self.checkBox_area.setObjectName("checkBox_area")
+        self.horizontalLayout_10.addWidget(self.checkBox_area)
+        self.lineEdit_area = QtWidgets.QLineEdit(self.verticalLayoutWidget)
+        self.lineEdit_area.setText("")
+        self.lineEdit_area.setObjectName("lineEdit_area")
+        self.horizontalLayout_10.addWidget(self.lineEdit_area)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_10)
+
+        self.retranslateUi(Form_advanced)
+        QtCore.QMetaObject.connectSlotsByName(Form_advanced)
+
+    def retranslateUi(self, Form_advanced):
+        _translate = QtCore.QCoreApplication.translate
+        self.groupBox_4.setTitle(_translate("Form_advanced", "MP4Box"))
+        self.checkBox_mp4box.setText(_translate("Form_advanced", "使用MP4Box来混流"))
+        self.checkBox_mp4box_path.setText(_translate("Form_advanced", "设置MP4Box的路径"))
+        self.lineEdit_mp4box_path.setToolTip(_translate("Form_advanced", "<html><head/><body><p>mp4box的路径</p></body></html>"))
+        self.lineEdit_mp4box_path.setWhatsThis(_translate("Form_advanced", "<html><head/><body><p>路径不要包含空格</p></body></html>"))
+        self.groupBox_5.setTitle(_translate("Form_advanced", "cookies"))
+        self.checkBox_token.setToolTip(_translate("Form_advanced", "<html><head/><body><p>设置access_token用以下载TV/APP接口的会员内容</p></body></html>"))
+        self.checkBox_token.setText(_translate("Form_advanced", "单独设置access_token"))
+        self.checkBox_c.setToolTip(_translate("Form_advanced", "<html><head/><body><p>设置字符串cookie用以下载网页接口的会员内容</p></body></html>"))
+        self.checkBox_c.setText(_translate("Form_advanced", "单独设置cookie"))
+        self.groupBox_6.setTitle(_translate("Form_advanced", "下载选项"))
+        self.checkBox_audio_only.setText(_translate("Form_advanced", "仅下载音频"))
+        self.checkBox_video_only.setText(_translate("Form_advanced", "仅下载视频"))
+        self.checkBox_sub_only.setText(_translate("Form_advanced", "仅下载字幕"))
+        self.checkBox_danmaku.setText(_translate("Form_advanced", "下载弹幕"))
+        self.groupBox_7.setTitle(_translate("Form_advanced", "文件名选项"))
+        self.checkBox_F.setText(_translate("Form_advanced", "单分P"))
+        self.lineEdit_F.setPlaceholderText(_translate("Form_advanced", "<videoTitle>"))
+        self.checkBox_M.setText(_translate("Form_advanced", "多分P"))
+        self.lineEdit_M.setPlaceholderText(_translate("Form_advanced", "<videoTitle>/[P<pageNumberWithZero>]<pageTitle>"))
+        self.label_val.setText(_translate("Form_advanced", "内置变量"))
+        self.plainTextEdit.setPlainText(_translate("Form_advanced", "<videoTitle>: 视频主标题\n"
+"<pageNumber>: 视频分P序号\n"
+"<pageNumberWithZero>: 视频分P序号(前缀补零)\n"
+"<pageTitle>: 视频分P标题\n"
+"<bvid>: 视频BV号\n"
+"<aid>: 视频aid\n"
+"<cid>: 视频cid\n"
+"<dfn>: 视频清晰度\n"
+"<res>: 视频分辨率\n"
+"<fps>: 视频帧率\n"
+"<videoCodecs>: 视频编码\n"
+"<videoBandwidth>: 视频码率\n"
+"<audioCodecs>: 音频编码\n"
+"<audioBandwidth>: 音频码率\n"
+"<ownerName>: 上传者名称\n"
+"<ownerMid>: 上传者mid\n"
+"<publishDate>: 发布时间\n"
+"<apiType>: API类型(TV/APP/INTL/WEB)"))
+        self.groupBox_8.setTitle(_translate("Form_advanced", "分P"))
+        self.checkBox_p_show_all.setText(_translate("Form_advanced", "展示所有分P标题"))
+        self.checkBox_p.setToolTip(_translate("Form_advanced", "<html><head/><body><p>选择指定分p或分p范围：(-p 8 或 -p 1,2 或 -p 3-5 或 -p ALL)</p></body></html>"))
+        self.checkBox_p.setText(_translate("Form_advanced", "指定下载分P"))
+        self.lineEdit_p.setToolTip(_translate("Form_advanced", "<html><head/><body><p>选择指定分p或分p范围：(-p 8 或 -p 1,2 或 -p 3-5 或 -p ALL)</p></body></html>"))
+        self.lineEdit_p.setPlaceholderText(_translate("Form_advanced", "如1,2或3-5或ALL或NEW"))
+        self.checkBox_p_delay.setToolTip(_translate("Form_advanced", "<html><head/><body><p>设置下载合集分P之间的下载间隔时间(单位: 秒, 默认无间隔)</p></body></html>"))
+        self.checkBox_p_delay.setText(_translate("Form_advanced", "分P下载时间间隔"))
+        self.lineEdit_p_delay.setPlaceholderText(_translate("Form_advanced", "0"))
+        self.groupBox_9.setTitle(_translate("Form_advanced", "交互选项"))
+        self.checkBox_ia.setText(_translate("Form_advanced", "交互式选择清晰度"))
+        self.checkBox_info.setText(_translate("Form_advanced", "仅解析而不进行下载"))
+        self.checkBox_hs.setText(_translate("Form_advanced", "不显示所有音视频流"))
+        self.checkBox_debug.setText(_translate("Form_advanced", "输出调试日志"))
+        self.groupBox_10.setTitle(_translate("Form_advanced", "跳过选项"))
+        self.checkBox_skip_subtitle.setText(_translate("Form_advanced", "跳过字幕下载"))
+        self.checkBox_skip_cover.setText(_translate("Form_advanced", "跳过封面下载"))
+        self.checkBox_skip_mux.setText(_translate("Form_advanced", "跳过混流步骤"))
+        self.checkBox_skip_ai.setText(_translate("Form_advanced", "跳过AI字幕下载"))
+        self.groupBox_11.setTitle(_translate("Form_advanced", "其他"))
+        self.checkBox_mt.setText(_translate("Form_advanced", "使用多线程下载"))
+        self.checkBox_force_http.setText(_translate("Form_advanced", "使用HTTP替换HTTPS"))
+        self.checkBox_language.setToolTip(_translate("Form_advanced", "<html><head/><body><p>设置混流的音频语言(代码)，如chi, jpn等</p></body></html>"))
+        self.checkBox_language.setText(_translate("Form_advanced", "设置混流的音频语言代码"))
+        self.lineEdit_language.setPlaceholderText(_translate("Form_advanced", "如chi,jpn"))
+        self.groupBox_12.setTitle(_translate("Form_advanced", "aria2c"))
+        self.checkBox_use_aria2c.setText(_translate("Form_advanced", "使用aria2c"))
+        self.checkBox_aria2c_path.setText(_translate("Form_advanced", "文件路径"))
+        self.checkBox_aria2c_proxy.setToolTip(_translate("Form_advanced", "<html><head/><body><p>调用aria2c进行下载时的代理地址配置</p></body></html>"))
+        self.checkBox_aria2c_proxy.setText(_translate("Form_advanced", "代理地址"))
+        self.lineEdit_aria2c_proxy.setToolTip(_translate("Form_advanced", "<html><head/><body><p>调用aria2c进行下载时的代理地址配置</p></body></html>"))
+        self.checkBox_aria2c_args.setText(_translate("Form_advanced", "附加参数"))
+        self.groupBox_13.setTitle(_translate("Form_advanced", "代理"))
+        self.checkBox_enable_proxy.setText(_translate("Form_advanced", "启用代理"))
+        self.checkBox_host.setText(_translate("Form_advanced", "代理地址"))
+        self.checkBox_ep_host.setText(_translate("Form_advanced", "番剧代理"))
+        self.checkBox_area.setText(_translate("Form_advanced", "地区指定"))
+        self.lineEdit_area.setPlaceholderText(_translate("Form_advanced", "如hk"))
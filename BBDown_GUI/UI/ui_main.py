@@ -112,206 +112,32 @@ class Ui_Form_main(object):
         self.pushButton_about.setEnabled(True)
         self.pushButton_about.setGeometry(QtCore.QRect(30, 360, 93, 28))
         self.pushButton_about.setObjectName("pushButton_about")
-        self.groupBox_4 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_4.setGeometry(QtCore.QRect(800, 180, 181, 131))
-        self.groupBox_4.setObjectName("groupBox_4")
-        self.verticalLayoutWidget_10 = QtWidgets.QWidget(self.groupBox_4)
-        self.verticalLayoutWidget_10.setGeometry(QtCore.QRect(10, 20, 160, 101))
-        self.verticalLayoutWidget_10.setObjectName("verticalLayoutWidget_10")
-        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_10)
-        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_10.setObjectName("verticalLayout_10")
-        self.checkBox_mp4box = QtWidgets.QCheckBox(self.verticalLayoutWidget_10)
-        self.checkBox_mp4box.setObjectName("checkBox_mp4box")
-        self.verticalLayout_10.addWidget(self.checkBox_mp4box)
-        self.checkBox_mp4box_path = QtWidgets.QCheckBox(self.verticalLayoutWidget_10)
-        self.checkBox_mp4box_path.setObjectName("checkBox_mp4box_path")
-        self.verticalLayout_10.addWidget(self.checkBox_mp4box_path)
-        self.lineEdit_mp4box_path = QtWidgets.QLineEdit(self.verticalLayoutWidget_10)
-        self.lineEdit_mp4box_path.setObjectName("lineEdit_mp4box_path")
-        self.verticalLayout_10.addWidget(self.lineEdit_mp4box_path)
-        self.groupBox_5 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_5.setGeometry(QtCore.QRect(1000, 20, 211, 141))
-        self.groupBox_5.setObjectName("groupBox_5")
-        self.verticalLayoutWidget_13 = QtWidgets.QWidget(self.groupBox_5)
-        self.verticalLayoutWidget_13.setGeometry(QtCore.QRect(10, 20, 187, 113))
-        self.verticalLayoutWidget_13.setObjectName("verticalLayoutWidget_13")
-        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_13)
-        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_13.setObjectName("verticalLayout_13")
-        self.verticalLayout_9 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_9.setObjectName("verticalLayout_9")
-        self.checkBox_token = QtWidgets.QCheckBox(self.verticalLayoutWidget_13)
-        self.checkBox_token.setObjectName("checkBox_token")
-        self.verticalLayout_9.addWidget(self.checkBox_token)
-        self.lineEdit_token = QtWidgets.QLineEdit(self.verticalLayoutWidget_13)
-        self.lineEdit_token.setPlaceholderText("")
-        self.lineEdit_token.setObjectName("lineEdit_token")
-        self.verticalLayout_9.addWidget(self.lineEdit_token)
-        self.verticalLayout_13.addLayout(self.verticalLayout_9)
-        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_8.setObjectName("verticalLayout_8")
-        self.checkBox_c = QtWidgets.QCheckBox(self.verticalLayoutWidget_13)
-        self.checkBox_c.setObjectName("checkBox_c")
-        self.verticalLayout_8.addWidget(self.checkBox_c)
-        self.lineEdit_c = QtWidgets.QLineEdit(self.verticalLayoutWidget_13)
-        self.lineEdit_c.setPlaceholderText("")
-        self.lineEdit_c.setObjectName("lineEdit_c")
-        self.verticalLayout_8.addWidget(self.lineEdit_c)
-        self.verticalLayout_13.addLayout(self.verticalLayout_8)
-        self.groupBox_6 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_6.setGeometry(QtCore.QRect(630, 20, 141, 141))
-        self.groupBox_6.setObjectName("groupBox_6")
-        self.verticalLayoutWidget_6 = QtWidgets.QWidget(self.groupBox_6)
-        self.verticalLayoutWidget_6.setGeometry(QtCore.QRect(10, 30, 121, 99))
-        self.verticalLayoutWidget_6.setObjectName("verticalLayoutWidget_6")
-        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_6)
-        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_6.setObjectName("verticalLayout_6")
-        self.checkBox_audio_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
-        self.checkBox_audio_only.setObjectName("checkBox_audio_only")
-        self.verticalLayout_6.addWidget(self.checkBox_audio_only)
-        self.checkBox_video_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
-        self.checkBox_video_only.setObjectName("checkBox_video_only")
-        self.verticalLayout_6.addWidget(self.checkBox_video_only)
-        self.checkBox_sub_only = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
-        self.checkBox_sub_only.setObjectName("checkBox_sub_only")
-        self.verticalLayout_6.addWidget(self.checkBox_sub_only)
-        self.checkBox_danmaku = QtWidgets.QCheckBox(self.verticalLayoutWidget_6)
-        self.checkBox_danmaku.setObjectName("checkBox_danmaku")
-        self.verticalLayout_6.addWidget(self.checkBox_danmaku)
-        self.groupBox_7 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_7.setGeometry(QtCore.QRect(1230, 20, 311, 291))
-        self.groupBox_7.setObjectName("groupBox_7")
-        self.verticalLayoutWidget_4 = QtWidgets.QWidget(self.groupBox_7)
-        self.verticalLayoutWidget_4.setGeometry(QtCore.QRect(10, 30, 291, 251))
-        self.verticalLayoutWidget_4.setObjectName("verticalLayoutWidget_4")
-        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_4)
-        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_14.setObjectName("verticalLayout_14")
-        self.verticalLayout = QtWidgets.QVBoxLayout()
-        self.verticalLayout.setObjectName("verticalLayout")
-        self.checkBox_F = QtWidgets.QCheckBox(self.verticalLayoutWidget_4)
-        self.checkBox_F.setObjectName("checkBox_F")
-        self.verticalLayout.addWidget(self.checkBox_F)
-        self.lineEdit_F = QtWidgets.QLineEdit(self.verticalLayoutWidget_4)
-        self.lineEdit_F.setObjectName("lineEdit_F")
-        self.verticalLayout.addWidget(self.lineEdit_F)
-        self.verticalLayout_14.addLayout(self.verticalLayout)
-        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_2.setObjectName("verticalLayout_2")
-        self.checkBox_M = QtWidgets.QCheckBox(self.verticalLayoutWidget_4)
-        self.checkBox_M.setObjectName("checkBox_M")
-        self.verticalLayout_2.addWidget(self.checkBox_M)
-        self.lineEdit_M = QtWidgets.QLineEdit(self.verticalLayoutWidget_4)
-        self.lineEdit_M.setObjectName("lineEdit_M")
-        self.verticalLayout_2.addWidget(self.lineEdit_M)
-        self.verticalLayout_14.addLayout(self.verticalLayout_2)
-        self.verticalLayout_18 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_18.setObjectName("verticalLayout_18")
-        self.label_val = QtWidgets.QLabel(self.verticalLayoutWidget_4)
-        self.label_val.setObjectName("label_val")
-        self.verticalLayout_18.addWidget(self.label_val)
-        self.plainTextEdit = QtWidgets.QPlainTextEdit(self.verticalLayoutWidget_4)
-        self.plainTextEdit.setReadOnly(True)
-        self.plainTextEdit.setObjectName("plainTextEdit")
-        self.verticalLayout_18.addWidget(self.plainTextEdit)
-        self.verticalLayout_14.addLayout(self.verticalLayout_18)
-        self.groupBox_8 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_8.setGeometry(QtCore.QRect(630, 320, 191, 171))
-        self.groupBox_8.setObjectName("groupBox_8")
-        self.verticalLayoutWidget_12 = QtWidgets.QWidget(self.groupBox_8)
-        self.verticalLayoutWidget_12.setGeometry(QtCore.QRect(10, 20, 174, 141))
-        self.verticalLayoutWidget_12.setObjectName("verticalLayoutWidget_12")
-        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_12)
-        self.verticalLayout_12.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_12.setObjectName("verticalLayout_12")
-        self.checkBox_p_show_all = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
-        self.checkBox_p_show_all.setObjectName("checkBox_p_show_all")
-        self.verticalLayout_12.addWidget(self.checkBox_p_show_all)
-        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_5.setObjectName("verticalLayout_5")
-        self.checkBox_p = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
-        self.checkBox_p.setObjectName("checkBox_p")
-        self.verticalLayout_5.addWidget(self.checkBox_p)
-        self.lineEdit_p = QtWidgets.QLineEdit(self.verticalLayoutWidget_12)
-        self.lineEdit_p.setObjectName("lineEdit_p")
-        self.verticalLayout_5.addWidget(self.lineEdit_p)
-        self.verticalLayout_12.addLayout(self.verticalLayout_5)
-        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
-        self.verticalLayout_11.setObjectName("verticalLayout_11")
-        self.checkBox_p_delay = QtWidgets.QCheckBox(self.verticalLayoutWidget_12)
-        self.checkBox_p_delay.setObjectName("checkBox_p_delay")
-        self.verticalLayout_11.addWidget(self.checkBox_p_delay)
-        self.lineEdit_p_delay = QtWidgets.QLineEdit(self.verticalLayoutWidget_12)
-        self.lineEdit_p_delay.setObjectName("lineEdit_p_delay")
-        self.verticalLayout_11.addWidget(self.lineEdit_p_delay)
-        self.verticalLayout_12.addLayout(self.verticalLayout_11)
-        self.groupBox_9 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_9.setGeometry(QtCore.QRect(790, 20, 201, 141))
-        self.groupBox_9.setObjectName("groupBox_9")
-        self.verticalLayoutWidget_15 = QtWidgets.QWidget(self.groupBox_9)
-        self.verticalLayoutWidget_15.setGeometry(QtCore.QRect(10, 30, 181, 99))
-        self.verticalLayoutWidget_15.setObjectName("verticalLayoutWidget_15")
-        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_15)
-        self.verticalLayout_15.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_15.setObjectName("verticalLayout_15")
-        self.checkBox_ia = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
-        self.checkBox_ia.setObjectName("checkBox_ia")
-        self.verticalLayout_15.addWidget(self.checkBox_ia)
-        self.checkBox_info = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
-        self.checkBox_info.setObjectName("checkBox_info")
-        self.verticalLayout_15.addWidget(self.checkBox_info)
-        self.checkBox_hs = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
-        self.checkBox_hs.setObjectName("checkBox_hs")
-        self.verticalLayout_15.addWidget(self.checkBox_hs)
-        self.checkBox_debug = QtWidgets.QCheckBox(self.verticalLayoutWidget_15)
-        self.checkBox_debug.setObjectName("checkBox_debug")
-        self.verticalLayout_15.addWidget(self.checkBox_debug)
-        self.groupBox_10 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_10.setGeometry(QtCore.QRect(630, 180, 151, 131))
-        self.groupBox_10.setObjectName("groupBox_10")
-        self.verticalLayoutWidget_16 = QtWidgets.QWidget(self.groupBox_10)
-        self.verticalLayoutWidget_16.setGeometry(QtCore.QRect(10, 20, 135, 99))
-        self.verticalLayoutWidget_16.setObjectName("verticalLayoutWidget_16")
-        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_16)
-        self.verticalLayout_16.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_16.setObjectName("verticalLayout_16")
-        self.checkBox_skip_subtitle = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
-        self.checkBox_skip_subtitle.setObjectName("checkBox_skip_subtitle")
-        self.verticalLayout_16.addWidget(self.checkBox_skip_subtitle)
-        self.checkBox_skip_cover = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
-        self.checkBox_skip_cover.setObjectName("checkBox_skip_cover")
-        self.verticalLayout_16.addWidget(self.checkBox_skip_cover)
-        self.checkBox_skip_mux = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
-        self.checkBox_skip_mux.setObjectName("checkBox_skip_mux")
-        self.verticalLayout_16.addWidget(self.checkBox_skip_mux)
-        self.checkBox_skip_ai = QtWidgets.QCheckBox(self.verticalLayoutWidget_16)
-        self.checkBox_skip_ai.setObjectName("checkBox_skip_ai")
-        self.verticalLayout_16.addWidget(self.checkBox_skip_ai)
-        self.groupBox_11 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_11.setGeometry(QtCore.QRect(990, 180, 221, 131))
-        self.groupBox_11.setObjectName("groupBox_11")
-        self.verticalLayoutWidget_17 = QtWidgets.QWidget(self.groupBox_11)
-        self.verticalLayoutWidget_17.setGeometry(QtCore.QRect(10, 20, 201, 104))
-        self.verticalLayoutWidget_17.setObjectName("verticalLayoutWidget_17")
-        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_17)
-        self.verticalLayout_17.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_17.setObjectName("verticalLayout_17")
-        self.checkBox_mt = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
-        self.checkBox_mt.setChecked(True)
-        self.checkBox_mt.setObjectName("checkBox_mt")
-        self.verticalLayout_17.addWidget(self.checkBox_mt)
-        self.checkBox_force_http = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
-        self.checkBox_force_http.setChecked(True)
-        self.checkBox_force_http.setObjectName("checkBox_force_http")
-        self.verticalLayout_17.addWidget(self.checkBox_force_http)
-        self.checkBox_language = QtWidgets.QCheckBox(self.verticalLayoutWidget_17)
-        self.checkBox_language.setObjectName("checkBox_language")
-        self.verticalLayout_17.addWidget(self.checkBox_language)
-        self.lineEdit_language = QtWidgets.QLineEdit(self.verticalLayoutWidget_17)
-        self.lineEdit_language.setObjectName("lineEdit_language")
-        self.verticalLayout_17.addWidget(self.lineEdit_language)
+        self.pushButton_queue = QtWidgets.QPushButton(Form_main)
+        self.pushButton_queue.setGeometry(QtCore.QRect(310, 360, 93, 28))
+        self.pushButton_queue.setObjectName("pushButton_queue")
+        self.horizontalLayoutWidget_7 = QtWidgets.QWidget(Form_main)
+        self.horizontalLayoutWidget_7.setGeometry(QtCore.QRect(30, 320, 181, 31))
+        self.horizontalLayoutWidget_7.setObjectName("horizontalLayoutWidget_7")
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget_7)
+        self.horizontalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.label_profile = QtWidgets.QLabel(self.horizontalLayoutWidget_7)
+        self.label_profile.setObjectName("label_profile")
+        self.horizontalLayout_13.addWidget(self.label_profile)
+        self.comboBox_profile = QtWidgets.QComboBox(self.horizontalLayoutWidget_7)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBox_profile.sizePolicy().hasHeightForWidth())
+        self.comboBox_profile.setSizePolicy(sizePolicy)
+        self.comboBox_profile.setObjectName("comboBox_profile")
+        self.horizontalLayout_13.addWidget(self.comboBox_profile)
+        self.pushButton_profile_save = QtWidgets.QPushButton(Form_main)
+        self.pushButton_profile_save.setGeometry(QtCore.QRect(130, 360, 84, 28))
+        self.pushButton_profile_save.setObjectName("pushButton_profile_save")
+        self.pushButton_profile_delete = QtWidgets.QPushButton(Form_main)
+        self.pushButton_profile_delete.setGeometry(QtCore.QRect(220, 360, 84, 28))
+        self.pushButton_profile_delete.setObjectName("pushButton_profile_delete")
         self.horizontalLayoutWidget_5 = QtWidgets.QWidget(Form_main)
         self.horizontalLayoutWidget_5.setGeometry(QtCore.QRect(30, 420, 571, 31))
         self.horizontalLayoutWidget_5.setObjectName("horizontalLayoutWidget_5")
@@ -376,88 +202,6 @@ class Ui_Form_main(object):
         self.comboBox_dfn_more.addItem("")
         self.comboBox_dfn_more.addItem("")
         self.comboBox_dfn_more.addItem("")
-        self.groupBox_12 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_12.setGeometry(QtCore.QRect(840, 320, 341, 171))
-        self.groupBox_12.setObjectName("groupBox_12")
-        self.verticalLayoutWidget_7 = QtWidgets.QWidget(self.groupBox_12)
-        self.verticalLayoutWidget_7.setGeometry(QtCore.QRect(10, 20, 321, 144))
-        self.verticalLayoutWidget_7.setObjectName("verticalLayoutWidget_7")
-        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_7)
-        self.verticalLayout_19.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_19.setObjectName("verticalLayout_19")
-        self.checkBox_use_aria2c = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
-        self.checkBox_use_aria2c.setObjectName("checkBox_use_aria2c")
-        self.verticalLayout_19.addWidget(self.checkBox_use_aria2c)
-        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.checkBox_aria2c_path = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
-        self.checkBox_aria2c_path.setObjectName("checkBox_aria2c_path")
-        self.horizontalLayout_6.addWidget(self.checkBox_aria2c_path)
-        self.lineEdit_aria2c_path = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
-        self.lineEdit_aria2c_path.setText("")
-        self.lineEdit_aria2c_path.setReadOnly(False)
-        self.lineEdit_aria2c_path.setObjectName("lineEdit_aria2c_path")
-        self.horizontalLayout_6.addWidget(self.lineEdit_aria2c_path)
-        self.verticalLayout_19.addLayout(self.horizontalLayout_6)
-        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
-        self.checkBox_aria2c_proxy = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
-        self.checkBox_aria2c_proxy.setObjectName("checkBox_aria2c_proxy")
-        self.horizontalLayout_7.addWidget(self.checkBox_aria2c_proxy)
-        self.lineEdit_aria2c_proxy = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
-        self.lineEdit_aria2c_proxy.setObjectName("lineEdit_aria2c_proxy")
-        self.horizontalLayout_7.addWidget(self.lineEdit_aria2c_proxy)
-        self.verticalLayout_19.addLayout(self.horizontalLayout_7)
-        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.checkBox_aria2c_args = QtWidgets.QCheckBox(self.verticalLayoutWidget_7)
-        self.checkBox_aria2c_args.setObjectName("checkBox_aria2c_args")
-        self.horizontalLayout_8.addWidget(self.checkBox_aria2c_args)
-        self.lineEdit_aria2c_args = QtWidgets.QLineEdit(self.verticalLayoutWidget_7)
-        self.lineEdit_aria2c_args.setObjectName("lineEdit_aria2c_args")
-        self.horizontalLayout_8.addWidget(self.lineEdit_aria2c_args)
-        self.verticalLayout_19.addLayout(self.horizontalLayout_8)
-        self.groupBox_13 = QtWidgets.QGroupBox(Form_main)
-        self.groupBox_13.setGeometry(QtCore.QRect(1200, 320, 341, 171))
-        self.groupBox_13.setObjectName("groupBox_13")
-        self.verticalLayoutWidget = QtWidgets.QWidget(self.groupBox_13)
-        self.verticalLayoutWidget.setGeometry(QtCore.QRect(10, 20, 321, 141))
-        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
-        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
-        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_3.setObjectName("verticalLayout_3")
-        self.checkBox_enable_proxy = QtWidgets.QCheckBox(self.verticalLayoutWidget)
-        self.checkBox_enable_proxy.setChecked(True)
-        self.checkBox_enable_proxy.setObjectName("checkBox_enable_proxy")
-        self.verticalLayout_3.addWidget(self.checkBox_enable_proxy)
-        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
-        self.checkBox_host = QtWidgets.QCheckBox(self.verticalLayoutWidget)
-        self.checkBox_host.setObjectName("checkBox_host")
-        self.horizontalLayout_9.addWidget(self.checkBox_host)
-        self.lineEdit_host = QtWidgets.QLineEdit(self.verticalLayoutWidget)
-        self.lineEdit_host.setObjectName("lineEdit_host")
-        self.horizontalLayout_9.addWidget(self.lineEdit_host)
-        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
-        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
-        self.checkBox_ep_host = QtWidgets.QCheckBox(self.verticalLayoutWidget)
-        self.checkBox_ep_host.setObjectName("checkBox_ep_host")
-        self.horizontalLayout_11.addWidget(self.checkBox_ep_host)
-        self.lineEdit_ep_host = QtWidgets.QLineEdit(self.verticalLayoutWidget)
-        self.lineEdit_ep_host.setObjectName("lineEdit_ep_host")
-        self.horizontalLayout_11.addWidget(self.lineEdit_ep_host)
-        self.verticalLayout_3.addLayout(self.horizontalLayout_11)
-        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
-        self.checkBox_area = QtWidgets.QCheckBox(self.verticalLayoutWidget)
-        self.checkBox_area.setObjectName("checkBox_area")
-        self.horizontalLayout_10.addWidget(self.checkBox_area)
-        self.lineEdit_area = QtWidgets.QLineEdit(self.verticalLayoutWidget)
-        self.lineEdit_area.setText("")
-        self.lineEdit_area.setObjectName("lineEdit_area")
-        self.horizontalLayout_10.addWidget(self.lineEdit_area)
-        self.verticalLayout_3.addLayout(self.horizontalLayout_10)
         self.horizontalLayoutWidget_6 = QtWidgets.QWidget(Form_main)
         self.horizontalLayoutWidget_6.setGeometry(QtCore.QRect(30, 460, 571, 31))
         self.horizontalLayoutWidget_6.setObjectName("horizontalLayoutWidget_6")
@@ -503,70 +247,11 @@ class Ui_Form_main(object):
         self.pushButton_download.setText(_translate("Form_main", "下载"))
         self.pushButton_advanced.setText(_translate("Form_main", "高级选项>"))
         self.pushButton_about.setText(_translate("Form_main", "关于"))
-        self.groupBox_4.setTitle(_translate("Form_main", "MP4Box"))
-        self.checkBox_mp4box.setText(_translate("Form_main", "使用MP4Box来混流"))
-        self.checkBox_mp4box_path.setText(_translate("Form_main", "设置MP4Box的路径"))
-        self.lineEdit_mp4box_path.setToolTip(_translate("Form_main", "<html><head/><body><p>mp4box的路径</p></body></html>"))
-        self.lineEdit_mp4box_path.setWhatsThis(_translate("Form_main", "<html><head/><body><p>路径不要包含空格</p></body></html>"))
-        self.groupBox_5.setTitle(_translate("Form_main", "cookies"))
-        self.checkBox_token.setToolTip(_translate("Form_main", "<html><head/><body><p>设置access_token用以下载TV/APP接口的会员内容</p></body></html>"))
-        self.checkBox_token.setText(_translate("Form_main", "单独设置access_token"))
-        self.checkBox_c.setToolTip(_translate("Form_main", "<html><head/><body><p>设置字符串cookie用以下载网页接口的会员内容</p></body></html>"))
-        self.checkBox_c.setText(_translate("Form_main", "单独设置cookie"))
-        self.groupBox_6.setTitle(_translate("Form_main", "下载选项"))
-        self.checkBox_audio_only.setText(_translate("Form_main", "仅下载音频"))
-        self.checkBox_video_only.setText(_translate("Form_main", "仅下载视频"))
-        self.checkBox_sub_only.setText(_translate("Form_main", "仅下载字幕"))
-        self.checkBox_danmaku.setText(_translate("Form_main", "下载弹幕"))
-        self.groupBox_7.setTitle(_translate("Form_main", "文件名选项"))
-        self.checkBox_F.setText(_translate("Form_main", "单分P"))
-        self.lineEdit_F.setPlaceholderText(_translate("Form_main", "<videoTitle>"))
-        self.checkBox_M.setText(_translate("Form_main", "多分P"))
-        self.lineEdit_M.setPlaceholderText(_translate("Form_main", "<videoTitle>/[P<pageNumberWithZero>]<pageTitle>"))
-        self.label_val.setText(_translate("Form_main", "内置变量"))
-        self.plainTextEdit.setPlainText(_translate("Form_main", "<videoTitle>: 视频主标题\n"
-"<pageNumber>: 视频分P序号\n"
-"<pageNumberWithZero>: 视频分P序号(前缀补零)\n"
-"<pageTitle>: 视频分P标题\n"
-"<bvid>: 视频BV号\n"
-"<aid>: 视频aid\n"
-"<cid>: 视频cid\n"
-"<dfn>: 视频清晰度\n"
-"<res>: 视频分辨率\n"
-"<fps>: 视频帧率\n"
-"<videoCodecs>: 视频编码\n"
-"<videoBandwidth>: 视频码率\n"
-"<audioCodecs>: 音频编码\n"
-"<audioBandwidth>: 音频码率\n"
-"<ownerName>: 上传者名称\n"
-"<ownerMid>: 上传者mid\n"
-"<publishDate>: 发布时间\n"
-"<apiType>: API类型(TV/APP/INTL/WEB)"))
-        self.groupBox_8.setTitle(_translate("Form_main", "分P"))
-        self.checkBox_p_show_all.setText(_translate("Form_main", "展示所有分P标题"))
-        self.checkBox_p.setToolTip(_translate("Form_main", "<html><head/><body><p>选择指定分p或分p范围：(-p 8 或 -p 1,2 或 -p 3-5 或 -p ALL)</p></body></html>"))
-        self.checkBox_p.setText(_translate("Form_main", "指定下载分P"))
-        self.lineEdit_p.setToolTip(_translate("Form_main", "<html><head/><body><p>选择指定分p或分p范围：(-p 8 或 -p 1,2 或 -p 3-5 或 -p ALL)</p></body></html>"))
-        self.lineEdit_p.setPlaceholderText(_translate("Form_main", "如1,2或3-5或ALL或NEW"))
-        self.checkBox_p_delay.setToolTip(_translate("Form_main", "<html><head/><body><p>设置下载合集分P之间的下载间隔时间(单位: 秒, 默认无间隔)</p></body></html>"))
-        self.checkBox_p_delay.setText(_translate("Form_main", "分P下载时间间隔"))
-        self.lineEdit_p_delay.setPlaceholderText(_translate("Form_main", "0"))
-        self.groupBox_9.setTitle(_translate("Form_main", "交互选项"))
-        self.checkBox_ia.setText(_translate("Form_main", "交互式选择清晰度"))
-        self.checkBox_info.setText(_translate("Form_main", "仅解析而不进行下载"))
-        self.checkBox_hs.setText(_translate("Form_main", "不显示所有音视频流"))
-        self.checkBox_debug.setText(_translate("Form_main", "输出调试日志"))
-        self.groupBox_10.setTitle(_translate("Form_main", "跳过选项"))
-        self.checkBox_skip_subtitle.setText(_translate("Form_main", "跳过字幕下载"))
-        self.checkBox_skip_cover.setText(_translate("Form_main", "跳过封面下载"))
-        self.checkBox_skip_mux.setText(_translate("Form_main", "跳过混流步骤"))
-        self.checkBox_skip_ai.setText(_translate("Form_main", "跳过AI字幕下载"))
-        self.groupBox_11.setTitle(_translate("Form_main", "其他"))
-        self.checkBox_mt.setText(_translate("Form_main", "使用多线程下载"))
-        self.checkBox_force_http.setText(_translate("Form_main", "使用HTTP替换HTTPS"))
-        self.checkBox_language.setToolTip(_translate("Form_main", "<html><head/><body><p>设置混流的音频语言(代码)，如chi, jpn等</p></body></html>"))
-        self.checkBox_language.setText(_translate("Form_main", "设置混流的音频语言代码"))
-        self.lineEdit_language.setPlaceholderText(_translate("Form_main", "如chi,jpn"))
+        self.pushButton_queue.setText(_translate("Form_main", "下载队列"))
+        self.label_profile.setText(_translate("Form_main", "方案"))
+        self.comboBox_profile.setToolTip(_translate("Form_main", "<html><head/><body><p>切换保存的下载方案</p></body></html>"))
+        self.pushButton_profile_save.setText(_translate("Form_main", "保存方案"))
+        self.pushButton_profile_delete.setText(_translate("Form_main", "删除方案"))
         self.label_bbdown.setText(_translate("Form_main", "程序位置"))
         self.lineEdit_bbdown.setToolTip(_translate("Form_main", "<html><head/><body><p>BBDown 程序位置</p></body></html>"))
         self.lineEdit_bbdown.setWhatsThis(_translate("Form_main", "<html><head/><body><p><br/></p></body></html>"))
@@ -589,18 +274,5 @@ class Ui_Form_main(object):
         self.comboBox_dfn_more.setItemText(5, _translate("Form_main", "1080P 高帧率"))
         self.comboBox_dfn_more.setItemText(6, _translate("Form_main", "1080P 高码率"))
         self.comboBox_dfn_more.setItemText(7, _translate("Form_main", "720P 高帧率"))
-        self.groupBox_12.setTitle(_translate("Form_main", "aria2c"))
-        self.checkBox_use_aria2c.setText(_translate("Form_main", "使用aria2c"))
-        self.checkBox_aria2c_path.setText(_translate("Form_main", "文件路径"))
-        self.checkBox_aria2c_proxy.setToolTip(_translate("Form_main", "<html><head/><body><p>调用aria2c进行下载时的代理地址配置</p></body></html>"))
-        self.checkBox_aria2c_proxy.setText(_translate("Form_main", "代理地址"))
-        self.lineEdit_aria2c_proxy.setToolTip(_translate("Form_main", "<html><head/><body><p>调用aria2c进行下载时的代理地址配置</p></body></html>"))
-        self.checkBox_aria2c_args.setText(_translate("Form_main", "附加参数"))
-        self.groupBox_13.setTitle(_translate("Form_main", "代理"))
-        self.checkBox_enable_proxy.setText(_translate("Form_main", "启用代理"))
-        self.checkBox_host.setText(_translate("Form_main", "代理地址"))
-        self.checkBox_ep_host.setText(_translate("Form_main", "番剧代理"))
-        self.checkBox_area.setText(_translate("Form_main", "地区指定"))
-        self.lineEdit_area.setPlaceholderText(_translate("Form_main", "如hk"))
         self.label_param.setText(_translate("Form_main", "运行参数"))
         self.pushButton_param.setText(_translate("Form_main", "生成"))
@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'output.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.9
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -14,11 +14,14 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 class Ui_Form_output(object):
     def setupUi(self, Form_output):
         Form_output.setObjectName("Form_output")
-        Form_output.resize(738, 343)
-        Form_output.setMinimumSize(QtCore.QSize(738, 343))
-        Form_output.setMaximumSize(QtCore.QSize(738, 343))
+        Form_output.resize(980, 420)
+        Form_output.setMinimumSize(QtCore.QSize(980, 420))
+        Form_output.setMaximumSize(QtCore.QSize(980, 420))
+        self.listWidget_jobs = QtWidgets.QListWidget(Form_output)
+        self.listWidget_jobs.setGeometry(QtCore.QRect(10, 10, 231, 401))
+        self.listWidget_jobs.setObjectName("listWidget_jobs")
         self.verticalLayoutWidget = QtWidgets.QWidget(Form_output)
-        self.verticalLayoutWidget.setGeometry(QtCore.QRect(10, 10, 721, 321))
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(250, 10, 721, 401))
         self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
         self.verticalLayout.setContentsMargins(0, 0, 0, 0)
@@ -34,11 +37,32 @@ class Ui_Form_output(object):
         self.pushButton_stop = QtWidgets.QPushButton(self.verticalLayoutWidget)
         self.pushButton_stop.setObjectName("pushButton_stop")
         self.horizontalLayout.addWidget(self.pushButton_stop)
+        self.pushButton_clear = QtWidgets.QPushButton(self.verticalLayoutWidget)
+        self.pushButton_clear.setObjectName("pushButton_clear")
+        self.horizontalLayout.addWidget(self.pushButton_clear)
         self.verticalLayout.addLayout(self.horizontalLayout)
-        self.textEdit_output = QtWidgets.QTextEdit(self.verticalLayoutWidget)
-        self.textEdit_output.setReadOnly(True)
-        self.textEdit_output.setObjectName("textEdit_output")
-        self.verticalLayout.addWidget(self.textEdit_output)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_stage = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_stage.setMinimumSize(QtCore.QSize(90, 0))
+        self.label_stage.setObjectName("label_stage")
+        self.horizontalLayout_2.addWidget(self.label_stage)
+        self.progressBar = QtWidgets.QProgressBar(self.verticalLayoutWidget)
+        self.progressBar.setMaximum(1000)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setObjectName("progressBar")
+        self.horizontalLayout_2.addWidget(self.progressBar)
+        self.label_speed = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_speed.setMinimumSize(QtCore.QSize(180, 0))
+        self.label_speed.setText("")
+        self.label_speed.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_speed.setObjectName("label_speed")
+        self.horizontalLayout_2.addWidget(self.label_speed)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.plainTextEdit_output = LogView(self.verticalLayoutWidget)
+        self.plainTextEdit_output.setReadOnly(True)
+        self.plainTextEdit_output.setObjectName("plainTextEdit_output")
+        self.verticalLayout.addWidget(self.plainTextEdit_output)
 
         self.retranslateUi(Form_output)
         QtCore.QMetaObject.connectSlotsByName(Form_output)
@@ -46,10 +70,10 @@ class Ui_Form_output(object):
     def retranslateUi(self, Form_output):
         _translate = QtCore.QCoreApplication.translate
         Form_output.setWindowTitle(_translate("Form_output", "下载"))
+        self.listWidget_jobs.setToolTip(_translate("Form_output", "<html><head/><body><p>选择要查看日志的下载任务</p></body></html>"))
         self.pushButton_stop.setText(_translate("Form_output", "停止"))
-        self.textEdit_output.setHtml(_translate("Form_output", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-"p, li { white-space: pre-wrap; }\n"
-"</style></head><body style=\" font-family:'Noto Sans CJK SC', 'DejaVu Sans', sans-serif; font-size:9pt; font-weight:400; font-style:normal;\">\n"
-"<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\">[输出内容]</p>\n"
-"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><br /></p></body></html>"))
+        self.pushButton_clear.setText(_translate("Form_output", "清除已结束"))
+        self.label_stage.setText(_translate("Form_output", "等待中"))
+        self.progressBar.setFormat(_translate("Form_output", "%p%"))
+        self.plainTextEdit_output.setPlaceholderText(_translate("Form_output", "[输出内容]"))
+from BBDown_GUI.Form.log_view import LogView
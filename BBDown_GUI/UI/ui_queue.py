@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'queue.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form_queue(object):
+    def setupUi(self, Form_queue):
+        Form_queue.setObjectName("Form_queue")
+        Form_queue.resize(760, 490)
+        Form_queue.setMinimumSize(QtCore.QSize(760, 490))
+        Form_queue.setMaximumSize(QtCore.QSize(760, 490))
+        self.plainTextEdit_urls = QtWidgets.QPlainTextEdit(Form_queue)
+        self.plainTextEdit_urls.setGeometry(QtCore.QRect(10, 10, 741, 111))
+        self.plainTextEdit_urls.setObjectName("plainTextEdit_urls")
+        self.horizontalLayoutWidget = QtWidgets.QWidget(Form_queue)
+        self.horizontalLayoutWidget.setGeometry(QtCore.QRect(10, 130, 741, 31))
+        self.horizontalLayoutWidget.setObjectName("horizontalLayoutWidget")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.pushButton_import = QtWidgets.QPushButton(self.horizontalLayoutWidget)
+        self.pushButton_import.setObjectName("pushButton_import")
+        self.horizontalLayout.addWidget(self.pushButton_import)
+        self.label_priority = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_priority.setObjectName("label_priority")
+        self.horizontalLayout.addWidget(self.label_priority)
+        self.spinBox_priority = QtWidgets.QSpinBox(self.horizontalLayoutWidget)
+        self.spinBox_priority.setMinimum(-99)
+        self.spinBox_priority.setMaximum(99)
+        self.spinBox_priority.setObjectName("spinBox_priority")
+        self.horizontalLayout.addWidget(self.spinBox_priority)
+        self.label_profile = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_profile.setObjectName("label_profile")
+        self.horizontalLayout.addWidget(self.label_profile)
+        self.comboBox_profile = QtWidgets.QComboBox(self.horizontalLayoutWidget)
+        self.comboBox_profile.setMinimumSize(QtCore.QSize(140, 0))
+        self.comboBox_profile.setObjectName("comboBox_profile")
+        self.horizontalLayout.addWidget(self.comboBox_profile)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.label_concurrency = QtWidgets.QLabel(self.horizontalLayoutWidget)
+        self.label_concurrency.setObjectName("label_concurrency")
+        self.horizontalLayout.addWidget(self.label_concurrency)
+        self.spinBox_concurrency = QtWidgets.QSpinBox(self.horizontalLayoutWidget)
+        self.spinBox_concurrency.setMinimum(1)
+        self.spinBox_concurrency.setMaximum(16)
+        self.spinBox_concurrency.setProperty("value", 2)
+        self.spinBox_concurrency.setObjectName("spinBox_concurrency")
+        self.horizontalLayout.addWidget(self.spinBox_concurrency)
+        self.pushButton_add = QtWidgets.QPushButton(self.horizontalLayoutWidget)
+        self.pushButton_add.setObjectName("pushButton_add")
+        self.horizontalLayout.addWidget(self.pushButton_add)
+        self.pushButton_stop_all = QtWidgets.QPushButton(self.horizontalLayoutWidget)
+        self.pushButton_stop_all.setObjectName("pushButton_stop_all")
+        self.horizontalLayout.addWidget(self.pushButton_stop_all)
+        self.horizontalLayoutWidget_2 = QtWidgets.QWidget(Form_queue)
+        self.horizontalLayoutWidget_2.setGeometry(QtCore.QRect(10, 165, 741, 25))
+        self.horizontalLayoutWidget_2.setObjectName("horizontalLayoutWidget_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget_2)
+        self.horizontalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.checkBox_skip_done = QtWidgets.QCheckBox(self.horizontalLayoutWidget_2)
+        self.checkBox_skip_done.setChecked(True)
+        self.checkBox_skip_done.setObjectName("checkBox_skip_done")
+        self.horizontalLayout_2.addWidget(self.checkBox_skip_done)
+        self.checkBox_verify_files = QtWidgets.QCheckBox(self.horizontalLayoutWidget_2)
+        self.checkBox_verify_files.setObjectName("checkBox_verify_files")
+        self.horizontalLayout_2.addWidget(self.checkBox_verify_files)
+        self.label_connections = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_connections.setObjectName("label_connections")
+        self.horizontalLayout_2.addWidget(self.label_connections)
+        self.spinBox_connections = QtWidgets.QSpinBox(self.horizontalLayoutWidget_2)
+        self.spinBox_connections.setMaximum(256)
+        self.spinBox_connections.setObjectName("spinBox_connections")
+        self.horizontalLayout_2.addWidget(self.spinBox_connections)
+        self.label_limit = QtWidgets.QLabel(self.horizontalLayoutWidget_2)
+        self.label_limit.setObjectName("label_limit")
+        self.horizontalLayout_2.addWidget(self.label_limit)
+        self.lineEdit_limit = QtWidgets.QLineEdit(self.horizontalLayoutWidget_2)
+        self.lineEdit_limit.setObjectName("lineEdit_limit")
+        self.horizontalLayout_2.addWidget(self.lineEdit_limit)
+        self.checkBox_defer_mux = QtWidgets.QCheckBox(self.horizontalLayoutWidget_2)
+        self.checkBox_defer_mux.setObjectName("checkBox_defer_mux")
+        self.horizontalLayout_2.addWidget(self.checkBox_defer_mux)
+        self.spinBox_mux_workers = QtWidgets.QSpinBox(self.horizontalLayoutWidget_2)
+        self.spinBox_mux_workers.setMinimum(1)
+        self.spinBox_mux_workers.setMaximum(16)
+        self.spinBox_mux_workers.setProperty("value", 1)
+        self.spinBox_mux_workers.setObjectName("spinBox_mux_workers")
+        self.horizontalLayout_2.addWidget(self.spinBox_mux_workers)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.checkBox_clipboard = QtWidgets.QCheckBox(self.horizontalLayoutWidget_2)
+        self.checkBox_clipboard.setObjectName("checkBox_clipboard")
+        self.horizontalLayout_2.addWidget(self.checkBox_clipboard)
+        self.horizontalLayoutWidget_3 = QtWidgets.QWidget(Form_queue)
+        self.horizontalLayoutWidget_3.setGeometry(QtCore.QRect(10, 195, 741, 25))
+        self.horizontalLayoutWidget_3.setObjectName("horizontalLayoutWidget_3")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget_3)
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_split = QtWidgets.QLabel(self.horizontalLayoutWidget_3)
+        self.label_split.setObjectName("label_split")
+        self.horizontalLayout_3.addWidget(self.label_split)
+        self.spinBox_split = QtWidgets.QSpinBox(self.horizontalLayoutWidget_3)
+        self.spinBox_split.setMaximum(999)
+        self.spinBox_split.setObjectName("spinBox_split")
+        self.horizontalLayout_3.addWidget(self.spinBox_split)
+        self.label_split_jobs = QtWidgets.QLabel(self.horizontalLayoutWidget_3)
+        self.label_split_jobs.setObjectName("label_split_jobs")
+        self.horizontalLayout_3.addWidget(self.label_split_jobs)
+        self.spinBox_split_jobs = QtWidgets.QSpinBox(self.horizontalLayoutWidget_3)
+        self.spinBox_split_jobs.setMinimum(1)
+        self.spinBox_split_jobs.setMaximum(16)
+        self.spinBox_split_jobs.setProperty("value", 2)
+        self.spinBox_split_jobs.setObjectName("spinBox_split_jobs")
+        self.horizontalLayout_3.addWidget(self.spinBox_split_jobs)
+        self.label_post = QtWidgets.QLabel(self.horizontalLayoutWidget_3)
+        self.label_post.setObjectName("label_post")
+        self.horizontalLayout_3.addWidget(self.label_post)
+        self.lineEdit_post = QtWidgets.QLineEdit(self.horizontalLayoutWidget_3)
+        self.lineEdit_post.setObjectName("lineEdit_post")
+        self.horizontalLayout_3.addWidget(self.lineEdit_post)
+        self.label_post_workers = QtWidgets.QLabel(self.horizontalLayoutWidget_3)
+        self.label_post_workers.setObjectName("label_post_workers")
+        self.horizontalLayout_3.addWidget(self.label_post_workers)
+        self.spinBox_post_workers = QtWidgets.QSpinBox(self.horizontalLayoutWidget_3)
+        self.spinBox_post_workers.setMinimum(1)
+        self.spinBox_post_workers.setMaximum(16)
+        self.spinBox_post_workers.setProperty("value", 2)
+        self.spinBox_post_workers.setObjectName("spinBox_post_workers")
+        self.horizontalLayout_3.addWidget(self.spinBox_post_workers)
+        self.tableWidget_jobs = QtWidgets.QTableWidget(Form_queue)
+        self.tableWidget_jobs.setGeometry(QtCore.QRect(10, 225, 741, 256))
+        self.tableWidget_jobs.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableWidget_jobs.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableWidget_jobs.setObjectName("tableWidget_jobs")
+        self.tableWidget_jobs.setColumnCount(4)
+        self.tableWidget_jobs.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableWidget_jobs.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableWidget_jobs.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableWidget_jobs.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableWidget_jobs.setHorizontalHeaderItem(3, item)
+        self.tableWidget_jobs.horizontalHeader().setStretchLastSection(True)
+        self.tableWidget_jobs.verticalHeader().setVisible(False)
+
+        self.retranslateUi(Form_queue)
+        QtCore.QMetaObject.connectSlotsByName(Form_queue)
+
+    def retranslateUi(self, Form_queue):
+        _translate = QtCore.QCoreApplication.translate
+        Form_queue.setWindowTitle(_translate("Form_queue", "下载队列"))
+        self.plainTextEdit_urls.setPlaceholderText(_translate("Form_queue", "每行一个视频地址 或 av bv BV ep ss"))
+        self.pushButton_import.setText(_translate("Form_queue", "从文件导入"))
+        self.label_priority.setText(_translate("Form_queue", "优先级"))
+        self.spinBox_priority.setToolTip(_translate("Form_queue", "<html><head/><body><p>数值越大越先下载</p></body></html>"))
+        self.label_profile.setText(_translate("Form_queue", "方案"))
+        self.comboBox_profile.setToolTip(_translate("Form_queue", "<html><head/><body><p>按保存的下载方案生成参数，不使用主界面当前的选项</p></body></html>"))
+        self.label_concurrency.setText(_translate("Form_queue", "同时下载数"))
+        self.spinBox_concurrency.setToolTip(_translate("Form_queue", "<html><head/><body><p>同时运行的 BBDown 进程数，按磁盘和带宽调整</p></body></html>"))
+        self.pushButton_add.setText(_translate("Form_queue", "加入队列"))
+        self.pushButton_stop_all.setToolTip(_translate("Form_queue", "<html><head/><body><p>取消排队中的任务并停止正在下载的任务</p></body></html>"))
+        self.pushButton_stop_all.setText(_translate("Form_queue", "全部停止"))
+        self.checkBox_skip_done.setToolTip(_translate("Form_queue", "<html><head/><body><p>按下载记录跳过以相同画质下载到同一目录的视频</p></body></html>"))
+        self.checkBox_skip_done.setText(_translate("Form_queue", "跳过已下载"))
+        self.checkBox_verify_files.setToolTip(_translate("Form_queue", "<html><head/><body><p>文件已被删除或移动时重新下载</p></body></html>"))
+        self.checkBox_verify_files.setText(_translate("Form_queue", "检查文件是否存在"))
+        self.label_connections.setText(_translate("Form_queue", "总连接数"))
+        self.spinBox_connections.setToolTip(_translate("Form_queue", "<html><head/><body><p>所有任务共用的 aria2c 连接数，平均分给每个下载名额（只对使用 aria2c 的任务有效）</p></body></html>"))
+        self.spinBox_connections.setSpecialValueText(_translate("Form_queue", "不限"))
+        self.label_limit.setText(_translate("Form_queue", "限速时段"))
+        self.lineEdit_limit.setToolTip(_translate("Form_queue", "<html><head/><body><p>各时段所有任务合计的下载速度，如 08:00-23:00=2M, 23:00-08:00=0（0 为不限速，只对使用 aria2c 的任务有效，任务启动时生效）</p></body></html>"))
+        self.lineEdit_limit.setPlaceholderText(_translate("Form_queue", "08:00-23:00=2M"))
+        self.checkBox_defer_mux.setToolTip(_translate("Form_queue", "<html><head/><body><p>下载时跳过混流（--skip-mux），下载完成后由混流队列按设置的进程数依次混流，使用主界面中的 ffmpeg 或 MP4Box</p></body></html>"))
+        self.checkBox_defer_mux.setText(_translate("Form_queue", "延后混流"))
+        self.spinBox_mux_workers.setToolTip(_translate("Form_queue", "<html><head/><body><p>同时运行的混流进程数</p></body></html>"))
+        self.checkBox_clipboard.setToolTip(_translate("Form_queue", "<html><head/><body><p>复制哔哩哔哩视频地址或 av bv BV ep ss 号时自动加入队列</p></body></html>"))
+        self.checkBox_clipboard.setText(_translate("Form_queue", "监视剪贴板"))
+        self.label_split.setText(_translate("Form_queue", "按分P拆分"))
+        self.spinBox_split.setToolTip(_translate("Form_queue", "<html><head/><body><p>把多分P的视频拆成多个任务并行下载，每个任务下载这么多个分P（需要先解析一次分P列表）</p></body></html>"))
+        self.spinBox_split.setSpecialValueText(_translate("Form_queue", "不拆分"))
+        self.spinBox_split.setSuffix(_translate("Form_queue", " 个/任务"))
+        self.label_split_jobs.setText(_translate("Form_queue", "每个视频同时下载"))
+        self.spinBox_split_jobs.setToolTip(_translate("Form_queue", "<html><head/><body><p>同一个视频拆分出的任务最多同时运行的个数，仍受同时下载数限制</p></body></html>"))
+        self.label_post.setText(_translate("Form_queue", "下载后处理"))
+        self.lineEdit_post.setToolTip(_translate("Form_queue", "<html><head/><body><p>下载完成后依次执行的步骤，以分号分隔：checksum [算法]、move 目录、rename 模板、thumbnail [秒]、command 命令；可以使用 {video_id} {date} {name} {ext} {file}</p></body></html>"))
+        self.lineEdit_post.setPlaceholderText(_translate("Form_queue", "checksum sha256; move D:/NAS/{video_id}"))
+        self.label_post_workers.setText(_translate("Form_queue", "处理进程数"))
+        self.spinBox_post_workers.setToolTip(_translate("Form_queue", "<html><head/><body><p>同时进行下载后处理的进程数，与同时下载数分开设置</p></body></html>"))
+        self.tableWidget_jobs.setToolTip(_translate("Form_queue", "<html><head/><body><p>双击查看下载日志</p></body></html>"))
+        item = self.tableWidget_jobs.horizontalHeaderItem(0)
+        item.setText(_translate("Form_queue", "视频地址"))
+        item = self.tableWidget_jobs.horizontalHeaderItem(1)
+        item.setText(_translate("Form_queue", "方案"))
+        item = self.tableWidget_jobs.horizontalHeaderItem(2)
+        item.setText(_translate("Form_queue", "优先级"))
+        item = self.tableWidget_jobs.horizontalHeaderItem(3)
+        item.setText(_translate("Form_queue", "状态"))
@@ -0,0 +1,295 @@
+"""无界面模式：读取图形界面保存的 config.json 和视频地址列表，直接调用 BBDown 下载
+
+不导入 PyQt，可以在没有显示器的服务器上由 cron 等调用::
+
+    python -m BBDown_GUI.cli BV1xx411c7mD ep12345
+    python -m BBDown_GUI.cli -i urls.txt -j 4
+    python -m BBDown_GUI.cli -i favlist.json -i links.csv
+"""
+import argparse
+import itertools
+import os
+import queue
+import signal
+import sqlite3
+import sys
+
+from BBDown_GUI.tool import get_workdir, get_bbdowndir, log
+from BBDown_GUI.options import BBDownOptions
+from BBDown_GUI.config import load_config
+from BBDown_GUI.profiles import ProfileStore
+from BBDown_GUI.fileindex import FileIndex, format_size, parse_query
+from BBDown_GUI.engine import Engine, JobSettings, DOWNLOADED, DUPLICATE
+from BBDown_GUI.jobqueue import FAILED
+from BBDown_GUI.importer import iter_file, iter_lines, unique
+from BBDown_GUI.journal import Journal
+from BBDown_GUI.limits import Limits, parse_windows
+from BBDown_GUI.metadata import MetadataCache, METADATA_TTL, probe, format_info, get_metadata
+from BBDown_GUI.postprocess import POST_WORKERS, get_postprocessor, parse_steps
+from BBDown_GUI.muxer import MUX_WORKERS, get_mux_queue, staging_dir
+from BBDown_GUI.supervisor import get_supervisor
+from BBDown_GUI.tempfiles import parse_aid, remove_temp
+
+
+def read_urls(path):
+    """逐行读取，不把整个文件读入内存"""
+    if path == "-":
+        return iter_lines(sys.stdin)
+    return iter_file(path)
+
+
+def show_info(urls, config, bbdown, env, refresh=False):
+    """只显示视频信息：缓存未过期时直接使用，否则以 -info 运行 BBDown 并缓存"""
+    cache = MetadataCache(ttl=0 if refresh else METADATA_TTL)
+    failed = 0
+    for url in urls:
+        try:
+            options = BBDownOptions.from_config(config, url)
+        except ValueError as e:
+            print(log(f"[BBDown_GUI] 跳过 {url}: {e}"), file=sys.stderr, flush=True)
+            failed += 1
+            continue
+        info = probe(options, bbdown, cache, env)
+        if info is None:
+            print(log(f"[BBDown_GUI] 解析失败 {url}"), file=sys.stderr, flush=True)
+            failed += 1
+            continue
+        print(f"== {url}")
+        print("\n".join(format_info(info)), flush=True)
+    return 1 if failed else 0
+
+
+def show_index(config, scan, queries):
+    """增量扫描下载目录并显示各视频占用的空间，在文件索引中查找"""
+    options = BBDownOptions.from_config(config, "", validate=False)
+    index = FileIndex()
+    missing = 0
+    if scan:
+        if not options.work_dir:
+            print(log("[BBDown_GUI] 没有设置下载目录"), file=sys.stderr, flush=True)
+            return 1
+        result = index.scan(options)
+        print(log(f"[BBDown_GUI] 扫描 {options.work_dir}：新增 {result.added}，变化 {result.changed}，"
+                  f"删除 {result.removed}，未变化 {result.unchanged}"), flush=True)
+        usage = index.usage(options.work_dir)
+        for item in usage:
+            print(f"{format_size(item.size):>12}  {item.files:>6} 个文件  {item.video_id or '（未识别）'}")
+        print(f"{format_size(sum(item.size for item in usage)):>12}  {sum(item.files for item in usage):>6} 个文件  合计",
+              flush=True)
+    for text in queries:
+        entries = index.find(**parse_query(text))
+        print(f"== {text}")
+        if not entries:
+            print("没有找到")
+            missing += 1
+        for entry in entries:
+            print(f"P{entry.part or '-'} [{entry.quality or '未知画质'}] [{entry.codec or '未知编码'}] "
+                  f"{format_size(entry.size)} {entry.path}")
+        sys.stdout.flush()
+    return 1 if missing else 0
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+class Console:
+    """命令行的任务引擎前端：状态和日志输出到标准输出，各线程的回调交给主线程依次处理"""
+    def __init__(self, bbdown, env, quiet=False):
+        self.bbdown = bbdown
+        self.env = env
+        self.quiet = quiet
+        self.engine = None
+        self.events = queue.Queue()
+        # 任务的 aid（来自 BBDown 输出），停止时清理临时文件
+        self.aids = {}
+
+    def launch(self, job, options, record):
+        get_supervisor().spawn(
+            [self.bbdown] + options.to_argv(),
+            lambda line, job=job: self.deliver(self.output, job, line),
+            lambda returncode, job=job: self.deliver(self.engine.finished, job, returncode),
+            env=self.env,
+        )
+
+    def output(self, job, line):
+        if job.id not in self.aids:
+            aid = parse_aid(line)
+            if aid is not None:
+                self.aids[job.id] = aid
+        self.engine.output(job, [line])
+        # 进度条刷新（以 \r 结尾）和空行不写入日志
+        if not self.quiet and not line.endswith("\r") and line.strip():
+            print(f"[{job.id}] {line.rstrip()}", flush=True)
+
+    def probe(self, job):
+        """解析分P 列表（阻塞），结果写入缓存"""
+        self.show_status(job, "解析分P")
+        probe(job.options, self.bbdown, get_metadata(), self.env)
+        self.deliver(self.engine.probe_finished, job, 0)
+
+    def show_status(self, job, text):
+        print(log(f"[{job.id}] {text} {job.url}"), flush=True)
+
+    def write_log(self, job, text):
+        if not self.quiet:
+            print(log(f"[{job.id}] {text}"), flush=True)
+
+    def deliver(self, callback, *args):
+        self.events.put((callback, args))
+
+    def release(self, job):
+        self.aids.pop(job.id, None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="bbdown_gui_cli", description="按图形界面保存的参数批量下载，无需图形界面")
+    parser.add_argument("urls", nargs="*", help="视频地址 或 av bv BV ep ss")
+    parser.add_argument("-i", "--input", action="append", default=[], help="地址列表文件（txt 每行一个，或 csv、json），- 表示标准输入")
+    parser.add_argument("-c", "--config", default=os.path.join(get_workdir(), "config.json"), help="参数文件，默认使用图形界面保存的 config.json")
+    parser.add_argument("-p", "--profile", help="使用图形界面保存的下载方案，代替 --config")
+    parser.add_argument("-j", "--jobs", type=int, default=2, help="同时下载数（默认 2）")
+    parser.add_argument("--connections", type=int, default=0, help="所有任务合计的 aria2c 连接数（默认不限）")
+    parser.add_argument("--limit", default="", help="限速时段，如 08:00-23:00=2M,23:00-08:00=0（只对使用 aria2c 的任务有效）")
+    parser.add_argument("--split", type=int, default=0, metavar="N", help="把多分P 的视频拆成每 N 个分P 一个任务并行下载（默认不拆分）")
+    parser.add_argument("--split-jobs", type=int, default=2, metavar="M", help="同一个视频拆分出的任务最多同时下载 M 个（默认 2）")
+    parser.add_argument("--post", default="", help="下载完成后依次执行的处理步骤，如 \"checksum sha256; move /mnt/nas/{video_id}\"")
+    parser.add_argument("--post-workers", type=int, default=POST_WORKERS, help=f"同时进行后处理的进程数（默认 {POST_WORKERS}）")
+    parser.add_argument("--defer-mux", action="store_true", help="下载时跳过混流，下载完成后由混流队列依次混流")
+    parser.add_argument("--mux-workers", type=int, default=MUX_WORKERS, help=f"同时运行的混流进程数（默认 {MUX_WORKERS}）")
+    parser.add_argument("--journal", default=os.path.join(get_workdir(), "cli.journal"),
+                        help="队列日志，中断后再次运行时继续未完成的任务（同时运行多个实例时各自指定不同的文件）")
+    parser.add_argument("--bbdown", default=get_bbdowndir(), help="BBDown 程序位置")
+    parser.add_argument("-q", "--quiet", action="store_true", help="只输出任务状态，不输出 BBDown 日志")
+    parser.add_argument("--redownload", action="store_true", help="不按下载记录跳过已下载的视频")
+    parser.add_argument("--verify-files", action="store_true", help="只在下载记录中的文件仍然存在时跳过")
+    parser.add_argument("--info", action="store_true", help="只显示分P 和可用的音视频流，不下载（结果缓存在 metadata.db 中）")
+    parser.add_argument("--refresh-info", action="store_true", help="与 --info 一起使用，不使用缓存")
+    parser.add_argument("--scan", action="store_true", help="增量扫描下载目录，更新文件索引（files.db）并显示各视频占用的空间")
+    parser.add_argument("--find", action="append", default=[], metavar="QUERY",
+                        help="在文件索引中查找，如 \"BV1xx411c7mD P12 HEVC\"")
+    args = parser.parse_args(argv)
+    try:
+        limits = Limits(max(0, args.connections), parse_windows(args.limit))
+        post_steps = parse_steps(args.post)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # 中断（Ctrl+C、kill）或崩溃后再次运行时，先继续队列日志中未完成的任务
+    journal = Journal(args.journal)
+    try:
+        pending = [] if args.scan or args.find or args.info else journal.recover()
+    except OSError as e:
+        parser.error(f"无法读取队列日志: {e}")
+    if not args.urls and not args.input and not args.scan and not args.find and not pending:
+        parser.error("没有需要下载的视频地址")
+    # 规范化后去重，同一视频的不同写法只下载一次
+    urls = unique(itertools.chain(iter_lines(args.urls), *map(read_urls, args.input)))
+
+    if args.profile:
+        config = ProfileStore().get(args.profile)
+        if config is None:
+            parser.error(f"没有名为 {args.profile} 的下载方案")
+    else:
+        config, _ = load_config(args.config)
+    env = os.environ.copy()
+    env["LANG"] = "C.UTF-8"
+    if args.scan or args.find:
+        try:
+            return show_index(config, args.scan, args.find)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.info:
+        try:
+            return show_info(urls, config, args.bbdown, env, args.refresh_info)
+        except (OSError, ValueError) as e:
+            parser.error(f"无法读取地址列表: {e}")
+    front = Console(args.bbdown, env, args.quiet)
+    engine = front.engine = Engine(front, max(1, args.jobs), journal)
+    engine.limits = limits
+    engine.post_steps = post_steps
+    # 后处理和混流在各自的进程池、混流队列中与下载同时进行
+    get_postprocessor().set_workers(max(1, args.post_workers))
+    get_mux_queue().set_workers(max(1, args.mux_workers))
+    settings = JobSettings(not args.redownload, args.verify_files, chunk=max(0, args.split),
+                           chunk_limit=max(1, args.split_jobs), defer_mux=args.defer_mux)
+    try:
+        for entry in pending:
+            try:
+                job = engine.add_entry(entry, settings._replace(skip_done=True))
+            except ValueError as e:
+                print(log(f"[BBDown_GUI] 跳过 {e}"), file=sys.stderr, flush=True)
+                continue
+            except (OSError, sqlite3.Error) as e:
+                print(log(f"[BBDown_GUI] 无法加入 {entry.options.get('url')}: {e}"), file=sys.stderr, flush=True)
+                continue
+            if job not in (DOWNLOADED, DUPLICATE):
+                print(log(f"[BBDown_GUI] 继续上次未完成的任务 {job.url}"), flush=True)
+        for url in urls:
+            try:
+                options = BBDownOptions.from_config(config, url)
+            except ValueError as e:
+                print(log(f"[BBDown_GUI] 跳过 {url}: {e}"), file=sys.stderr, flush=True)
+                continue
+            try:
+                job = engine.add(options, settings, profile=args.profile)
+            except (OSError, sqlite3.Error) as e:
+                # 读取下载记录、写入队列日志出错时只跳过这个地址
+                print(log(f"[BBDown_GUI] 无法加入 {url}: {e}"), file=sys.stderr, flush=True)
+                continue
+            if job == DOWNLOADED:
+                print(log(f"[BBDown_GUI] 跳过已下载 {url}"), flush=True)
+            elif job == DUPLICATE:
+                print(log(f"[BBDown_GUI] 跳过重复任务 {url}"), flush=True)
+    except (OSError, ValueError) as e:
+        # 文件不存在、编码或 CSV 格式错误
+        parser.error(f"无法读取地址列表: {e}")
+    journal.flush()
+
+    # 被 kill 时与 Ctrl+C 一样停止所有下载（子进程在单独的进程组中，不会一起收到信号）
+    if sys.platform != "win32":
+        signal.signal(signal.SIGTERM, _interrupt)
+    # 回调在 Supervisor 线程、进程池的线程中执行，这里在主线程按顺序处理
+    try:
+        # 启动第一批下载时按下 Ctrl+C 也同样停止已启动的下载
+        engine.schedule()
+        while engine.queue.running or engine.busy:
+            callback, values = front.events.get()
+            callback(*values)
+    except KeyboardInterrupt:
+        print(log("[BBDown_GUI] 正在停止下载"), flush=True)
+        get_supervisor().shutdown()
+        get_postprocessor().shutdown()
+        # 进程全部结束后清理被停止任务自己的临时文件（以 aid 命名的文件夹）
+        stopped = {}
+        for job in engine.queue.running:
+            aid = front.aids.get(job.id)
+            owner = job.parent or job
+            # BBDown 的临时文件夹在任务的暂存目录中
+            work_dir = job.options.work_dir if job.options.only_show_info else staging_dir(owner.options, owner.key)
+            if work_dir and aid and job.started:
+                key = (work_dir, aid)
+                stopped[key] = min(job.started, stopped.get(key, job.started))
+        for (work_dir, aid), since in stopped.items():
+            remove_temp(work_dir, aid, since)
+        # 队列日志中没有结束记录的任务在下次运行时继续
+        journal.close()
+        print(log("[BBDown_GUI] 下载已停止，再次运行时继续未完成的任务"), flush=True)
+        return 130
+
+    get_postprocessor().shutdown()
+    journal.close()
+    failed = [job for job in engine.queue.jobs if job.status == FAILED]
+    message = f"[BBDown_GUI] 共 {len(engine.queue.jobs)} 个任务，失败 {len(failed)} 个"
+    if engine.mux_failures:
+        message += f"，混流失败 {engine.mux_failures} 个"
+    if engine.post_failures:
+        message += f"，后处理失败 {engine.post_failures} 个"
+    if engine.move_failures:
+        message += f"，移动文件失败 {engine.move_failures} 个"
+    print(log(message), flush=True)
+    return 1 if failed or engine.mux_failures or engine.post_failures or engine.move_failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""config.json 的读写
+
+SCHEMA 列出需要保存的控件及其取值类型，界面按控件名直接读写，不再遍历 dir() 和 exec。
+文件带有 version 字段，旧版本的文件在读取时依次经过 MIGRATIONS 升级。
+"""
+import json
+import os
+import threading
+
+from BBDown_GUI.options import default_config
+
+CONFIG_VERSION = 2
+
+# 控件名 -> 取值类型：bool 为复选框/单选框，str 为输入框，int 为下拉框
+SCHEMA = {}
+for _name in (
+    "radioButton_dfn_priority", "radioButton_dfn_1080P", "radioButton_dfn_720P",
+    "radioButton_dfn_480P", "radioButton_dfn_360P", "radioButton_dfn_more",
+    "radioButton_p_current", "radioButton_p_all", "radioButton_p_new",
+    "checkBox_ffmpeg", "checkBox_audio_only", "checkBox_video_only", "checkBox_sub_only",
+    "checkBox_danmaku", "checkBox_ia", "checkBox_info", "checkBox_hs", "checkBox_debug",
+    "checkBox_token", "checkBox_c", "checkBox_skip_subtitle", "checkBox_skip_cover",
+    "checkBox_skip_mux", "checkBox_skip_ai", "checkBox_mp4box", "checkBox_mp4box_path",
+    "checkBox_mt", "checkBox_force_http", "checkBox_language", "checkBox_p_show_all",
+    "checkBox_p", "checkBox_p_delay", "checkBox_use_aria2c", "checkBox_aria2c_path",
+    "checkBox_aria2c_proxy", "checkBox_aria2c_args", "checkBox_F", "checkBox_M",
+    "checkBox_enable_proxy", "checkBox_host", "checkBox_ep_host", "checkBox_area",
+):
+    SCHEMA[_name] = bool
+for _name in (
+    "lineEdit_url", "lineEdit_ffmpeg", "lineEdit_dir", "lineEdit_bbdown",
+    "lineEdit_token", "lineEdit_c", "lineEdit_mp4box_path", "lineEdit_language",
+    "lineEdit_p", "lineEdit_p_delay", "lineEdit_aria2c_path", "lineEdit_aria2c_proxy",
+    "lineEdit_aria2c_args", "lineEdit_F", "lineEdit_M", "lineEdit_host",
+    "lineEdit_ep_host", "lineEdit_area",
+):
+    SCHEMA[_name] = str
+for _name in ("comboBox_dfn_more", "comboBox_source", "comboBox_encoding"):
+    SCHEMA[_name] = int
+del _name
+
+
+def _migrate_1(config):
+    # 1.x 没有 version 字段，会把只读的参数预览框 lineEdit_param 一起保存
+    config.pop("lineEdit_param", None)
+    return config
+
+
+# 版本号 -> 升级到下一版本的函数
+MIGRATIONS = {
+    1: _migrate_1,
+}
+
+
+def upgrade(data):
+    """把保存的选项升级到当前版本，返回完整的选项（缺少或类型不符的项取初始值）"""
+    data = dict(data)
+    version = data.pop("version", 1)
+    while version < CONFIG_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+    config = default_config()
+    for key, value in data.items():
+        if key == "advanced":
+            config[key] = bool(value)
+        # bool 是 int 的子类，这里要求类型完全一致
+        elif type(value) is SCHEMA.get(key):
+            config[key] = value
+    return config
+
+
+def load_config(path):
+    """读取 config.json，返回完整的选项和文件中的原始数据"""
+    if not os.path.exists(path):
+        return default_config(), None
+    with open(path, "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    return upgrade(saved), saved
+
+
+def save_config(path, config):
+    """原子写入：先写同目录下的临时文件再替换，中途退出不会留下不完整的 config.json"""
+    import tempfile
+    data = {"version": CONFIG_VERSION}
+    data.update(config)
+    fd, tmp = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return data
+
+
+class ConfigWriter:
+    """在后台线程写入 config.json，只保留最新一份待写内容，与上次写入相同时跳过"""
+    def __init__(self, path, saved=None):
+        self.path = path
+        self._saved = saved
+        self._pending = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def save(self, config):
+        with self._cond:
+            self._pending = dict(config)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="BBDown_GUI-config", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self, timeout=None):
+        """等待待写内容写完，退出程序前调用"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending is None, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None)
+                config = self._pending
+            data = {"version": CONFIG_VERSION}
+            data.update(config)
+            if data != self._saved:
+                try:
+                    self._saved = save_config(self.path, config)
+                except OSError:
+                    pass
+            with self._cond:
+                # 写入期间有新的内容时继续写，否则通知 flush
+                if self._pending is config:
+                    self._pending = None
+                    self._cond.notify_all()
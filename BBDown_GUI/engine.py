@@ -0,0 +1,328 @@
+"""下载队列的任务引擎：图形界面的下载队列和无界面模式共用，不导入 PyQt
+
+负责拆分分P、分配连接数和限速、暂存目录、队列日志、下载记录、混流和后处理，
+启动进程和显示状态由前端（front）完成。front 需要提供：
+    launch(job, options, record)   以 options 启动 BBDown；record 为写入下载记录、清理临时文件所用的参数。
+                                   输出交给 Engine.output，结束后调用 Engine.finished
+    probe(job)                     以 -info 解析分P 列表并写入 get_metadata()，结束后调用 Engine.probe_finished
+    show_status(job, text)         任务（拆分的任务为原任务）的状态有变化
+    write_log(job, text)           混流、后处理的输出
+    deliver(callback, *args)       在前端的线程中调用 callback（混流、后处理在其他线程结束）
+    release(job)                   任务（包括子任务）和它的混流、后处理都已结束，前端不再需要保留它的进程和日志
+除 deliver 外，Engine 和 front 的方法都只在同一个线程（界面线程、命令行的主线程）调用。
+"""
+import sqlite3
+import time
+from typing import NamedTuple
+
+from BBDown_GUI.jobqueue import Job, JobQueue, STATUS_TEXT, DONE, FAILED, STOPPED, EXPRESS_SLOTS
+from BBDown_GUI.limits import Limits
+from BBDown_GUI.options import BBDownOptions
+from BBDown_GUI.history import get_history, find_outputs
+from BBDown_GUI.journal import get_journal, remaining_pages
+from BBDown_GUI.metadata import get_metadata
+from BBDown_GUI.parts import can_split, split_options, expand_pages
+from BBDown_GUI.postprocess import get_postprocessor, make_task
+from BBDown_GUI.fileindex import add_track
+from BBDown_GUI.muxer import get_mux_queue, find_tracks, mux_tool, muxed_files, staging_dir, staged_options, publish
+from BBDown_GUI.progress import ProgressParser, PROGRESS, MUX, TRACK
+
+# Engine.add 没有加入任务时的返回值
+DOWNLOADED = "downloaded"
+DUPLICATE = "duplicate"
+
+
+class JobSettings(NamedTuple):
+    """同一次加入的任务共用的设置"""
+    # 按下载记录跳过已下载的视频，verify_files 时只在文件仍然存在时跳过
+    skip_done: bool = True
+    verify_files: bool = False
+    # 可以使用 EXPRESS_SLOTS 中的名额
+    express: bool = False
+    # 按分P 拆分：每个子任务的分P 数（0 为不拆分）和同时运行的子任务数上限
+    chunk: int = 0
+    chunk_limit: int = 1
+    defer_mux: bool = False
+
+
+class Engine:
+    def __init__(self, front, concurrency=2, journal=None):
+        self.front = front
+        self.queue = JobQueue(concurrency)
+        self.limits = Limits()
+        # 后处理步骤在任务下载完成时读取，已经开始处理的任务不变
+        self.post_steps = ()
+        self.journal = journal or get_journal()
+        self.parsers = {}
+        # 正在混流或后处理的任务
+        self.busy = set()
+        self.mux_failures = 0
+        self.move_failures = 0
+        self.post_failures = 0
+
+    def add(self, options, settings, priority=0, profile=None, batch=None, key=None, parts=frozenset()):
+        """加入任务，返回加入的任务；已下载过时返回 DOWNLOADED，重复时返回 DUPLICATE
+
+        key、parts 为队列日志中已有的任务和它已下载完成的分P。
+        """
+        # 下载记录中已有的任务不再启动 BBDown
+        if settings.skip_done and get_history().find(options, settings.verify_files) is not None:
+            if key is not None:
+                self.journal.end(key, DONE)
+            return DOWNLOADED
+        # 先写入队列日志，写入失败时任务不会留在队列中
+        key = key or self.journal.add(options, priority, profile)
+        job = Job(options, priority, profile)
+        job.key = key
+        job.express = settings.express
+        job.chunk = settings.chunk
+        job.chunk_limit = settings.chunk_limit
+        job.done_parts = parts
+        # 自己勾选了跳过混流的任务不再混流
+        job.defer_mux = settings.defer_mux and not options.skip_mux and not options.only_show_info
+        if self.queue.add(job, batch) is None:
+            self.journal.end(key, STOPPED)
+            return DUPLICATE
+        return job
+
+    def add_entry(self, entry, settings, batch=None):
+        """恢复队列日志中未完成的任务（JournalEntry），启动时跳过已下载完成的分P；参数有误时抛出 ValueError"""
+        try:
+            options = BBDownOptions.from_dict(entry.options)
+        except (ValueError, TypeError) as e:
+            self.journal.end(entry.key, FAILED)
+            raise ValueError(f"{entry.options.get('url')}: {e}") from None
+        return self.add(options, settings, entry.priority, entry.profile, batch, entry.key, entry.parts)
+
+    # 有空闲名额就启动下一个任务
+    def schedule(self):
+        while True:
+            job = self.queue.take()
+            if job is None:
+                break
+            self.start(job)
+
+    def start(self, job):
+        try:
+            self._start(job)
+        except (OSError, sqlite3.Error) as e:
+            # 无法创建暂存目录、读取缓存出错等，只有这个任务失败
+            self.fail(job, e)
+
+    def _start(self, job):
+        if job.chunk and job.parent is None and can_split(job.options):
+            info = get_metadata().get(job.options)
+            # 还没有分P 列表时先解析一次，占用任务自己的名额
+            if info is None and job.started is None:
+                job.started = time.time()
+                self.front.probe(job)
+                return
+            chunks = split_options(job.options, info, job.chunk, job.done_parts)
+            if chunks == []:
+                # 分P 都已下载完成（恢复的任务），暂存目录中已有的文件照常移到下载目录
+                self.queue.finish(job, 0)
+                self.finish(job)
+                return
+            if chunks is not None:
+                self.queue.split(job, chunks)
+                self.front.show_status(job, self.status_text(job))
+                return
+        pages = job.options.pages
+        if job.parent is None and job.done_parts:
+            # 恢复的任务跳过已下载完成的分P；ALL、LAST 和不加 -p 按分P 总数展开
+            count = None
+            if can_split(job.options) and expand_pages(pages) is None:
+                info = get_metadata().get(job.options)
+                # 还没有分P 列表时先解析一次，解析失败时按原参数下载
+                if info is None and job.started is None:
+                    job.started = time.time()
+                    self.front.probe(job)
+                    return
+                count = info.page_count if info is not None else None
+            pages = remaining_pages(pages, job.done_parts, count)
+            if pages is None:
+                self.queue.finish(job, 0)
+                self.finish(job)
+                return
+        owner = job.parent or job
+        # 按下载名额平分总连接数和当前时段的限速
+        options = self.limits.apply(job.options._replace(pages=pages), self.queue.concurrency + EXPRESS_SLOTS)
+        record = job.options
+        if not job.options.only_show_info:
+            # 下载到任务自己的暂存目录（拆分的子任务共用原任务的目录），完成（混流）后再移到下载目录，
+            # 同一下载目录中同时下载的任务不会找到彼此的文件
+            options = staged_options(options, owner.options, owner.key, owner.defer_mux)
+            record = staged_options(job.options, owner.options, owner.key, owner.defer_mux)
+        job.started = job.started or time.time()
+        self.parsers[job.id] = ProgressParser()
+        self.front.launch(job, options, record)
+        # 拆分的任务在拆分时已经显示为下载中
+        if job.parent is None:
+            self.front.show_status(job, self.status_text(job))
+
+    def fail(self, job, error):
+        self.parsers.pop(job.id, None)
+        finished = self.queue.finish(job, -1)
+        owner = job.parent or job
+        self.front.write_log(owner, f"[BBDown_GUI] 无法启动 {job.url}: {error}")
+        if job.parent is not None:
+            self.front.release(job)
+        self.finish(finished)
+        self.front.show_status(owner, f"{self.status_text(owner)}（{error}）")
+
+    # 解析失败时不拆分，整个任务由一个 BBDown 下载
+    def probe_finished(self, job, returncode, stopped=False):
+        if stopped:
+            self.finish(self.queue.finish(job, returncode, True))
+        else:
+            self.start(job)
+        self.schedule()
+
+    def output(self, job, lines):
+        """解析任务的一批输出，返回原任务的进度文本，没有新的进度时返回 None"""
+        parser = self.parsers[job.id]
+        # 子任务的进度显示在原任务上
+        owner = job.parent or job
+        event = None
+        for line in lines:
+            part = parser.part
+            current = parser.feed(line)
+            if current is not None:
+                event = current
+                if current.kind == TRACK:
+                    # 各分P 选择的视频流，写入下载记录时用于记录文件的画质和编码
+                    add_track(owner.streams, parser.part, *current.value)
+            # 开始下一个分P 时上一个分P 已完成，记入日志，重启后不再下载
+            if part is not None and parser.part != part:
+                self.journal.part_done(job.key, part)
+                self.journal.flush()
+        if event is None:
+            return None
+        text = self.status_text(owner)
+        if parser.part is not None:
+            text += f" P{parser.part}"
+        if event.kind == PROGRESS:
+            text += f" {event.value[0]:.1f}%"
+        elif event.kind == MUX:
+            text += " 混流中"
+        return text
+
+    def finished(self, job, returncode, stopped=False):
+        self.parsers.pop(job.id, None)
+        finished = self.queue.finish(job, returncode, stopped)
+        if job.parent is not None:
+            if job.status == DONE:
+                # 子任务的分P 全部完成，重启后不再下载
+                for part in expand_pages(job.options.pages):
+                    self.journal.part_done(job.key, part)
+            if finished is None:
+                self.front.show_status(job.parent, self.status_text(job.parent))
+            self.front.release(job)
+        self.finish(finished)
+        self.schedule()
+
+    # 任务（拆分的任务在子任务全部结束后）结束：记入队列日志，混流后移到下载目录，写入下载记录，开始后处理
+    def finish(self, job):
+        if job is not None:
+            self.end(job)
+            staging = staging_dir(job.options, job.key)
+            if job.status == DONE:
+                # 暂存目录中的文件都属于这个任务
+                self.mux(job, [] if job.options.only_show_info else find_outputs(staging, 0))
+            else:
+                if find_outputs(staging, 0):
+                    # 重启后继续的任务（队列日志的 key 相同）接着使用这些文件
+                    self.front.write_log(job, f"[BBDown_GUI] 未完成的文件保留在 {staging}")
+                else:
+                    publish(job.options, [], job.key)
+                self.front.release(job)
+        self.journal.flush()
+
+    def record(self, job, files):
+        try:
+            get_history().add(job.options, files, streams=job.streams)
+        except (OSError, sqlite3.Error) as e:
+            # 文件已经下载完成，只是下次不能按下载记录跳过
+            self.front.write_log(job, f"[BBDown_GUI] 无法写入下载记录: {e}")
+
+    def end(self, job):
+        self.journal.end(job.key, job.status)
+        self.front.show_status(job, self.status_text(job))
+
+    # 延后混流的任务交给混流队列，不占用下载名额
+    def mux(self, job, files):
+        tasks = find_tracks(files) if job.defer_mux else []
+        if not tasks:
+            self.mux_finished(job, files, [])
+            return
+        self.busy.add(job)
+        self.front.show_status(job, "等待混流")
+        get_mux_queue().submit(tasks, mux_tool(job.options),
+                               lambda results, job=job: self.front.deliver(self.mux_finished, job, files, results))
+
+    def mux_finished(self, job, files, results):
+        self.busy.discard(job)
+        for result in results:
+            text = "完成" if result.returncode == 0 else f"失败（{result.returncode}）"
+            self.front.write_log(job, f"[混流] {text} {result.task.output}")
+            for line in result.lines:
+                self.front.write_log(job, f"[混流] {line}")
+        try:
+            files = publish(job.options, muxed_files(files, results), job.key)
+        except OSError as e:
+            self.move_failures += 1
+            self.front.write_log(job, f"[BBDown_GUI] 无法移到下载目录: {e}")
+            self.front.show_status(job, f"{self.status_text(job)}（移动文件失败）")
+            self.front.release(job)
+            return
+        self.record(job, files)
+        if any(result.returncode != 0 for result in results):
+            # 混流失败的轨道原样移到下载目录，不再进行后处理
+            self.mux_failures += 1
+            self.front.show_status(job, f"{self.status_text(job)}（混流失败）")
+            self.front.release(job)
+            return
+        if results:
+            self.front.show_status(job, self.status_text(job))
+        self.post(job, files)
+
+    # 在后处理进程池中处理下载得到的文件，不占用下载名额
+    def post(self, job, files):
+        if not self.post_steps or not files:
+            self.front.release(job)
+            return
+        self.busy.add(job)
+        self.front.show_status(job, "后处理中")
+        # 处理很快结束时回调可能在 submit 中直接调用
+        task = make_task(job.options, files, self.post_steps)
+        get_postprocessor().submit(task, lambda result, job=job: self.front.deliver(self.post_finished, job, result))
+
+    def post_finished(self, job, result):
+        self.busy.discard(job)
+        for line in result.lines:
+            self.front.write_log(job, f"[后处理] {line}")
+        if result.error:
+            self.post_failures += 1
+            self.front.write_log(job, f"[后处理] 失败 {result.error}")
+            self.front.show_status(job, f"{self.status_text(job)}（后处理失败）")
+        else:
+            # 文件移动或重命名后更新下载记录，检查文件是否存在时不会重新下载
+            self.record(job, result.files)
+            self.front.show_status(job, self.status_text(job))
+        self.front.release(job)
+
+    def stop(self):
+        """取消排队中的任务，返回正在运行的任务，由调用方停止后照常 finished"""
+        for job in self.queue.stop():
+            self.end(job)
+            self.front.release(job)
+        self.journal.flush()
+        return list(self.queue.running)
+
+    @staticmethod
+    def status_text(job):
+        text = STATUS_TEXT[job.status]
+        if job.children:
+            done = sum(1 for child in job.children if child.status == DONE)
+            text += f" {done}/{len(job.children)}"
+        return text
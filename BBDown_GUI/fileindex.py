@@ -0,0 +1,395 @@
+"""下载目录的文件索引：每个输出文件属于哪个视频、哪个分P、什么画质和编码，保存在 files.db 中
+
+下载完成时按 BBDown 的输出（"已选择的流"）和 -F / -M 文件名模板记录文件；
+scan() 增量扫描下载目录，只重新解析大小或修改时间变化的文件，几十万个文件也只需要 stat 一遍。
+查询"是否已有 BVxxx 的 P12 HEVC"只是一次索引查询，加入任务前的跳过判断和占用空间统计共用这个索引。
+"""
+import os
+import re
+import time
+from typing import NamedTuple
+
+from BBDown_GUI.history import history_key
+from BBDown_GUI.ids import video_id
+from BBDown_GUI.parts import expand_pages
+from BBDown_GUI.tool import get_workdir
+
+# BBDown 不加 -F / -M 时的文件名模板
+FILE_PATTERN = "<videoTitle>"
+MULTI_FILE_PATTERN = "<videoTitle>/[P<pageNumberWithZero>]<pageTitle>"
+
+# 文件类型
+VIDEO = "video"
+AUDIO = "audio"
+SUBTITLE = "subtitle"
+DANMAKU = "danmaku"
+COVER = "cover"
+
+KINDS = {
+    ".mp4": VIDEO, ".mkv": VIDEO, ".flv": VIDEO,
+    ".m4a": AUDIO, ".aac": AUDIO, ".mp3": AUDIO, ".flac": AUDIO,
+    ".srt": SUBTITLE, ".ass": SUBTITLE,
+    ".xml": DANMAKU,
+    ".jpg": COVER, ".png": COVER,
+}
+
+# 文件的来源：下载完成时记录（归属来自任务参数和 BBDown 输出），或扫描时按文件名解析
+DOWNLOAD = "download"
+NAME = "name"
+
+# 文件名模板中的字段 -> (分组名, 正则)；其他字段匹配任意不含 / 的文本
+_fields = {
+    "pageNumber": ("page", r"\d+"),
+    "pageNumberWithZero": ("page", r"\d+"),
+    "bvid": ("bvid", r"BV[0-9A-Za-z]{10}"),
+    "aid": ("aid", r"\d+"),
+    "dfn": ("dfn", r"[^/]+?"),
+    "videoCodecs": ("codec", r"AVC|HEVC|AV1"),
+}
+_re_field = re.compile(r"<(\w+)>")
+# "已选择的流" 中的视频流，如 [1080P 高清] [1920x1080] [HEVC] [30.000] [2345 kbps] [~34.56 MB]
+_re_stream_field = re.compile(r"\[([^\]]*)\]")
+_re_codec = re.compile(r"^(AVC|HEVC|AV1)$", re.I)
+_re_part = re.compile(r"^P(\d+)$", re.I)
+
+
+class Attribution(NamedTuple):
+    video_id: str = ""
+    # 分P 序号，0 为未知（单P 视频的文件名模板不含分P）
+    part: int = 0
+    quality: str = ""
+    codec: str = ""
+
+
+class FileEntry(NamedTuple):
+    path: str
+    size: int
+    video_id: str
+    part: int
+    quality: str
+    codec: str
+    kind: str
+
+
+class ScanResult(NamedTuple):
+    added: int
+    changed: int
+    removed: int
+    unchanged: int
+
+
+class Usage(NamedTuple):
+    video_id: str
+    files: int
+    size: int
+
+
+def compile_pattern(pattern):
+    """把 -F / -M 文件名模板转成匹配相对路径（不含扩展名）的正则"""
+    parts = []
+    used = set()
+    pos = 0
+    for m in _re_field.finditer(pattern):
+        parts.append(re.escape(pattern[pos:m.start()]))
+        name, regex = _fields.get(m.group(1), (None, r"[^/]*?"))
+        if name is not None and name not in used:
+            used.add(name)
+            parts.append(f"(?P<{name}>{regex})")
+        else:
+            parts.append(f"(?:{regex})")
+        pos = m.end()
+    parts.append(re.escape(pattern[pos:]))
+    return re.compile("".join(parts))
+
+
+def compile_patterns(options):
+    """多P 模板在前（更具体），单P 模板在后"""
+    return [compile_pattern(p.replace("\\", "/"))
+            for p in (options.multi_file_pattern or MULTI_FILE_PATTERN, options.file_pattern or FILE_PATTERN)]
+
+
+def parse_name(rel, patterns):
+    """按文件名模板解析相对路径，字幕等文件名可能多一段后缀（如 .zh-Hans.srt）"""
+    stem = os.path.splitext(rel.replace(os.sep, "/"))[0]
+    candidates = [stem]
+    base, dot, suffix = stem.rpartition(".")
+    if dot and "/" not in suffix:
+        candidates.append(base)
+    for regex in patterns:
+        for text in candidates:
+            m = regex.fullmatch(text)
+            if m is None:
+                continue
+            groups = m.groupdict()
+            vid = groups.get("bvid") or (f"av{groups['aid']}" if groups.get("aid") else "")
+            return Attribution(vid, int(groups.get("page") or 0), groups.get("dfn") or "",
+                               (groups.get("codec") or "").upper())
+    return Attribution()
+
+
+def add_track(streams, part, kind, text):
+    """把 BBDown "已选择的流" 中的视频流记入 streams {分P: (画质, 编码)}"""
+    if kind != "视频":
+        return
+    fields = _re_stream_field.findall(text)
+    if fields:
+        streams[part or 0] = (fields[0], next((f.upper() for f in fields if _re_codec.match(f)), ""))
+
+
+def _stream(streams, part):
+    """文件所属分P 的视频流；分P 未知时只在各分P 的流都相同时使用"""
+    if part in streams:
+        return streams[part]
+    values = set(streams.values())
+    return values.pop() if len(values) == 1 else ("", "")
+
+
+def _root(work_dir):
+    return os.path.normcase(os.path.abspath(work_dir)) if work_dir else ""
+
+
+def _relative(path, root):
+    """文件在下载目录中的相对路径，不在下载目录中时返回 None"""
+    if not root:
+        return None
+    try:
+        rel = os.path.relpath(path, root)
+    except ValueError:
+        # Windows 上不在同一个盘
+        return None
+    return None if rel.startswith(os.pardir) else rel
+
+
+def parse_query(text):
+    """ "BV1xx411c7mD P12 HEVC 1080P" -> {video_id, part, codec, quality}，无法识别的词返回 ValueError"""
+    query = {}
+    for word in text.split():
+        m = _re_part.match(word)
+        if m:
+            query["part"] = int(m.group(1))
+        elif _re_codec.match(word):
+            query["codec"] = word.upper()
+        elif video_id(word):
+            query["video_id"] = video_id(word)
+        elif word[0].isdigit():
+            query["quality"] = word
+        else:
+            raise ValueError(f"无法识别的查询条件: {word}")
+    if "video_id" not in query:
+        raise ValueError("查询需要视频 ID")
+    return query
+
+
+def format_size(size):
+    """字节数 -> 便于阅读的文本"""
+    if size < 1024:
+        return f"{size} B"
+    for unit in ("KB", "MB", "GB", "TB"):
+        size /= 1024
+        if size < 1024 or unit == "TB":
+            return f"{size:.2f} {unit}"
+
+
+def default_path():
+    return os.path.join(get_workdir(), "files.db")
+
+
+class FileIndex:
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            import sqlite3
+            self._conn = sqlite3.connect(self.path)
+            with self._conn as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    "path TEXT PRIMARY KEY, root TEXT NOT NULL, size INTEGER NOT NULL, mtime INTEGER NOT NULL, "
+                    "video_id TEXT NOT NULL, part INTEGER NOT NULL, quality TEXT NOT NULL, codec TEXT NOT NULL, "
+                    "kind TEXT NOT NULL, source TEXT NOT NULL, indexed REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS files_video ON files (video_id, part)")
+                conn.execute("CREATE INDEX IF NOT EXISTS files_root ON files (root)")
+        return self._conn
+
+    def record(self, options, files, streams=None):
+        """记录下载完成的文件；streams 为 BBDown 输出中各分P 选择的视频流（见 add_track）
+
+        files 只能是这个任务下载（或后处理）得到的文件，如暂存目录中的输出，不能按修改时间在下载目录中查找。
+        """
+        streams = streams or {}
+        vid = video_id(options.url) or options.url
+        root = _root(options.work_dir)
+        patterns = compile_patterns(options)
+        pages = expand_pages(options.pages)
+        # 只下载一个分P 时文件都属于这个分P
+        single = pages[0] if pages and len(pages) == 1 else 0
+        rows = []
+        now = time.time()
+        conn = self._connect()
+        for path in files:
+            ext = os.path.splitext(path)[1].lower()
+            if ext not in KINDS:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            file = os.path.abspath(path)
+            rel = _relative(path, root)
+            name = parse_name(rel, patterns) if rel is not None else Attribution()
+            if not name.video_id:
+                # 文件名中没有视频 ID 时归属是按任务地址推断的，不覆盖按文件名解析出其他视频 ID 的记录
+                old = conn.execute("SELECT video_id FROM files WHERE path = ? AND source = ?", (file, NAME)).fetchone()
+                if old is not None and old[0] and old[0] != vid:
+                    continue
+            part = name.part or single
+            quality, codec = _stream(streams, part)
+            rows.append((file, root if rel is not None else "", st.st_size, st.st_mtime_ns,
+                         name.video_id or vid, part, name.quality or quality, name.codec or codec,
+                         KINDS[ext], DOWNLOAD, now))
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            # 后处理移走或重命名的文件不再留在索引中
+            gone = [(path,) for path, in conn.execute("SELECT path FROM files WHERE video_id = ?", (vid,))
+                    if not os.path.exists(path)]
+            conn.executemany("DELETE FROM files WHERE path = ?", gone)
+
+    def scan(self, options):
+        """增量扫描 options.work_dir：大小和修改时间都没变的文件不再解析，已删除的文件移出索引"""
+        root = _root(options.work_dir)
+        if not root:
+            return ScanResult(0, 0, 0, 0)
+        patterns = compile_patterns(options)
+        conn = self._connect()
+        known = {path: (size, mtime, source) for path, size, mtime, source in
+                 conn.execute("SELECT path, size, mtime, source FROM files WHERE root = ?", (root,))}
+        seen = set()
+        upserts = []
+        updates = []
+        added = changed = 0
+        now = time.time()
+
+        def walk(path):
+            nonlocal added, changed
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                return
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # 以 . 开头的目录（如延后混流的暂存目录）中的文件还不是下载结果
+                        if not entry.name.startswith("."):
+                            walk(entry.path)
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in KINDS:
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                file = os.path.abspath(entry.path)
+                seen.add(file)
+                old = known.get(file)
+                if old is not None and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+                    continue
+                if old is None:
+                    added += 1
+                else:
+                    changed += 1
+                if old is not None and old[2] == DOWNLOAD:
+                    # 下载时记录的归属比文件名可靠，只更新大小和修改时间
+                    updates.append((st.st_size, st.st_mtime_ns, now, file))
+                    continue
+                name = parse_name(os.path.relpath(file, root), patterns)
+                upserts.append((file, root, st.st_size, st.st_mtime_ns, name.video_id, name.part, name.quality,
+                                name.codec, KINDS[ext], NAME, now))
+
+        walk(options.work_dir)
+        removed = [(path,) for path in known if path not in seen]
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", upserts)
+            conn.executemany("UPDATE files SET size = ?, mtime = ?, indexed = ? WHERE path = ?", updates)
+            conn.executemany("DELETE FROM files WHERE path = ?", removed)
+        return ScanResult(added, changed, len(removed), len(seen) - added - changed)
+
+    def find(self, video_id, part=None, quality=None, codec=None, kind=None, work_dir=None):
+        """按视频 ID 查找文件，quality 可以只写开头（如 1080P）"""
+        # 还没有索引时不创建文件
+        if self._conn is None and not os.path.exists(self.path):
+            return []
+        sql = "SELECT path, size, video_id, part, quality, codec, kind FROM files WHERE video_id = ?"
+        params = [video_id]
+        for column, value in (("part", part), ("codec", codec), ("kind", kind)):
+            if value is not None:
+                sql += f" AND {column} = ?"
+                params.append(value)
+        if quality is not None:
+            sql += " AND quality LIKE ?"
+            params.append(quality + "%")
+        if work_dir is not None:
+            sql += " AND root = ?"
+            params.append(_root(work_dir))
+        return [FileEntry(*row) for row in self._connect().execute(sql + " ORDER BY part, path", params)]
+
+    def covers(self, options):
+        """下载目录中已有 options 要下载的全部文件时返回这些文件，否则返回 None
+
+        只确认能从索引判断的情况：指定了分P（或单P 视频）且画质、编码符合要求，文件仍然存在。
+        """
+        vid = video_id(options.url)
+        if vid is None or history_key(options) is None or not options.work_dir:
+            return None
+        kind = AUDIO if options.audio_only else SUBTITLE if options.sub_only else VIDEO
+        have = {}
+        for entry in self.find(vid, kind=kind, work_dir=options.work_dir):
+            if options.dfn_priority and entry.quality != options.dfn_priority:
+                continue
+            if options.encoding_priority and entry.codec != options.encoding_priority:
+                continue
+            if os.path.exists(entry.path):
+                have.setdefault(entry.part, []).append(entry.path)
+        pages = expand_pages(options.pages)
+        if pages is None:
+            # 分P 总数未知，只能确认文件名不含分P 的单P 视频
+            if options.pages.strip().upper() not in ("", "ALL") or set(have) != {0}:
+                return None
+            return have[0]
+        files = []
+        for page in pages:
+            # 单P 视频的文件名不含分P
+            found = have.get(page) or (have.get(0) if pages == [1] else None)
+            if not found:
+                return None
+            files += found
+        return files
+
+    def usage(self, work_dir=None):
+        """各视频的文件数和占用空间，从大到小"""
+        if self._conn is None and not os.path.exists(self.path):
+            return []
+        sql = "SELECT video_id, COUNT(*), SUM(size) FROM files"
+        params = ()
+        if work_dir is not None:
+            sql += " WHERE root = ?"
+            params = (_root(work_dir),)
+        return [Usage(*row) for row in self._connect().execute(sql + " GROUP BY video_id ORDER BY 3 DESC", params)]
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_index = None
+
+
+def get_file_index():
+    """进程内共用的文件索引（只在界面线程使用）"""
+    global _index
+    if _index is None:
+        _index = FileIndex()
+    return _index
@@ -1,21 +1,72 @@
+import multiprocessing
 import os
 import sys
-from PyQt5.QtCore import QT_VERSION_STR, Qt
-from PyQt5.QtWidgets import QApplication
 
-# High DPI 缩放支持 (必须在 QApplication 创建前设置)
-os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
-QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+from BBDown_GUI import startup
+
+
+def parse_startup_args(argv):
+    """取出 --profile-startup 文件名 和 --exit-after-startup，其余参数交给 Qt"""
+    profile, exit_after, rest = None, False, []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--profile-startup":
+            profile = next(args, "startup.txt")
+        elif arg.startswith("--profile-startup="):
+            profile = arg.split("=", 1)[1]
+        elif arg == "--exit-after-startup":
+            exit_after = True
+        else:
+            rest.append(arg)
+    return profile, exit_after, rest
 
-from BBDown_GUI.Form.form_main import FormMain
 
 def main():
-    app = QApplication(sys.argv)
+    # 打包后的程序中，下载后处理的进程池以本程序启动子进程
+    multiprocessing.freeze_support()
+    profile, exit_after, argv = parse_startup_args(sys.argv)
+    if profile:
+        startup.enable()
+
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication
+
+    # High DPI 缩放支持 (必须在 QApplication 创建前设置)
+    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
+    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    startup.mark("导入 PyQt5")
+
+    from BBDown_GUI.Form.form_main import FormMain
+    from BBDown_GUI.Form import resources
+    startup.mark("导入主界面")
+
+    app = QApplication(argv)
+    # 预先解码各窗口共用的图标，对话框等没有单独设置图标的窗口也使用它
+    resources.preload()
+    app.setWindowIcon(resources.get_icon())
     win_main = FormMain()
+    startup.mark("创建主界面")
+
+    def started():
+        startup.mark("首次绘制主界面")
+        if profile:
+            startup.disable()
+            startup.write(profile)
+        if exit_after:
+            app.quit()
+
+    if profile or exit_after:
+        startup.on_first_paint(win_main, started)
     win_main.show()
-    sys.exit(app.exec_())
+    returncode = app.exec_()
+    # 下载进程在单独的进程组中，不会随界面退出，这里连同 ffmpeg、aria2c 一起结束
+    from BBDown_GUI.supervisor import shutdown
+    shutdown()
+    from BBDown_GUI.postprocess import get_postprocessor
+    get_postprocessor().shutdown()
+    sys.exit(returncode)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,142 @@
+"""下载记录：已完成的下载保存在 history.db 中
+
+按 (视频 ID, 分P, 画质, 下载目录) 建唯一索引，加入任务前用一次索引查询判断是否已下载，
+不需要启动 BBDown 重新解析。可以选择同时检查记录中的文件是否仍然存在。
+"""
+import json
+import os
+import time
+
+from BBDown_GUI.ids import video_id
+from BBDown_GUI.tool import get_workdir
+
+# 下载完成后在下载目录中查找新文件时认定为输出的扩展名
+OUTPUT_EXTS = {".mp4", ".mkv", ".flv", ".m4a", ".aac", ".mp3", ".flac", ".ass", ".srt", ".xml", ".jpg", ".png"}
+# 查找新文件时进入子目录的层数（-F / -M 文件名模板可能包含子目录）
+OUTPUT_DEPTH = 3
+
+
+def default_path():
+    return os.path.join(get_workdir(), "history.db")
+
+
+def history_key(options):
+    """下载记录的索引键：(视频 ID, 分P, 画质, 下载目录)，不应记录的任务返回 None"""
+    # 仅解析、下载最新分P 的结果不固定，不记录也不跳过
+    if options.only_show_info or options.pages.upper() == "NEW":
+        return None
+    quality = options.dfn_priority or "最高画质"
+    if options.encoding_priority:
+        quality += " " + options.encoding_priority
+    for flag, text in ((options.audio_only, "仅音频"), (options.video_only, "仅视频"), (options.sub_only, "仅字幕")):
+        if flag:
+            quality += " " + text
+    path = os.path.normcase(os.path.abspath(options.work_dir)) if options.work_dir else ""
+    return (video_id(options.url) or options.url, options.pages.upper(), quality, path)
+
+
+def find_outputs(work_dir, since):
+    """下载目录中 since（时间戳）之后修改过的输出文件"""
+    found = []
+
+    def scan(path, depth):
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    # 以 . 开头的目录（如延后混流的暂存目录）中的文件还不是下载结果
+                    if depth < OUTPUT_DEPTH and not entry.name.startswith("."):
+                        scan(entry.path, depth + 1)
+                elif os.path.splitext(entry.name)[1].lower() in OUTPUT_EXTS and entry.stat().st_mtime >= since:
+                    found.append(entry.path)
+            except OSError:
+                pass
+
+    if work_dir:
+        scan(work_dir, 1)
+    return found
+
+
+class History:
+    def __init__(self, path=None, index=None):
+        self.path = path or default_path()
+        # 文件索引（FileIndex）：写入下载记录时同时记录文件的归属，没有下载记录时按索引判断是否已下载
+        self.index = index
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            import sqlite3
+            self._conn = sqlite3.connect(self.path)
+            with self._conn as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS downloads ("
+                    "video_id TEXT NOT NULL, part TEXT NOT NULL, quality TEXT NOT NULL, path TEXT NOT NULL, "
+                    "url TEXT NOT NULL, files TEXT NOT NULL, finished REAL NOT NULL)"
+                )
+                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS downloads_key ON downloads (video_id, part, quality, path)")
+                conn.execute("CREATE INDEX IF NOT EXISTS downloads_path ON downloads (path)")
+        return self._conn
+
+    def find(self, options, verify_files=False):
+        """返回已完成的下载记录 {url, files, finished}，没有记录（或文件已不存在）时返回 None
+
+        没有下载记录、由文件索引判断已下载时 finished 为 None
+        """
+        key = history_key(options)
+        if key is None:
+            return None
+        record = self._find(key)
+        if verify_files and record is not None and not (record["files"] and all(os.path.exists(f) for f in record["files"])):
+            record = None
+        if record is None and self.index is not None:
+            # 没有下载记录（如其他程序下载、扫描到的文件）时，下载目录中已有全部文件也视为已下载
+            files = self.index.covers(options)
+            if files:
+                record = {"url": options.url, "files": files, "finished": None}
+        return record
+
+    def _find(self, key):
+        # 还没有下载记录时不创建文件
+        if self._conn is None and not os.path.exists(self.path):
+            return None
+        row = self._connect().execute(
+            "SELECT url, files, finished FROM downloads WHERE video_id = ? AND part = ? AND quality = ? AND path = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        return {"url": row[0], "files": json.loads(row[1]), "finished": row[2]}
+
+    def add(self, options, files=(), finished=None, streams=None):
+        """写入下载记录；streams 为 BBDown 输出中各分P 选择的视频流，用于记录文件的画质和编码"""
+        key = history_key(options)
+        if key is None:
+            return
+        if self.index is not None:
+            self.index.record(options, files, streams)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO downloads (video_id, part, quality, path, url, files, finished) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                key + (options.url, json.dumps(list(files), ensure_ascii=False), finished or time.time()),
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_history = None
+
+
+def get_history():
+    """进程内共用的下载记录（只在界面线程使用）"""
+    global _history
+    if _history is None:
+        from BBDown_GUI.fileindex import get_file_index
+        _history = History(index=get_file_index())
+    return _history
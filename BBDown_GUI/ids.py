@@ -0,0 +1,88 @@
+"""从视频地址中提取稿件 ID（BV / av / ep / ss），把导入的地址规范化以便去重"""
+import re
+
+# 按顺序尝试，返回第一个匹配；BV 号区分大小写，其余前缀不区分
+_patterns = [
+    (re.compile(r"(?<![0-9A-Za-z])(BV[0-9A-Za-z]{10})(?![0-9A-Za-z])"), "{}"),
+    (re.compile(r"(?<![0-9A-Za-z])av(\d+)", re.I), "av{}"),
+    (re.compile(r"(?<![0-9A-Za-z])ep(\d+)", re.I), "ep{}"),
+    (re.compile(r"(?<![0-9A-Za-z])ss(\d+)", re.I), "ss{}"),
+]
+
+# b23.tv 短链接离线无法解析，保留为规范的短链接地址
+_short_link = re.compile(r"(?:https?://)?(?:b23\.tv|bili2233\.cn)/([0-9A-Za-z]+)", re.I)
+# 哔哩哔哩的地址
+_site = re.compile(r"bilibili\.com/|b23\.tv/|bili2233\.cn/", re.I)
+# 地址中的分P 参数（?p=3），去掉后会改变下载内容，这类地址保留原样
+_page_query = re.compile(r"[?&]p=\d+", re.I)
+# 课程的地址（/cheese/play/ss123、ep456），只留 ID 会被当作番剧，保留原样
+_cheese = re.compile(r"bilibili\.com/cheese/", re.I)
+# 在 CSV / JSON 等任意文本中查找哔哩哔哩地址、稿件 ID 和短链接；地址只取到第一个非 ASCII 的地址字符为止
+_token = re.compile(
+    r"(?<![0-9A-Za-z])(?:"
+    r"(?i:(?:https?://)?(?:[0-9a-z-]+\.)*bilibili\.com/)[0-9A-Za-z\-._~:/?#@!$&*+=%]*"
+    r"|BV[0-9A-Za-z]{10}(?![0-9A-Za-z])"
+    r"|(?i:av|ep|ss)\d+"
+    r"|(?i:(?:https?://)?(?:b23\.tv|bili2233\.cn)/)[0-9A-Za-z]+"
+    r")"
+)
+
+
+def video_id(text):
+    """返回规范化的 ID，如 BV1xx411c7mD、av170001、ep12345，找不到时返回 None"""
+    for pattern, fmt in _patterns:
+        m = pattern.search(text)
+        if m:
+            return fmt.format(m.group(1))
+    return None
+
+
+def selects_part(text):
+    """地址本身指定了分P 或剧集（?p=3、ep12345）：不加 -p 时 BBDown 只下载这一个分P 或这一集"""
+    return bool(_page_query.search(text)) or (video_id(text) or "").startswith("ep")
+
+
+def short_link(text):
+    m = _short_link.search(text)
+    return f"https://b23.tv/{m.group(1)}" if m else None
+
+
+def normalize(text):
+    """把一行地址规范化：能提取 ID 的换成 ID，短链接统一写法，其他地址（收藏夹、空间等）原样返回"""
+    text = text.strip()
+    if not text:
+        return None
+    link = short_link(text)
+    if link:
+        return link
+    if _page_query.search(text) or _cheese.search(text):
+        return text
+    return video_id(text) or text
+
+
+def find_ids(text):
+    """依次返回文本中出现的规范化 ID 和短链接（用于 CSV、JSON 等不是每行一个地址的文件）
+
+    哔哩哔哩地址整个按 normalize 规范化，带分P 参数的地址和课程地址保留原样；地址中没有 ID 时跳过
+    """
+    for m in _token.finditer(text):
+        token = m.group(0)
+        if short_link(token) or video_id(token):
+            yield normalize(token)
+
+
+def find_links(text):
+    """依次返回文本中的哔哩哔哩地址（按 normalize 规范化）和短链接，以及单独成行的 ID
+
+    比 find_ids 严格，用于剪贴板等来源不确定的文本，避免把普通文字中的 ep1 等当作视频
+    """
+    for line in text.splitlines():
+        line = line.strip()
+        if _site.search(line):
+            # 与 find_ids 相同地规范化地址，但不取地址以外的文字
+            for m in _token.finditer(line):
+                token = m.group(0)
+                if _site.search(token) and (short_link(token) or video_id(token)):
+                    yield normalize(token)
+        elif line and _token.fullmatch(line):
+            yield normalize(line)
@@ -0,0 +1,77 @@
+"""批量导入视频地址：逐行 / 逐块读取 txt、csv、json 文件，规范化并去重
+
+只保留一份已见过的 ID 集合，不会把整个文件读入内存；调用方按需取出，
+图形界面每次只处理一小批，导入十万行的文件也不会卡住界面。
+"""
+import os
+
+from BBDown_GUI.ids import normalize, find_ids
+
+# JSON 文件可能整个只有一行，按块读取，块与块之间在这些分隔符处断开
+CHUNK_SIZE = 64 * 1024
+_separators = " \t\r\n\",[]{}"
+
+
+def iter_lines(lines):
+    """每行一个地址（忽略空行和 # 注释）"""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            entry = normalize(line)
+            if entry:
+                yield entry
+
+
+def iter_csv(f):
+    """CSV：在每个单元格中查找 ID 和短链接，表头等其他内容忽略"""
+    import csv
+    try:
+        for row in csv.reader(f):
+            for cell in row:
+                yield from find_ids(cell)
+    except csv.Error as e:
+        raise ValueError(f"CSV 格式错误: {e}") from e
+
+
+def iter_chunks(f):
+    """JSON 等任意文本：按块查找 ID 和短链接（收藏夹导出中的 bvid、链接等）"""
+    rest = ""
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        text = rest + chunk
+        cut = max(text.rfind(c) for c in _separators)
+        if cut < 0:
+            rest = text
+            continue
+        rest = text[cut + 1:]
+        # JSON 中的 \/ 转义
+        yield from find_ids(text[:cut + 1].replace("\\/", "/"))
+    if rest:
+        yield from find_ids(rest.replace("\\/", "/"))
+
+
+def iter_file(path):
+    """按扩展名选择解析方式，逐个返回规范化后的地址（可能重复）
+
+    读取失败时抛出 OSError，编码或格式错误时抛出 ValueError
+    """
+    ext = os.path.splitext(path)[1].lower()
+    # utf-8-sig 兼容 Excel 导出的带 BOM 的文件
+    with open(path, "r", encoding="utf-8-sig", newline="" if ext == ".csv" else None) as f:
+        if ext == ".csv":
+            yield from iter_csv(f)
+        elif ext == ".json":
+            yield from iter_chunks(f)
+        else:
+            yield from iter_lines(f)
+
+
+def unique(entries, seen=None):
+    """去掉重复的地址，seen 为已见过的集合（可在多次导入间共用）"""
+    seen = set() if seen is None else seen
+    for entry in entries:
+        if entry not in seen:
+            seen.add(entry)
+            yield entry
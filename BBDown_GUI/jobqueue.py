@@ -0,0 +1,215 @@
+import heapq
+import itertools
+import time
+
+from BBDown_GUI.ids import normalize
+
+# 任务状态
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+STOPPED = "stopped"
+
+STATUS_TEXT = {
+    QUEUED: "排队中",
+    RUNNING: "下载中",
+    DONE: "已完成",
+    FAILED: "失败",
+    STOPPED: "已停止",
+}
+
+_job_id = itertools.count(1)
+
+# 少量地址（剪贴板、粘贴一两个地址）加入的任务可以额外占用的名额，不必等大批量任务让出名额
+EXPRESS_SLOTS = 1
+
+
+def split_urls(text):
+    """把粘贴的文本拆成规范化的视频地址列表（每行一个，忽略空行和 # 注释）"""
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(normalize(line))
+    return urls
+
+
+class Job:
+    def __init__(self, options, priority=0, profile=None):
+        self.id = None
+        self.options = options
+        # 生成参数所用的下载方案名称，None 表示主界面当前的选项
+        self.profile = profile
+        self.url = options.url
+        self.argv = options.to_argv()
+        self.priority = priority
+        self.status = QUEUED
+        self.returncode = None
+        # 队列日志中的 key，用于程序重启后继续下载
+        self.key = None
+        # 同一次加入的任务属于同一批，各批轮流下载
+        self.batch = None
+        # 可以使用 EXPRESS_SLOTS 中的名额
+        self.express = False
+        # 按分P 拆分：每个子任务的分P 数（0 为不拆分）和同时运行的子任务数上限
+        self.chunk = 0
+        self.chunk_limit = 1
+        # 已下载完成的分P（从队列日志恢复的任务），拆分时跳过
+        self.done_parts = frozenset()
+        # 拆分后的子任务；子任务的 parent 为原任务
+        self.parent = None
+        self.children = []
+        self.active = 0
+        # 子任务数达到上限时暂时移出队列的子任务
+        self.parked = []
+        self.started = None
+        # 下载时跳过混流，完成后由混流队列混流
+        self.defer_mux = False
+        # BBDown 输出中各分P 选择的视频流 {分P: (画质, 编码)}，子任务的记在原任务上
+        self.streams = {}
+        self._seq = None
+
+
+class JobQueue:
+    """按优先级排队的下载任务，同时运行的任务数不超过 concurrency
+
+    同优先级的任务按批次轮流取出：先导入一万个地址、再复制一个地址时，
+    后者在下一个空闲名额就开始下载，而不是排在一万个任务之后。
+    标记为 express 的任务在名额已满时还可以使用 EXPRESS_SLOTS 个额外名额。
+    按分P 拆分的任务（split）由子任务占用名额，子任务全部结束后原任务才结束。
+    """
+    def __init__(self, concurrency=2):
+        self.concurrency = concurrency
+        self.jobs = []
+        self.running = set()
+        self._options = set()
+        # 批次 -> 该批排队任务的堆
+        self._batches = {}
+        # 批次 -> 上次从该批取出任务的序号
+        self._served = {}
+        self._seq = itertools.count()
+
+    def add(self, job, batch=None):
+        """加入任务，参数完全相同的任务正在排队或下载时返回 None；batch 为空时任务单独成批
+
+        已结束的任务（包括失败的）可以重新加入，是否已下载由下载记录判断。
+        """
+        if job.options in self._options:
+            return None
+        self._options.add(job.options)
+        job.id = next(_job_id)
+        job.batch = job.id if batch is None else batch
+        self.jobs.append(job)
+        # 优先级数值越大越先下载，同一批内按加入顺序
+        job._seq = next(self._seq)
+        self._push((-job.priority, job._seq, 0, job))
+        return job
+
+    def _push(self, entry):
+        heapq.heappush(self._batches.setdefault(entry[3].batch, []), entry)
+
+    def split(self, job, options_list):
+        """把已取出的任务拆成子任务，原任务让出名额，状态保持为下载中"""
+        self.running.discard(job)
+        job.started = job.started or time.time()
+        for index, options in enumerate(options_list, 1):
+            child = Job(options, job.priority, job.profile)
+            child.id = next(_job_id)
+            child.parent = job
+            child.batch = job.batch
+            child.express = job.express
+            child.key = job.key
+            job.children.append(child)
+            # 子任务排在原任务的位置，不排到同一批的最后
+            self._push((-job.priority, job._seq, index, child))
+        return job.children
+
+    def take(self):
+        """取出下一个可以启动的任务，没有空闲名额或没有排队任务时返回 None"""
+        if len(self.running) >= self.concurrency + EXPRESS_SLOTS:
+            return None
+        express = len(self.running) >= self.concurrency
+        best = None
+        for batch in list(self._batches):
+            heap = self._batches[batch]
+            while heap and (heap[0][3].status != QUEUED or self._capped(heap[0][3])):
+                entry = heapq.heappop(heap)
+                if entry[3].status == QUEUED:
+                    entry[3].parent.parked.append(entry)
+            if not heap:
+                del self._batches[batch]
+                self._served.pop(batch, None)
+                continue
+            if express and not heap[0][3].express:
+                continue
+            # 优先级高的先下载；同优先级时最久没有取过（或从未取过）的批次先下载
+            key = (heap[0][0], self._served.get(batch, -1), heap[0][1], heap[0][2])
+            if best is None or key < best[0]:
+                best = (key, batch)
+        if best is None:
+            return None
+        job = heapq.heappop(self._batches[best[1]])[3]
+        self._served[best[1]] = next(self._seq)
+        job.status = RUNNING
+        self.running.add(job)
+        if job.parent is not None:
+            job.parent.active += 1
+        return job
+
+    @staticmethod
+    def _capped(job):
+        return job.parent is not None and job.parent.active >= job.parent.chunk_limit
+
+    def finish(self, job, returncode, stopped=False):
+        """结束任务，返回因此结束的任务（子任务全部结束时为原任务），没有时返回 None"""
+        self.running.discard(job)
+        job.returncode = returncode
+        if stopped:
+            job.status = STOPPED
+        else:
+            job.status = DONE if returncode == 0 else FAILED
+        parent = job.parent
+        if parent is None:
+            self._options.discard(job.options)
+            return job
+        parent.active -= 1
+        if parent.parked:
+            self._push(parent.parked.pop(0))
+        if parent.active == 0 and all(child.status != QUEUED for child in parent.children):
+            return self._finish_group(parent)
+        return None
+
+    def _finish_group(self, job):
+        """合并子任务的结果：有子任务被停止时为已停止，否则有失败的子任务时为失败"""
+        statuses = {child.status for child in job.children}
+        job.returncode = next((child.returncode for child in job.children if child.returncode), 0)
+        if STOPPED in statuses:
+            job.status = STOPPED
+        else:
+            job.status = FAILED if FAILED in statuses else DONE
+        self._options.discard(job.options)
+        job.parked.clear()
+        return job
+
+    def stop(self):
+        """取消所有排队中的任务（包括子任务），返回因此结束的任务；正在运行的任务由调用方停止后 finish"""
+        cancelled = []
+        for job in self.jobs:
+            if job.status == QUEUED:
+                job.status = STOPPED
+                self._options.discard(job.options)
+                cancelled.append(job)
+            elif job.status == RUNNING and job.children:
+                for child in job.children:
+                    if child.status == QUEUED:
+                        child.status = STOPPED
+                # 没有正在运行的子任务时原任务立即结束
+                if job.active == 0:
+                    cancelled.append(self._finish_group(job))
+        self._batches.clear()
+        self._served.clear()
+        return cancelled
+
+    def pending(self):
+        return sum(1 for job in self.jobs if job.status == QUEUED)
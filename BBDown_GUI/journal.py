@@ -0,0 +1,144 @@
+"""下载队列的预写日志（queue.journal）
+
+每行一条 JSON 记录，只追加不修改：
+    {"op": "add", "key": ..., "options": {...}, "priority": 0, "profile": null}
+    {"op": "part", "key": ..., "part": 3}        分P 已下载完成
+    {"op": "end", "key": ..., "status": "done"}  任务结束（完成、失败或被停止）
+程序关闭或崩溃后，没有 end 记录的任务在下次启动时继续下载。
+打开时把日志压缩为只包含未完成任务的新文件，日志不会无限增长。
+"""
+import json
+import os
+import uuid
+from typing import NamedTuple
+
+from BBDown_GUI.parts import expand_pages, format_pages
+from BBDown_GUI.tool import get_workdir
+
+
+def default_path():
+    return os.path.join(get_workdir(), "queue.journal")
+
+
+class JournalEntry(NamedTuple):
+    key: str
+    options: dict
+    priority: int
+    profile: str
+    # 已下载完成的分P
+    parts: frozenset
+
+
+def remaining_pages(pages, done, count=None):
+    """去掉已完成的分P 后的 -p 参数，全部完成时返回 None
+
+    count 为分P 总数（缓存的视频信息），用于展开 ALL、LAST 和不加 -p；
+    未知时以及 NEW 等无法离线展开的取值原样返回，已存在的文件由 BBDown 自己跳过。
+    """
+    if not done:
+        return pages
+    numbers = expand_pages(pages, count)
+    if numbers is None:
+        return pages
+    if count:
+        numbers = [n for n in numbers if n <= count]
+    left = [n for n in numbers if n not in done]
+    return format_pages(left) if left else None
+
+
+class Journal:
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        self._file = None
+
+    def recover(self):
+        """读取日志，返回未完成的任务，并把日志压缩为只包含这些任务"""
+        entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        op, key = record["op"], record["key"]
+                        if op == "add":
+                            entries[key] = JournalEntry(key, record["options"], record.get("priority", 0),
+                                                        record.get("profile"), frozenset())
+                        elif op == "part" and key in entries:
+                            entries[key] = entries[key]._replace(parts=entries[key].parts | {record["part"]})
+                        elif op == "end":
+                            entries.pop(key, None)
+                    except (ValueError, KeyError, TypeError):
+                        # 崩溃时写了一半的最后一行
+                        continue
+        except FileNotFoundError:
+            return []
+        pending = list(entries.values())
+        self._rewrite(pending)
+        return pending
+
+    def _rewrite(self, pending):
+        self.close()
+        if not pending:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            return
+        import tempfile
+        fd, tmp = tempfile.mkstemp(prefix=".queue-", suffix=".tmp", dir=os.path.dirname(self.path) or ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entry in pending:
+                    f.write(self._line("add", entry.key, options=entry.options,
+                                       priority=entry.priority, profile=entry.profile))
+                    for part in sorted(entry.parts):
+                        f.write(self._line("part", entry.key, part=part))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @staticmethod
+    def _line(op, key, **fields):
+        return json.dumps(dict(op=op, key=key, **fields), ensure_ascii=False) + "\n"
+
+    def _write(self, line):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(line)
+
+    def add(self, options, priority=0, profile=None):
+        """记录新任务，返回任务的 key"""
+        key = uuid.uuid4().hex
+        self._write(self._line("add", key, options=options.to_dict(), priority=priority, profile=profile))
+        return key
+
+    def part_done(self, key, part):
+        self._write(self._line("part", key, part=part))
+
+    def end(self, key, status):
+        self._write(self._line("end", key, status=status))
+
+    def flush(self):
+        """把已写入的记录落盘；批量加入任务时每批调用一次"""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_journal = None
+
+
+def get_journal():
+    """进程内共用的队列日志（只在界面线程使用）"""
+    global _journal
+    if _journal is None:
+        _journal = Journal()
+    return _journal
@@ -0,0 +1,85 @@
+"""所有下载任务共用的连接数和限速
+
+BBDown 的 -mt 和 aria2c 参数只作用于单个进程，同时运行多个任务时总连接数会成倍增加。
+这里把总连接数和当前时段的总限速平均分给每个下载名额，
+在任务启动时写入它的 --aria2c-args（只对使用 aria2c 的任务有效）。
+"""
+import re
+
+# 单个 aria2c 进程每台服务器的最大连接数
+MAX_CONNECTIONS = 16
+
+_re_rate = re.compile(r"^(\d+(?:\.\d+)?)([KMG]?)$", re.I)
+_re_window = re.compile(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})=(\S+)$")
+# --aria2c-args 中会被替换的选项
+_re_aria2c_limits = re.compile(
+    r"(?:^|\s)(?:-[xs]|--max-connection-per-server|--split|--max-overall-download-limit|--max-download-limit)"
+    r"(?:=|\s*)\S+"
+)
+_units = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_rate(text):
+    """"2M" "500K" "0" -> 字节/秒，0 表示不限速"""
+    m = _re_rate.match(text.strip())
+    if m is None:
+        raise ValueError(f"速度格式不正确: {text}")
+    return int(float(m.group(1)) * _units[m.group(2).upper()])
+
+
+def parse_windows(text):
+    """解析限速时段，如 "08:00-23:00=2M, 23:00-08:00=0"，返回 [(开始分钟, 结束分钟, 字节/秒)]
+
+    结束时间早于开始时间表示跨过午夜，没有覆盖到的时间不限速。
+    """
+    windows = []
+    for item in re.split(r"[,;\s]+", text.strip()):
+        if not item:
+            continue
+        m = _re_window.match(item)
+        if m is None:
+            raise ValueError(f"限速时段格式不正确: {item}")
+        h1, m1, h2, m2 = (int(g) for g in m.groups()[:4])
+        if h1 > 24 or h2 > 24 or m1 > 59 or m2 > 59:
+            raise ValueError(f"时间不正确: {item}")
+        windows.append((h1 * 60 + m1, h2 * 60 + m2, parse_rate(m.group(5))))
+    return windows
+
+
+def rate_at(windows, now):
+    """now（datetime）所在时段的总限速，不在任何时段内时返回 0"""
+    minute = now.hour * 60 + now.minute
+    for start, end, rate in windows:
+        if start <= minute < end or (end < start and (minute >= start or minute < end)):
+            return rate
+    return 0
+
+
+def aria2c_args(args, connections=0, rate=0):
+    """在原有的 aria2c 参数后加上连接数和限速，同名的原有参数被替换"""
+    if not connections and not rate:
+        return args
+    args = _re_aria2c_limits.sub("", args).strip()
+    extra = []
+    if connections:
+        extra.append(f"-x{connections} -s{connections}")
+    if rate:
+        extra.append(f"--max-overall-download-limit={rate}")
+    return " ".join([args] + extra if args else extra)
+
+
+class Limits:
+    """总连接数（0 为不限）和限速时段"""
+    def __init__(self, connections=0, windows=()):
+        self.connections = connections
+        self.windows = list(windows)
+
+    def apply(self, options, slots, now=None):
+        """按 slots 个下载名额平分后写入任务的参数，不使用 aria2c 的任务原样返回"""
+        if not options.use_aria2c:
+            return options
+        import datetime
+        rate = rate_at(self.windows, now or datetime.datetime.now())
+        slots = max(1, slots)
+        connections = min(MAX_CONNECTIONS, max(1, self.connections // slots)) if self.connections else 0
+        return options._replace(aria2c_args=aria2c_args(options.aria2c_args, connections, rate // slots))
@@ -0,0 +1,32 @@
+import threading
+from collections import deque
+
+
+class LineBuffer:
+    """线程安全的输出行缓冲区，读取线程写入，界面线程定时批量取出"""
+    def __init__(self):
+        self._lines = deque()
+        self._lock = threading.Lock()
+
+    def put(self, line):
+        with self._lock:
+            self._lines.append(line)
+
+    def __len__(self):
+        return len(self._lines)
+
+    def drain(self, max_lines):
+        """取出最多 max_lines 行
+
+        以 \\r 结尾的进度行如果紧跟着一条非空行，显示时反正会被覆盖，
+        这里直接丢弃，进度刷新再快也只占一行。
+        """
+        lines = []
+        with self._lock:
+            while self._lines and len(lines) < max_lines:
+                line = self._lines.popleft()
+                if lines and lines[-1].endswith("\r") and line.rstrip("\r\n"):
+                    lines[-1] = line
+                else:
+                    lines.append(line)
+        return lines
@@ -0,0 +1,214 @@
+"""视频信息（分P 列表和可用的音视频流）：以 -info 运行一次 BBDown，解析后缓存在 metadata.db 中
+
+同一个视频换分P 范围或画质重新下载时，直接从缓存得到分P 和流的信息，不必每次重新解析。
+缓存按视频 ID 保存，超过 ttl 秒后视为过期（新上传的分P、登录后可用的画质会变化）。
+"""
+import json
+import os
+import re
+import time
+from typing import NamedTuple
+
+from BBDown_GUI.ids import video_id
+from BBDown_GUI.tool import get_workdir
+
+# 缓存的有效期（秒）
+METADATA_TTL = 6 * 3600
+
+# BBDown 日志形如 "[2023-01-01 12:00:00.000] - 视频标题: ..."，流列表没有时间前缀
+_re_log = re.compile(r"^\[[\d\-: .]+\] - ")
+_re_aid = re.compile(r"^获取aid结束: (\d+)")
+_re_title = re.compile(r"^视频标题: (.*)")
+_re_pages = re.compile(r"^共计\s*(\d+)\s*个分P")
+_re_page = re.compile(r"^P(\d+): \[(\d+)\] \[(.*)\] \[([^\]]*)\]$")
+_re_streams = re.compile(r"^共计\s*(\d+)\s*条(视频|音频)流")
+_re_stream = re.compile(r"^\d+\. (\[.*\])$")
+_re_field = re.compile(r"\[([^\]]*)\]")
+_re_video_codec = re.compile(r"^(AVC|HEVC|AV1)$", re.I)
+_re_audio_codec = re.compile(r"^(mp4a|ec-3|flac)", re.I)
+
+
+class VideoInfo(NamedTuple):
+    key: str
+    title: str = ""
+    aid: str = ""
+    # 分P 总数；视频很多时不加 --show-all 只列出一部分，parts 可能少于 page_count
+    page_count: int = 0
+    # [{"index": 1, "cid": "...", "title": "...", "duration": "04m10s"}]
+    parts: tuple = ()
+    # [{"quality": "1080P 高清", "codec": "AVC", "fields": [...]}]，为第一个解析的分P 的流
+    video_streams: tuple = ()
+    audio_streams: tuple = ()
+    fetched: float = 0
+
+    def qualities(self):
+        """可用的画质，按 BBDown 列出的顺序（从高到低）去重"""
+        return list(dict.fromkeys(s["quality"] for s in self.video_streams))
+
+    def to_dict(self):
+        data = dict(self._asdict())
+        data["parts"] = list(self.parts)
+        data["video_streams"] = list(self.video_streams)
+        data["audio_streams"] = list(self.audio_streams)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        data = {k: v for k, v in data.items() if k in cls._fields}
+        for name in ("parts", "video_streams", "audio_streams"):
+            data[name] = tuple(data.get(name, ()))
+        return cls(**data)
+
+
+def metadata_key(options):
+    """缓存的键：视频 ID，使用 TV / APP / 国际版接口时加上接口名（可用的流不同）"""
+    key = video_id(options.url) or options.url
+    return f"{key} -{options.source}" if options.source else key
+
+
+def probe_options(options):
+    """只解析不下载的参数：列出全部分P，只解析第一个分P 的流"""
+    return options._replace(only_show_info=True, show_all=True, pages="1", hide_streams=False, debug=False)
+
+
+def parse_info(key, lines, fetched=None):
+    """解析 BBDown -info 的输出，没有解析到分P 时返回 None"""
+    title = aid = ""
+    page_count = 0
+    parts = []
+    streams = {"视频": [], "音频": []}
+    current = None
+    done = set()
+    for line in lines:
+        text = _re_log.sub("", line.strip())
+        m = _re_stream.match(text)
+        if m and current is not None:
+            fields = _re_field.findall(m.group(1))
+            if current == "视频":
+                codec = next((f for f in fields if _re_video_codec.match(f)), "")
+                streams[current].append({"quality": fields[0], "codec": codec, "fields": fields})
+            else:
+                codec = next((f for f in fields if _re_audio_codec.match(f)), fields[0])
+                streams[current].append({"quality": codec, "codec": codec, "fields": fields})
+            continue
+        current = None
+        m = _re_streams.match(text)
+        if m:
+            # 只保存第一个分P 的流
+            if m.group(2) not in done:
+                current = m.group(2)
+                done.add(current)
+            continue
+        m = _re_page.match(text)
+        if m:
+            parts.append({"index": int(m.group(1)), "cid": m.group(2), "title": m.group(3), "duration": m.group(4)})
+            continue
+        m = _re_pages.match(text)
+        if m:
+            page_count = int(m.group(1))
+            continue
+        m = _re_title.match(text)
+        if m and not title:
+            title = m.group(1)
+            continue
+        m = _re_aid.match(text)
+        if m and not aid:
+            aid = m.group(1)
+    if not parts and not page_count:
+        return None
+    return VideoInfo(key, title, aid, page_count or len(parts), tuple(parts),
+                     tuple(streams["视频"]), tuple(streams["音频"]), fetched or time.time())
+
+
+def default_path():
+    return os.path.join(get_workdir(), "metadata.db")
+
+
+class MetadataCache:
+    def __init__(self, path=None, ttl=METADATA_TTL):
+        self.path = path or default_path()
+        self.ttl = ttl
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            import sqlite3
+            self._conn = sqlite3.connect(self.path)
+            with self._conn as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata ("
+                    "key TEXT PRIMARY KEY, data TEXT NOT NULL, fetched REAL NOT NULL)"
+                )
+        return self._conn
+
+    def get(self, options, ttl=None):
+        """缓存中未过期的 VideoInfo，没有时返回 None"""
+        # 还没有缓存时不创建文件
+        if self._conn is None and not os.path.exists(self.path):
+            return None
+        ttl = self.ttl if ttl is None else ttl
+        row = self._connect().execute(
+            "SELECT data FROM metadata WHERE key = ? AND fetched >= ?", (metadata_key(options), time.time() - ttl)
+        ).fetchone()
+        return VideoInfo.from_dict(json.loads(row[0])) if row else None
+
+    def put(self, info):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, data, fetched) VALUES (?, ?, ?)",
+                (info.key, json.dumps(info.to_dict(), ensure_ascii=False), info.fetched),
+            )
+
+    def add_output(self, options, lines):
+        """从 -info 运行的输出中解析并缓存，返回 VideoInfo 或 None"""
+        info = parse_info(metadata_key(options), lines)
+        if info is not None:
+            self.put(info)
+        return info
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def probe(options, bbdown, cache, env=None, timeout=120):
+    """以 -info 运行 BBDown 并缓存结果（阻塞，供无界面模式使用），缓存未过期时直接返回缓存"""
+    info = cache.get(options)
+    if info is not None:
+        return info
+    import queue
+    from BBDown_GUI.supervisor import get_supervisor
+    lines = []
+    exited = queue.Queue()
+    get_supervisor().spawn([bbdown] + probe_options(options).to_argv(), lines.append, exited.put,
+                           env=env, timeout=timeout)
+    if exited.get() != 0:
+        return None
+    # 在调用方的线程中写入缓存（sqlite 连接不能跨线程使用）
+    return cache.add_output(options, lines)
+
+
+def format_info(info):
+    """与 BBDown -info 输出相近的文本，用于显示缓存的结果"""
+    lines = [f"视频标题: {info.title}"]
+    if info.aid:
+        lines.append(f"aid: {info.aid}")
+    lines.append(f"共计 {info.page_count} 个分P")
+    lines += [f"P{p['index']}: [{p['cid']}] [{p['title']}] [{p['duration']}]" for p in info.parts]
+    for name, streams in (("视频", info.video_streams), ("音频", info.audio_streams)):
+        if streams:
+            lines.append(f"共计{len(streams)}条{name}流.")
+            lines += [f"{i}. " + " ".join(f"[{f}]" for f in s["fields"]) for i, s in enumerate(streams)]
+    return lines
+
+
+_cache = None
+
+
+def get_metadata():
+    """进程内共用的视频信息缓存（只在界面线程使用）"""
+    global _cache
+    if _cache is None:
+        _cache = MetadataCache()
+    return _cache
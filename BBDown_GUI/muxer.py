@@ -0,0 +1,212 @@
+"""延后混流：下载时加 --skip-mux，音视频轨道下载完成后由本地的混流队列统一混流
+
+很多任务同时下载完成时，每个 BBDown 都会立即启动自己的 ffmpeg 或 MP4Box，互相争抢 CPU 和磁盘。
+改为由固定数量的混流进程依次处理，下载可以一直占满带宽，混流只占用固定份额的核心。
+
+下载队列的任务都下载到下载目录中各自的暂存目录，完成（延后混流的任务在混流）后再移到下载目录，
+同时下载到同一目录的任务不会混用彼此的文件，下载记录、文件索引和后处理只处理任务自己的文件。
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import deque
+from typing import NamedTuple
+
+# 默认同时运行的混流进程数
+MUX_WORKERS = 1
+# 跳过混流时 BBDown 留下的视频轨道和音频轨道，文件名（不含扩展名）相同
+VIDEO_EXTS = {".mp4", ".m4v"}
+AUDIO_EXTS = {".m4a", ".aac", ".ec3", ".eac3", ".flac", ".mp3"}
+# 下载目录中存放暂存目录的文件夹（以 . 开头，查找下载结果时跳过）
+STAGING = ".bbdown_gui"
+
+
+class MuxTask(NamedTuple):
+    video: str
+    audio: str
+    # 混流结果，与视频轨道同名时替换视频轨道
+    output: str
+
+
+class MuxResult(NamedTuple):
+    task: MuxTask
+    returncode: int
+    lines: tuple
+
+
+def staging_dir(options, name=None):
+    """任务的暂存目录
+
+    name 为任务的标识（下载队列中为队列日志的 key，拆分的子任务和重启后继续的任务相同），
+    没有时按除分P 外的参数命名。
+    """
+    if name is None:
+        data = json.dumps(options._replace(pages="").to_dict(), sort_keys=True, ensure_ascii=False)
+        name = hashlib.sha1(data.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(options.work_dir or os.getcwd(), STAGING, name)
+
+
+def staged_options(options, parent=None, name=None, skip_mux=True):
+    """下载到暂存目录的参数，parent 为拆分前的参数；暂存目录不存在时创建
+
+    skip_mux 时跳过混流（延后混流），否则由 BBDown 自己混流。
+    """
+    staging = staging_dir(parent or options, name)
+    os.makedirs(staging, exist_ok=True)
+    return options._replace(skip_mux=skip_mux or options.skip_mux, work_dir=staging)
+
+
+def publish(options, files, name=None):
+    """把暂存目录中的文件移到下载目录（保留子目录），删除空的暂存目录，返回移动后的路径"""
+    staging = staging_dir(options, name)
+    target = options.work_dir or os.getcwd()
+    moved = []
+    for path in files:
+        dest = os.path.join(target, os.path.relpath(path, staging))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        os.replace(path, dest)
+        moved.append(dest)
+    for root, _, _ in os.walk(staging, topdown=False):
+        try:
+            os.rmdir(root)
+        except OSError:
+            pass
+    try:
+        os.rmdir(os.path.dirname(staging))
+    except OSError:
+        pass
+    return moved
+
+
+def find_tracks(files):
+    """按文件名配对的视频轨道和音频轨道"""
+    videos, audios = {}, {}
+    for path in files:
+        stem, ext = os.path.splitext(path)
+        ext = ext.lower()
+        if ext in VIDEO_EXTS:
+            videos[stem] = path
+        elif ext in AUDIO_EXTS:
+            audios[stem] = path
+    return [MuxTask(videos[stem], audios[stem], stem + ".mp4") for stem in videos if stem in audios]
+
+
+def mux_tool(options):
+    """(ffmpeg, mp4box)：与 BBDown 一样，勾选了 --use-mp4box 时使用 MP4Box；指定的程序不存在时在 PATH 中查找"""
+    if options.use_mp4box:
+        path = options.mp4box_path
+        return "", path if path and os.path.exists(path) else "MP4Box"
+    path = options.ffmpeg_path
+    return path if path and os.path.exists(path) else "ffmpeg", ""
+
+
+def mux_argv(task, output, ffmpeg="ffmpeg", mp4box=""):
+    """把 task 的两个轨道不重新编码地合并到 output"""
+    if mp4box:
+        return [mp4box, "-quiet", "-add", f"{task.video}#video", "-add", f"{task.audio}#audio", "-new", output]
+    return [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", "-i", task.video, "-i", task.audio,
+            "-map", "0:v", "-map", "1:a", "-c", "copy", "-movflags", "+faststart", output]
+
+
+def temp_output(task):
+    # 先写入临时文件，成功后再替换，混流失败时轨道文件保持原样
+    return os.path.splitext(task.output)[0] + ".muxing.mp4"
+
+
+def finish(task):
+    """混流成功后用结果替换视频轨道，删除音频轨道"""
+    os.replace(temp_output(task), task.output)
+    for path in (task.video, task.audio):
+        if path != task.output:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def muxed_files(files, results):
+    """混流后任务的文件：去掉已合并的轨道，加上混流结果"""
+    merged = set()
+    outputs = []
+    for result in results:
+        if result.returncode == 0:
+            merged.update((result.task.video, result.task.audio))
+            outputs.append(result.task.output)
+    return [f for f in files if f not in merged] + outputs
+
+
+class MuxQueue:
+    """同时运行不超过 workers 个混流进程的队列，进程由 Supervisor 启动
+
+    submit() 可以在任意线程调用；回调在 Supervisor 的线程中调用。
+    """
+    def __init__(self, workers=MUX_WORKERS):
+        self.workers = workers
+        self._pending = deque()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def set_workers(self, workers):
+        with self._lock:
+            self.workers = workers
+        self._start()
+
+    def submit(self, tasks, tool, callback):
+        """混流一个下载任务的所有轨道，全部结束后调用 callback([MuxResult, ...])"""
+        results = []
+        if not tasks:
+            callback(results)
+            return
+
+        def done(result):
+            # 同一任务的轨道都在 Supervisor 线程中结束，不需要加锁
+            results.append(result)
+            if len(results) == len(tasks):
+                callback(results)
+
+        with self._lock:
+            self._pending.extend((task, tool, done) for task in tasks)
+        self._start()
+
+    def _start(self):
+        from BBDown_GUI.supervisor import get_supervisor
+        while True:
+            with self._lock:
+                if not self._pending or self._running >= self.workers:
+                    return
+                task, tool, done = self._pending.popleft()
+                self._running += 1
+            lines = []
+            argv = mux_argv(task, temp_output(task), *tool)
+            get_supervisor().spawn(argv, lines.append,
+                                   lambda returncode, task=task, lines=lines, done=done:
+                                   self._exit(task, returncode, lines, done))
+
+    def _exit(self, task, returncode, lines, done):
+        if returncode == 0:
+            try:
+                finish(task)
+            except OSError as e:
+                returncode = -1
+                lines.append(f"{e}\n")
+        else:
+            try:
+                os.remove(temp_output(task))
+            except OSError:
+                pass
+        with self._lock:
+            self._running -= 1
+        done(MuxResult(task, returncode, tuple(line.rstrip() for line in lines if line.strip())))
+        self._start()
+
+
+_queue = None
+
+
+def get_mux_queue():
+    """进程内共用的混流队列"""
+    global _queue
+    if _queue is None:
+        _queue = MuxQueue()
+    return _queue
@@ -0,0 +1,303 @@
+import os
+import re
+import sys
+from typing import NamedTuple, Optional
+
+from BBDown_GUI.tool import get_workdir, add_exe_suffix
+
+# 下拉框选项，顺序与界面一致
+SOURCE = ['', '-tv', '-app', '-intl']
+ENCODING = ['', 'AVC', 'AV1', 'HEVC']
+DFN_MORE = ['优先下载最高画质', '8K 超高清', '杜比视界', 'HDR 真彩', '4K 超清', '1080P 高帧率', '1080P 高码率', '720P 高帧率']
+
+# -p 的取值：ALL、NEW、LAST 或 1,2 / 3-5 这样的序号
+_re_pages = re.compile(r"^(ALL|NEW|LAST|\d+(-\d+)?(,\d+(-\d+)?)*)$", re.I)
+
+
+def default_config():
+    """界面的初始状态（没有 config.json 时使用）"""
+    workdir = get_workdir()
+    return {
+        "checkBox_ffmpeg": True,
+        "checkBox_mt": True,
+        "checkBox_force_http": True,
+        "checkBox_enable_proxy": True,
+        "radioButton_p_current": True,
+        "radioButton_dfn_priority": True,
+        "lineEdit_ffmpeg": os.path.join(workdir, add_exe_suffix("ffmpeg")),
+        "lineEdit_aria2c_path": os.path.join(workdir, add_exe_suffix("aria2c")),
+        "lineEdit_dir": os.path.join(workdir, "Download"),
+        "advanced": False,
+    }
+
+
+class _Config:
+    """按控件名读取选项，缺少的项取该类控件的初始值"""
+    def __init__(self, config):
+        self._config = config
+
+    def __getattr__(self, name):
+        if name in self._config:
+            return self._config[name]
+        if name.startswith("lineEdit_"):
+            return ""
+        if name.startswith("comboBox_"):
+            return 0
+        return False
+
+
+class BBDownOptions(NamedTuple):
+    """一次 BBDown 调用的全部参数
+
+    不可变、可哈希：参数完全相同的任务可以直接比较去重；
+    to_dict() / from_dict() 用于保存到队列和下载记录。
+    """
+    url: str
+    dfn_priority: str = ""
+    source: str = ""
+    encoding_priority: str = ""
+    ffmpeg_path: str = ""
+    pages: str = ""
+    audio_only: bool = False
+    video_only: bool = False
+    sub_only: bool = False
+    danmaku: bool = False
+    interactive: bool = False
+    only_show_info: bool = False
+    hide_streams: bool = False
+    debug: bool = False
+    access_token: str = ""
+    cookie: str = ""
+    skip_subtitle: bool = False
+    skip_cover: bool = False
+    skip_mux: bool = False
+    skip_ai: Optional[bool] = None
+    use_mp4box: bool = False
+    mp4box_path: str = ""
+    multi_thread: Optional[bool] = None
+    force_http: Optional[bool] = None
+    language: str = ""
+    show_all: bool = False
+    delay_per_page: str = ""
+    use_aria2c: bool = False
+    aria2c_path: str = ""
+    aria2c_proxy: str = ""
+    aria2c_args: str = ""
+    file_pattern: str = ""
+    multi_file_pattern: str = ""
+    host: str = ""
+    ep_host: str = ""
+    area: str = ""
+    work_dir: str = ""
+
+    @classmethod
+    def from_config(cls, config, url=None, validate=True):
+        """根据界面选项（与 config.json 格式一致）生成参数，url 为空时使用 lineEdit_url
+
+        只需要下载目录、文件名模板等设置时 validate 为 False，不检查参数
+        """
+        c = _Config(config)
+        o = {}
+
+        # 下载地址
+        o["url"] = (c.lineEdit_url if url is None else url).strip()
+
+        # 画质选择
+        if c.radioButton_dfn_priority:
+            pass
+        elif c.radioButton_dfn_1080P:
+            o["dfn_priority"] = "1080P 高清"
+        elif c.radioButton_dfn_720P:
+            o["dfn_priority"] = "720P 高清"
+        elif c.radioButton_dfn_480P:
+            o["dfn_priority"] = "480P 清晰"
+        elif c.radioButton_dfn_360P:
+            o["dfn_priority"] = "360P 流畅"
+        elif c.radioButton_dfn_more:
+            if c.comboBox_dfn_more != 0:
+                o["dfn_priority"] = DFN_MORE[c.comboBox_dfn_more]
+
+        # 下载源、视频编码
+        o["source"] = SOURCE[c.comboBox_source].lstrip("-")
+        o["encoding_priority"] = ENCODING[c.comboBox_encoding]
+
+        # 指定FFmpeg路径
+        if c.checkBox_ffmpeg:
+            o["ffmpeg_path"] = c.lineEdit_ffmpeg
+
+        # 下载分P选项
+        if c.radioButton_p_all:
+            o["pages"] = "ALL"
+        elif c.radioButton_p_new:
+            o["pages"] = "NEW"
+
+        # 高级选项
+        if c.advanced:
+            o["audio_only"] = c.checkBox_audio_only
+            o["video_only"] = c.checkBox_video_only
+            o["sub_only"] = c.checkBox_sub_only
+            o["danmaku"] = c.checkBox_danmaku
+            o["interactive"] = c.checkBox_ia
+            o["only_show_info"] = c.checkBox_info
+            o["hide_streams"] = c.checkBox_hs
+            o["debug"] = c.checkBox_debug
+            if c.checkBox_token:
+                o["access_token"] = c.lineEdit_token
+            if c.checkBox_c:
+                o["cookie"] = c.lineEdit_c
+            o["skip_subtitle"] = c.checkBox_skip_subtitle
+            o["skip_cover"] = c.checkBox_skip_cover
+            o["skip_mux"] = c.checkBox_skip_mux
+            o["skip_ai"] = c.checkBox_skip_ai
+            o["use_mp4box"] = c.checkBox_mp4box
+            if c.checkBox_mp4box_path:
+                o["mp4box_path"] = c.lineEdit_mp4box_path
+            o["multi_thread"] = c.checkBox_mt
+            o["force_http"] = c.checkBox_force_http
+            if c.checkBox_language:
+                o["language"] = c.lineEdit_language
+            o["show_all"] = c.checkBox_p_show_all
+            # 指定分P优先于“下载全部/最新分P”
+            if c.checkBox_p:
+                o["pages"] = c.lineEdit_p.replace(" ", "")
+            if c.checkBox_p_delay:
+                o["delay_per_page"] = c.lineEdit_p_delay
+            o["use_aria2c"] = c.checkBox_use_aria2c
+            if c.checkBox_aria2c_path:
+                o["aria2c_path"] = c.lineEdit_aria2c_path
+            if c.checkBox_aria2c_proxy:
+                o["aria2c_proxy"] = c.lineEdit_aria2c_proxy
+            if c.checkBox_aria2c_args:
+                o["aria2c_args"] = c.lineEdit_aria2c_args
+            if c.checkBox_F:
+                o["file_pattern"] = c.lineEdit_F
+            if c.checkBox_M:
+                o["multi_file_pattern"] = c.lineEdit_M
+            if c.checkBox_enable_proxy:
+                if c.checkBox_host:
+                    o["host"] = c.lineEdit_host
+                if c.checkBox_ep_host:
+                    o["ep_host"] = c.lineEdit_ep_host
+                if c.checkBox_area:
+                    o["area"] = c.lineEdit_area
+
+        # 下载路径
+        o["work_dir"] = c.lineEdit_dir
+
+        options = cls(**o)
+        if validate:
+            options.validate()
+        return options
+
+    def validate(self):
+        """检查参数取值，不合法时抛出 ValueError"""
+        if not self.url:
+            raise ValueError("视频地址不能为空")
+        if self.source not in ("", "tv", "app", "intl"):
+            raise ValueError(f"未知的下载源: {self.source}")
+        if self.encoding_priority not in ENCODING:
+            raise ValueError(f"未知的视频编码: {self.encoding_priority}")
+        if self.pages and not _re_pages.match(self.pages):
+            raise ValueError(f"分P格式不正确: {self.pages}")
+        if self.delay_per_page and not self.delay_per_page.isdigit():
+            raise ValueError(f"分P下载时间间隔应为整数秒: {self.delay_per_page}")
+        for name in ("language", "aria2c_proxy", "host", "ep_host", "area"):
+            if any(ch.isspace() for ch in getattr(self, name)):
+                raise ValueError(f"{name} 不能包含空白字符")
+
+    def to_argv(self):
+        """生成 BBDown 的参数列表（不含程序本身）"""
+        argv = [self.url]
+        if self.dfn_priority:
+            argv += ["--dfn-priority", self.dfn_priority]
+        if self.source:
+            argv.append("-" + self.source)
+        if self.encoding_priority:
+            argv += ["--encoding-priority", self.encoding_priority]
+        if self.ffmpeg_path:
+            argv += ["--ffmpeg-path", self.ffmpeg_path]
+        if self.pages:
+            argv += ["-p", self.pages]
+        for flag, enabled in (
+            ("--audio-only", self.audio_only),
+            ("--video-only", self.video_only),
+            ("--sub-only", self.sub_only),
+            ("-dd", self.danmaku),
+            ("-ia", self.interactive),
+            ("-info", self.only_show_info),
+            ("-hs", self.hide_streams),
+            ("--debug", self.debug),
+        ):
+            if enabled:
+                argv.append(flag)
+        if self.access_token:
+            argv += ["-token", self.access_token]
+        if self.cookie:
+            argv += ["-c", self.cookie]
+        for flag, enabled in (
+            ("--skip-subtitle", self.skip_subtitle),
+            ("--skip-cover", self.skip_cover),
+            ("--skip-mux", self.skip_mux),
+        ):
+            if enabled:
+                argv.append(flag)
+        if self.skip_ai is not None:
+            argv += ["--skip-ai", _bool(self.skip_ai)]
+        if self.use_mp4box:
+            argv.append("--use-mp4box")
+        if self.mp4box_path:
+            argv += ["--mp4box-path", self.mp4box_path]
+        if self.multi_thread is not None:
+            argv += ["-mt", _bool(self.multi_thread)]
+        if self.force_http is not None:
+            argv += ["--force-http", _bool(self.force_http)]
+        if self.language:
+            argv += ["--language", self.language]
+        if self.show_all:
+            argv.append("--show-all")
+        if self.delay_per_page:
+            argv += ["--delay-per-page", self.delay_per_page]
+        if self.use_aria2c:
+            argv.append("--use-aria2c")
+        if self.aria2c_path:
+            argv += ["--aria2c-path", self.aria2c_path]
+        if self.aria2c_proxy:
+            argv += ["--aria2c-proxy", self.aria2c_proxy]
+        if self.aria2c_args:
+            argv += ["--aria2c-args", self.aria2c_args]
+        if self.file_pattern:
+            argv += ["-F", self.file_pattern]
+        if self.multi_file_pattern:
+            argv += ["-M", self.multi_file_pattern]
+        if self.host:
+            argv += ["--host", self.host]
+        if self.ep_host:
+            argv += ["--ep-host", self.ep_host]
+        if self.area:
+            argv += ["--area", self.area]
+        if self.work_dir:
+            argv += ["--work-dir", self.work_dir]
+        return argv
+
+    def to_dict(self):
+        return dict(self._asdict())
+
+    @classmethod
+    def from_dict(cls, data):
+        # 忽略未知字段，兼容旧版本保存的数据
+        options = cls(**{k: v for k, v in data.items() if k in cls._fields})
+        options.validate()
+        return options
+
+
+def _bool(value):
+    return "true" if value else "false"
+
+
+def format_argv(argv):
+    """把参数列表转成可以直接粘贴到终端的命令行文本"""
+    if sys.platform == "win32":
+        import subprocess
+        return subprocess.list2cmdline(argv)
+    import shlex
+    return " ".join(shlex.quote(arg) for arg in argv)
@@ -0,0 +1,76 @@
+"""按分P 拆分任务
+
+-p ALL 的任务由一个 BBDown 进程逐个下载分P，分P 很多时很慢。
+这里按缓存的分P 列表把任务拆成多个 -p 范围，由下载队列并行下载，全部完成后合并为一个任务。
+"""
+import re
+
+from BBDown_GUI.ids import selects_part
+
+# -p 中的序号和范围，如 1,3-5
+_re_range = re.compile(r"^(\d+)(?:-(\d+))?$")
+
+
+def expand_pages(pages, count=None):
+    """-p 参数对应的分P 序号列表
+
+    count 为分P 总数，未知时 ALL、LAST 无法展开；NEW 等无法离线确定的取值返回 None。
+    不加 -p 时 BBDown 下载全部分P，与 ALL 相同。
+    """
+    text = pages.strip().upper()
+    if text in ("", "ALL"):
+        return list(range(1, count + 1)) if count else None
+    if text == "LAST":
+        return [count] if count else None
+    numbers = []
+    for item in text.split(","):
+        m = _re_range.match(item)
+        if m is None:
+            return None
+        start = int(m.group(1))
+        end = int(m.group(2) or start)
+        numbers.extend(range(start, end + 1))
+    return list(dict.fromkeys(numbers))
+
+
+def format_pages(numbers):
+    """[1, 2, 3, 5] -> "1-3,5" """
+    items = []
+    for n in numbers:
+        if items and n == items[-1][1] + 1:
+            items[-1][1] = n
+        else:
+            items.append([n, n])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in items)
+
+
+def can_split(options):
+    """任务有可能拆分（还需要知道分P 总数）
+
+    不加 -p 时，地址中的 ?p=3、ep12345 只下载这一个分P 或这一集，只有不带这些的地址才下载全部分P。
+    """
+    text = options.pages.strip().upper()
+    if options.only_show_info or text == "NEW":
+        return False
+    return text != "" or not selects_part(options.url)
+
+
+def split_options(options, info, size, done=frozenset()):
+    """按每 size 个分P 拆分后各个任务的参数
+
+    info 为缓存的 VideoInfo，done 为已下载完成的分P；不需要拆分（只有一段）或 -p 超出范围时返回 None，
+    由 BBDown 按原参数下载；指定的分P 都已完成时返回空列表。
+    """
+    if size <= 0 or info is None or not info.page_count or not can_split(options):
+        return None
+    numbers = expand_pages(options.pages, info.page_count)
+    if numbers is None:
+        return None
+    numbers = [n for n in numbers if n <= info.page_count]
+    left = [n for n in numbers if n not in done]
+    if not left:
+        return [] if numbers and done else None
+    chunks = [left[i:i + size] for i in range(0, len(left), size)]
+    if len(chunks) == 1 and not done:
+        return None
+    return [options._replace(pages=format_pages(chunk)) for chunk in chunks]
@@ -0,0 +1,300 @@
+"""下载完成后的处理：校验和、移动、重命名、截取缩略图等
+
+处理步骤写成 "名称 参数"，以分号分隔，如::
+
+    checksum sha256; thumbnail 5; move /mnt/nas/{video_id}
+
+每个任务的各步骤在单独的进程池中依次执行，进程数与同时下载数分开设置，
+CPU 密集的处理与下载同时进行，不必等所有下载结束后再用脚本扫描下载目录。
+名称也可以写成 "模块:函数"，调用自定义的步骤，函数签名与内置步骤相同。
+"""
+import datetime
+import hashlib
+import importlib
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+from typing import NamedTuple
+
+from BBDown_GUI.ids import video_id
+
+# 进程池默认的进程数
+POST_WORKERS = 2
+# 截取缩略图的视频扩展名
+VIDEO_EXTS = {".mp4", ".mkv", ".flv"}
+
+# 外部命令不弹出控制台窗口
+_run_kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
+
+class PostTask(NamedTuple):
+    url: str
+    video_id: str
+    work_dir: str
+    # 下载得到的文件
+    files: tuple
+    # ((名称, 参数), ...)
+    steps: tuple
+    ffmpeg: str = ""
+
+
+class PostResult(NamedTuple):
+    # 处理后的文件（移动、重命名后的路径，加上新生成的文件）
+    files: tuple
+    lines: tuple
+    # 失败的步骤和原因，成功时为空
+    error: str = ""
+
+
+def _fields(task, path=None):
+    """模板中可用的字段：{video_id} {date}，以及按文件处理时的 {name} {ext}"""
+    fields = {"video_id": task.video_id, "date": datetime.date.today().isoformat()}
+    if path is not None:
+        name, ext = os.path.splitext(os.path.basename(path))
+        fields.update(name=name, ext=ext)
+    return fields
+
+
+def _relative(task, path):
+    """文件在下载目录中的相对路径（-F / -M 模板可能包含子目录）"""
+    try:
+        rel = os.path.relpath(path, task.work_dir) if task.work_dir else ""
+    except ValueError:
+        # Windows 上不在同一个盘
+        rel = ""
+    if not rel or rel.startswith(os.pardir):
+        return os.path.basename(path)
+    return rel
+
+
+def checksum(task, files, arg, log):
+    """在每个文件旁写入 sha256sum 格式的校验文件（文件名.sha256），arg 为算法名"""
+    algo = (arg or "sha256").lower()
+    if algo not in hashlib.algorithms_available:
+        raise ValueError(f"不支持的校验算法: {algo}")
+    result = list(files)
+    for path in files:
+        digest = hashlib.new(algo)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sidecar = f"{path}.{algo}"
+        with open(sidecar, "w", encoding="utf-8") as f:
+            f.write(f"{digest.hexdigest()} *{os.path.basename(path)}\n")
+        log(f"{algo} {digest.hexdigest()} {path}")
+        result.append(sidecar)
+    return result
+
+
+def move(task, files, arg, log):
+    """移动到 arg 目录（可以是网络路径），保留文件在下载目录中的子目录"""
+    if not arg:
+        raise ValueError("move 需要目标目录")
+    target = arg.format(**_fields(task))
+    result = []
+    for path in files:
+        dest = os.path.join(target, _relative(task, path))
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.move(path, dest)
+        log(f"{path} -> {dest}")
+        result.append(dest)
+    return result
+
+
+def rename(task, files, arg, log):
+    """按模板重命名，如 "{video_id}_{name}"，扩展名不变"""
+    if not arg:
+        raise ValueError("rename 需要文件名模板")
+    result = []
+    for path in files:
+        fields = _fields(task, path)
+        dest = os.path.join(os.path.dirname(path), arg.format(**fields) + fields["ext"])
+        if dest != path:
+            if os.path.exists(dest):
+                raise FileExistsError(f"文件已存在: {dest}")
+            os.rename(path, dest)
+            log(f"{path} -> {dest}")
+        result.append(dest)
+    return result
+
+
+def thumbnail(task, files, arg, log):
+    """用 ffmpeg 截取视频第 arg 秒（默认 1）的画面，保存为 文件名-thumb.jpg"""
+    seconds = arg or "1"
+    float(seconds)
+    result = list(files)
+    for path in files:
+        if os.path.splitext(path)[1].lower() not in VIDEO_EXTS:
+            continue
+        image = os.path.splitext(path)[0] + "-thumb.jpg"
+        subprocess.run([task.ffmpeg or "ffmpeg", "-v", "error", "-y", "-ss", seconds, "-i", path,
+                        "-frames:v", "1", image], check=True, capture_output=True, **_run_kwargs)
+        log(image)
+        result.append(image)
+    return result
+
+
+def command(task, files, arg, log):
+    """对每个文件运行一条命令，{file} 替换为文件路径，如 "command python tag.py {file}" """
+    if not arg:
+        raise ValueError("command 需要命令")
+    words = shlex.split(arg, posix=sys.platform != "win32")
+    for path in files:
+        argv = [word.format(file=path, **_fields(task, path)) for word in words]
+        proc = subprocess.run(argv, capture_output=True, text=True, errors="replace", **_run_kwargs)
+        for line in (proc.stdout + proc.stderr).splitlines():
+            log(line)
+        if proc.returncode != 0:
+            raise RuntimeError(f"命令返回 {proc.returncode}: {path}")
+    return files
+
+
+# 内置的处理步骤：名称 -> 函数(task, files, arg, log)，返回处理后的文件列表
+STEPS = {
+    "checksum": checksum,
+    "move": move,
+    "rename": rename,
+    "thumbnail": thumbnail,
+    "command": command,
+}
+
+
+def parse_steps(text):
+    """ "checksum sha256; move D:/NAS" -> (("checksum", "sha256"), ("move", "D:/NAS"))"""
+    steps = []
+    for item in text.split(";"):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, arg = item.partition(" ")
+        if name not in STEPS and ":" not in name:
+            raise ValueError(f"未知的处理步骤: {name}")
+        steps.append((name, arg.strip()))
+    return tuple(steps)
+
+
+def _resolve(name):
+    if name in STEPS:
+        return STEPS[name]
+    module, _, func = name.partition(":")
+    return getattr(importlib.import_module(module), func)
+
+
+def run(task):
+    """在进程池中依次执行各步骤；出错时停止后续步骤，错误写在 PostResult.error 中"""
+    lines = []
+    files = list(task.files)
+    for name, arg in task.steps:
+        lines.append(f"[{name}] {arg}".rstrip())
+        try:
+            files = list(_resolve(name)(task, files, arg, lines.append))
+        except Exception as e:
+            return PostResult(tuple(files), tuple(lines), f"{name}: {e}")
+    return PostResult(tuple(files), tuple(lines))
+
+
+def make_task(options, files, steps):
+    return PostTask(options.url, video_id(options.url) or options.url, options.work_dir, tuple(files), tuple(steps),
+                    options.ffmpeg_path)
+
+
+def _result(future, task):
+    if future.cancelled():
+        return PostResult(task.files, (), "已取消")
+    error = future.exception()
+    if error is not None:
+        # 处理进程意外退出等
+        return PostResult(task.files, (), str(error) or type(error).__name__)
+    return future.result()
+
+
+def _new_pool(workers):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    # 图形界面有多个线程，不使用 fork
+    return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class PostProcessor:
+    """下载后处理的进程池，进程在第一次提交时才启动"""
+    def __init__(self, workers=POST_WORKERS):
+        self.workers = workers
+        self._pool = None
+        # 回调在进程池的管理线程中调用，也会更换进程池
+        self._lock = threading.Lock()
+
+    def set_workers(self, workers):
+        if workers == self.workers:
+            return
+        self.workers = workers
+        # 已提交的处理在原来的进程池中完成
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def submit(self, task, callback):
+        """提交处理，结束后在进程池的管理线程中调用 callback(PostResult)
+
+        处理进程意外退出时整个进程池都不能再使用，其中的处理都会失败。不知道是哪个处理导致的，
+        受影响的处理各自在单独的进程中重新执行一次，只有再次失败的处理报告为失败。
+        """
+        from concurrent.futures.process import BrokenProcessPool
+        pool = self._get_pool()
+        try:
+            future = pool.submit(run, task)
+        except BrokenProcessPool:
+            self._drop(pool)
+            return self._retry(task, callback)
+        future.add_done_callback(lambda f: self._done(pool, f, task, callback))
+        return future
+
+    def _done(self, pool, future, task, callback):
+        from concurrent.futures.process import BrokenProcessPool
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._drop(pool)
+            self._retry(task, callback)
+            return
+        callback(_result(future, task))
+
+    def _retry(self, task, callback):
+        pool = _new_pool(1)
+        future = pool.submit(run, task)
+        future.add_done_callback(lambda f: callback(_result(f, task)))
+        # 处理结束后进程自动退出
+        pool.shutdown(wait=False)
+        return future
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = _new_pool(self.workers)
+            return self._pool
+
+    def _drop(self, pool):
+        """不再使用损坏的进程池，下次提交时启动新的进程池"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def shutdown(self, wait=True):
+        """取消还没有开始的处理，wait 为 True 时等待正在进行的处理完成（避免文件只移动了一半）"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_processor = None
+
+
+def get_postprocessor():
+    """进程内共用的后处理进程池"""
+    global _processor
+    if _processor is None:
+        _processor = PostProcessor()
+    return _processor
@@ -0,0 +1,74 @@
+"""下载方案：多套命名的选项保存在同一个 profiles.db 中
+
+每个方案一行，按名称建主键索引；列出方案只读取名称，方案内容在第一次使用时才读取并缓存。
+方案内容与 config.json 格式相同（不含视频地址等与方案无关的项），读取时同样经过 config.upgrade 升级。
+"""
+import json
+import os
+import time
+
+from BBDown_GUI.config import CONFIG_VERSION, upgrade
+from BBDown_GUI.tool import get_workdir
+
+# 不随方案保存的项
+EXCLUDE = ("lineEdit_url", "lineEdit_bbdown")
+
+
+def default_path():
+    return os.path.join(get_workdir(), "profiles.db")
+
+
+class ProfileStore:
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        self._conn = None
+        self._cache = {}
+
+    def _connect(self):
+        if self._conn is None:
+            # 没有保存过方案时启动不需要导入 sqlite3
+            import sqlite3
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                "name TEXT PRIMARY KEY, version INTEGER NOT NULL, data TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+        return self._conn
+
+    def names(self):
+        # 方案库还不存在时不创建文件
+        if self._conn is None and not os.path.exists(self.path):
+            return []
+        return [name for name, in self._connect().execute("SELECT name FROM profiles ORDER BY name")]
+
+    def get(self, name):
+        """返回方案的完整选项，方案不存在时返回 None"""
+        if name not in self._cache:
+            if self._conn is None and not os.path.exists(self.path):
+                return None
+            row = self._connect().execute("SELECT version, data FROM profiles WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            data = json.loads(row[1])
+            data["version"] = row[0]
+            self._cache[name] = upgrade(data)
+        return dict(self._cache[name])
+
+    def save(self, name, config):
+        data = {k: v for k, v in config.items() if k not in EXCLUDE}
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO profiles (name, version, data, updated) VALUES (?, ?, ?, ?)",
+                (name, CONFIG_VERSION, json.dumps(data, ensure_ascii=False), time.time()),
+            )
+        self._cache.pop(name, None)
+
+    def delete(self, name):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM profiles WHERE name = ?", (name,))
+        self._cache.pop(name, None)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,127 @@
+import re
+import time
+from collections import namedtuple
+
+# 事件类型
+PART = "part"            # value: 分P序号
+TRACK = "track"          # value: (轨道类型, 描述)，如 ("视频", "[1080P 高清] [1920x1080] [AVC] ...")
+STAGE = "stage"          # value: 当前下载内容，如 "视频" "音频" "字幕"
+PROGRESS = "progress"    # value: (百分比, 速度 字节/秒 或 None, 剩余秒数 或 None)
+MUX = "mux"              # value: None
+DONE = "done"            # value: None
+ERROR = "error"          # value: 错误信息；BBDown 可能会重试，只作为提示
+FAILED = "failed"        # value: 错误信息，只在进程以非 0 退出码结束时发出
+
+Event = namedtuple("Event", ["kind", "value"])
+
+# BBDown 日志形如 "[2023-01-01 12:00:00.000] - 开始解析P1..."
+_re_log = re.compile(r"^\[[\d\-: .]+\] - ")
+_re_part = re.compile(r"^开始解析P(\d+)")
+_re_track = re.compile(r"^\[(视频|音频)\] (.*)")
+_re_stage = re.compile(r"^(?:开始)?(?:多线程)?下载P\d+(视频|音频|字幕)")
+_re_percent = re.compile(r"(\d{1,3}(?:\.\d+)?)%")
+_re_speed = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?)i?B/s", re.I)
+_re_error = re.compile(r"ERROR|Exception|失败")
+
+_units = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def format_speed(speed):
+    """字节/秒 -> 便于阅读的文本"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if speed < 1024 or unit == "GB":
+            return f"{speed:.2f} {unit}/s"
+        speed /= 1024
+
+
+def format_eta(seconds):
+    m, s = divmod(int(seconds), 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
+
+class ProgressParser:
+    """把 BBDown 的输出逐行解析成结构化事件
+
+    每行只做常数次正则匹配，不保留历史输出。
+    """
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.part = None
+        self.stage = None
+        self.percent = 0.0
+        self.speed = None
+        self.done = False
+        self.failed = False
+        # 最近一条错误信息
+        self.error = None
+        self._selected = False
+        self._stage_start = None
+
+    def feed(self, line):
+        """解析一行输出，返回 Event，无关的行返回 None"""
+        text = line.strip()
+        if not text:
+            return None
+        m = _re_log.match(text)
+        if m is None:
+            # 不带时间戳的行只可能是进度条
+            return self._progress(text)
+        text = text[m.end():]
+        m = _re_part.match(text)
+        if m:
+            self.part = int(m.group(1))
+            self._selected = False
+            return Event(PART, self.part)
+        if text.startswith("已选择的流"):
+            self._selected = True
+            return None
+        if self._selected:
+            m = _re_track.match(text)
+            if m:
+                return Event(TRACK, (m.group(1), m.group(2)))
+        m = _re_stage.match(text)
+        if m:
+            self.stage = m.group(1)
+            self.percent = 0.0
+            self.speed = None
+            self._stage_start = None
+            return Event(STAGE, self.stage)
+        if text.startswith("开始合并") or text.startswith("开始混流"):
+            return Event(MUX, None)
+        if text.startswith("任务完成"):
+            self.done = True
+            return Event(DONE, None)
+        if _re_error.search(text):
+            # "失败, 重试" 等临时错误之后仍可能成功，最终状态由退出码决定
+            self.error = text
+            return Event(ERROR, text)
+        return None
+
+    def _progress(self, text):
+        m = _re_percent.search(text)
+        if m is None:
+            return None
+        percent = min(float(m.group(1)), 100.0)
+        now = self.clock()
+        if self._stage_start is None or percent < self.percent:
+            self._stage_start = (now, percent)
+        self.percent = percent
+        m = _re_speed.search(text)
+        if m:
+            self.speed = float(m.group(1)) * _units[m.group(2).upper()]
+        # 按本阶段的平均进度速度估算剩余时间
+        eta = None
+        start_time, start_percent = self._stage_start
+        if percent > start_percent:
+            eta = (now - start_time) * (100.0 - percent) / (percent - start_percent)
+        return Event(PROGRESS, (percent, self.speed, eta))
+
+    def finish(self, returncode):
+        """子进程退出后调用，根据退出码补发最终事件"""
+        if returncode == 0:
+            self.done = True
+            return Event(DONE, None)
+        self.failed = True
+        message = f"退出码 {returncode}"
+        return Event(FAILED, f"{message}: {self.error}" if self.error else message)
@@ -0,0 +1,127 @@
+"""启动耗时记录：各模块的导入耗时和首个窗口的显示时间
+
+    python -m BBDown_GUI --profile-startup startup.txt
+
+enable() 之后导入的模块都会记录执行耗时（自身耗时 / 含子模块的累计耗时），
+mark() 记录启动过程中的时间点，write() 写出报告。时间从导入本模块起算，毫秒。
+"""
+import sys
+import time
+
+_start = time.perf_counter()
+_marks = []
+_records = []
+_stack = []
+_finder = None
+
+
+class _TimedLoader:
+    """包装原来的 loader，记录 create_module + exec_module 的耗时（扩展模块主要耗时在 create_module）"""
+    def __init__(self, loader):
+        self._loader = loader
+        self._create_time = 0.0
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        start = time.perf_counter()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._create_time = time.perf_counter() - start
+
+    def exec_module(self, module):
+        # 按开始导入的顺序记录，完成后再填入耗时
+        index = len(_records)
+        _records.append(None)
+        depth = len(_stack)
+        _stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start + self._create_time
+            children = _stack.pop()
+            if _stack:
+                _stack[-1] += total
+            _records[index] = (depth, module.__name__, total - children, total)
+            # 导入完成后恢复原来的 loader
+            if getattr(module, "__loader__", None) is self:
+                module.__loader__ = self._loader
+            spec = getattr(module, "__spec__", None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+
+
+class _Finder:
+    """放在 sys.meta_path 最前面，由其余的 finder 查找模块，再替换成 _TimedLoader"""
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader)
+                return spec
+        return None
+
+    def invalidate_caches(self):
+        pass
+
+
+def enable():
+    global _finder
+    if _finder is None:
+        _finder = _Finder()
+        sys.meta_path.insert(0, _finder)
+
+
+def disable():
+    global _finder
+    if _finder is not None:
+        sys.meta_path.remove(_finder)
+        _finder = None
+
+
+def mark(name):
+    _marks.append((name, time.perf_counter()))
+
+
+def elapsed(t):
+    return (t - _start) * 1000
+
+
+def report():
+    lines = ["# 时间点（毫秒）"]
+    for name, t in _marks:
+        lines.append(f"{elapsed(t):10.1f}  {name}")
+    lines.append("# 模块导入：自身耗时 | 累计耗时 | 模块（毫秒，缩进表示由上一级导入）")
+    for record in _records:
+        if record is None:
+            continue
+        depth, name, self_time, total = record
+        lines.append(f"{self_time * 1000:10.2f} | {total * 1000:10.2f} | {'  ' * depth}{name}")
+    return "\n".join(lines) + "\n"
+
+
+def write(path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report())
+
+
+def on_first_paint(widget, callback):
+    """widget 第一次绘制完成后调用 callback"""
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                widget.removeEventFilter(self)
+                # 等这次绘制结束再回调
+                QTimer.singleShot(0, callback)
+            return False
+
+    watcher = PaintWatcher(widget)
+    widget.installEventFilter(watcher)
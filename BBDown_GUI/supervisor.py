@@ -0,0 +1,245 @@
+import asyncio
+import codecs
+import concurrent.futures
+import locale
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+
+# 按行切分输出，保留行尾的 \r 或 \n（\r 表示进度条原地刷新）
+_re_line = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)")
+
+# 停止任务时先请求退出（SIGTERM，Windows 上为 CTRL_BREAK_EVENT），超过这个时间（秒）仍未退出则强制结束
+KILL_GRACE = 5
+
+# 每个子进程单独一个进程组，停止时连同 BBDown 启动的 ffmpeg、aria2c 一起结束
+if sys.platform == "win32":
+    _group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _group_kwargs = {"start_new_session": True}
+
+
+class Process:
+    """由 Supervisor 管理的一个子进程"""
+    def __init__(self, supervisor, argv, on_output, on_exit, cwd=None, env=None, timeout=None):
+        self.supervisor = supervisor
+        self.argv = argv
+        self.on_output = on_output
+        self.on_exit = on_exit
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self.pid = None
+        self.returncode = None
+        self.timed_out = False
+        self.cancelled = False
+        self._task = None
+
+    def cancel(self):
+        """终止子进程及其进程组，可以在任意线程调用"""
+        self.supervisor.loop.call_soon_threadsafe(self._cancel)
+
+    def _cancel(self):
+        # 重复停止时不能打断正在进行的终止过程
+        if self._task is not None and not self.cancelled:
+            self.cancelled = True
+            self._task.cancel()
+
+
+class Supervisor:
+    """在单独的线程里运行一个 asyncio 事件循环，统一管理所有子进程
+
+    子进程的输出通过非阻塞管道读取，on_output / on_exit 回调在事件循环线程里调用，
+    回调内只应做线程安全的轻量操作（例如写入 LineBuffer）。
+    无论同时运行多少个任务，都只占用这一个线程。
+    """
+    def __init__(self):
+        self.loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        # 尚未结束的 Process，只在事件循环线程中修改
+        self._live = set()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run_loop, name="BBDown_GUI-supervisor", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self):
+        if sys.platform == "win32":
+            # Windows 上只有 Proactor 事件循环支持子进程
+            self.loop = asyncio.ProactorEventLoop()
+        else:
+            self.loop = asyncio.new_event_loop()
+            _attach_child_watcher(self.loop)
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        self.loop.run_forever()
+
+    def spawn(self, argv, on_output, on_exit, cwd=None, env=None, timeout=None):
+        """启动子进程，返回 Process
+
+        on_output(line) 每读到一行调用一次，on_exit(returncode) 在进程结束后调用一次；
+        进程无法启动时先用 on_output 报告原因，再以返回码 -1 调用 on_exit。
+        """
+        self.start()
+        process = Process(self, argv, on_output, on_exit, cwd, env, timeout)
+        self.loop.call_soon_threadsafe(self._create_task, process)
+        return process
+
+    def _create_task(self, process):
+        self._live.add(process)
+        process._task = self.loop.create_task(self._supervise(process))
+        process._task.add_done_callback(lambda _: self._live.discard(process))
+
+    def shutdown(self, timeout=KILL_GRACE + 1):
+        """停止所有子进程（连同各自的进程组）并等待回收，程序退出前调用
+
+        子进程在单独的会话中运行，不会随本程序退出或终端的 Ctrl+C 一起结束。
+        """
+        if self.loop is None:
+            return True
+        # 排在之前的 spawn 之后执行，不会漏掉刚启动的进程
+        future = asyncio.run_coroutine_threadsafe(self._cancel_all(), self.loop)
+        try:
+            future.result(timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            return False
+
+    async def _cancel_all(self):
+        tasks = [process._task for process in self._live]
+        for process in list(self._live):
+            process._cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _supervise(self, process):
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *process.argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=process.cwd,
+                env=process.env,
+                **_group_kwargs,
+            )
+        except asyncio.CancelledError:
+            process.returncode = -1
+            process.on_exit(-1)
+            return
+        except OSError as e:
+            process.on_output(f"{e}\n")
+            process.returncode = -1
+            process.on_exit(-1)
+            return
+        process.pid = proc.pid
+        try:
+            await asyncio.wait_for(self._read(proc, process.on_output), process.timeout)
+            await proc.wait()
+        except asyncio.TimeoutError:
+            process.timed_out = True
+            await self._terminate(proc)
+        except asyncio.CancelledError:
+            await self._terminate(proc)
+        process.returncode = proc.returncode
+        process.on_exit(proc.returncode)
+
+    async def _read(self, proc, on_output):
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        pending = ""
+        while True:
+            data = await proc.stdout.read(65536)
+            pending += decoder.decode(data, final=not data)
+            end = 0
+            for m in _re_line.finditer(pending):
+                on_output(m.group())
+                end = m.end()
+            pending = pending[end:]
+            if not data:
+                break
+        if pending:
+            on_output(pending)
+
+    async def _terminate(self, proc):
+        """结束整个进程组并回收子进程"""
+        if _signal_group(proc, force=False):
+            try:
+                await asyncio.wait_for(proc.wait(), KILL_GRACE)
+            except asyncio.TimeoutError:
+                pass
+        # 仍在运行的进程（包括 BBDown 退出后留下的 ffmpeg、aria2c）强制结束
+        if sys.platform == "win32":
+            if proc.returncode is None:
+                await self._taskkill(proc)
+        else:
+            _signal_group(proc, force=True)
+        await proc.wait()
+
+    async def _taskkill(self, proc):
+        # Windows 没有强制结束进程组的信号，用 taskkill /T 结束整个进程树
+        try:
+            killer = await asyncio.create_subprocess_exec(
+                "taskkill", "/T", "/F", "/PID", str(proc.pid),
+                stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+                # 无控制台的图形界面程序中不弹出控制台窗口
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+            await killer.wait()
+        except OSError:
+            pass
+        # taskkill 不可用或失败时至少结束 BBDown 本身
+        _signal_group(proc, force=True)
+
+
+def _signal_group(proc, force):
+    """向进程组发送信号；发送失败（进程组已退出，或没有控制台无法发送 CTRL_BREAK_EVENT）时返回 False"""
+    try:
+        if sys.platform == "win32":
+            if force:
+                proc.kill()
+            else:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            # start_new_session 使进程组 ID 等于 BBDown 的 pid
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except OSError:
+        # 进程组已经全部退出（macOS 上僵尸进程组返回 EPERM）；
+        # 无控制台的图形界面程序发送 CTRL_BREAK_EVENT 也会失败，由调用方直接强制结束
+        return False
+    return True
+
+
+def _attach_child_watcher(loop):
+    # Python 3.9 - 3.11 默认为每个子进程起一个等待线程，Linux 上改用 pidfd
+    if not sys.platform.startswith("linux") or not (3, 9) <= sys.version_info < (3, 12):
+        return
+    try:
+        watcher = asyncio.PidfdChildWatcher()
+        watcher.attach_loop(loop)
+        asyncio.set_child_watcher(watcher)
+    except (AttributeError, OSError, RuntimeError):
+        pass
+
+
+_supervisor = None
+
+
+def get_supervisor():
+    """进程内共用的 Supervisor，首次调用时启动"""
+    global _supervisor
+    if _supervisor is None:
+        _supervisor = Supervisor()
+        _supervisor.start()
+    return _supervisor
+
+
+def shutdown():
+    """停止共用 Supervisor 中的所有子进程，没有启动过时什么都不做"""
+    if _supervisor is not None:
+        _supervisor.shutdown()
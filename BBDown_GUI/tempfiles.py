@@ -0,0 +1,104 @@
+"""清理被停止的下载留下的临时文件
+
+BBDown 把分段下载的音视频放在下载目录中以 aid 命名的文件夹里，混流后删除；
+aria2c 还会留下 .aria2 控制文件。任务被停止后这些文件不会再被使用，只会占用磁盘。
+只清理被停止任务自己的 aid 文件夹（aid 来自 BBDown 输出中的 "获取aid结束"），
+输出文件夹也可能是纯数字（如标题为 2024、模板中使用 <aid>），不能按名称判断。
+拆分的子任务共用同一个 aid 文件夹，所以等该目录中的任务全部结束后再清理。
+"""
+import os
+import re
+
+# 临时文件的扩展名
+TEMP_EXTS = {".aria2", ".m4s", ".tmp", ".part"}
+
+_re_aid = re.compile(r"获取aid结束: (\d+)")
+
+
+def parse_aid(line):
+    """BBDown 输出中的 aid，不是这一行时返回 None"""
+    m = _re_aid.search(line)
+    return m.group(1) if m else None
+
+
+def find_temp(work_dir, aid, since):
+    """任务的临时文件：aid 文件夹中 since（时间戳）之后修改过的文件，以及下载目录中以 aid 开头的临时文件"""
+    found = []
+    if not aid or not aid.isdigit():
+        return found
+    for root, _, files in os.walk(os.path.join(work_dir, aid)):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.stat(path).st_mtime >= since:
+                    found.append(path)
+            except OSError:
+                pass
+    try:
+        entries = list(os.scandir(work_dir))
+    except OSError:
+        return found
+    for entry in entries:
+        try:
+            if (entry.is_file(follow_symlinks=False) and entry.name.startswith(aid + ".")
+                    and os.path.splitext(entry.name)[1].lower() in TEMP_EXTS and entry.stat().st_mtime >= since):
+                found.append(entry.path)
+        except OSError:
+            pass
+    return found
+
+
+def remove_temp(work_dir, aid, since):
+    """删除任务的临时文件和空文件夹，返回删除的文件数；aid 文件夹中原有的文件保持不变"""
+    removed = 0
+    for path in find_temp(work_dir, aid, since):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    if aid and aid.isdigit():
+        for root, _, _ in os.walk(os.path.join(work_dir, aid), topdown=False):
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass
+    return removed
+
+
+class TempCleaner:
+    """记录每个下载目录中正在运行的任务，目录空闲时返回需要清理的 aid 和时间范围"""
+    def __init__(self):
+        self._running = {}
+        # 目录 -> {被停止任务的 aid: 其中最早的开始时间}
+        self._stopped = {}
+
+    def begin(self, work_dir):
+        key = os.path.normcase(os.path.abspath(work_dir))
+        self._running[key] = self._running.get(key, 0) + 1
+
+    def end(self, work_dir, started, stopped, aid=None):
+        """任务结束；目录中已没有运行的任务时返回 {aid: since}（没有需要清理的为空），否则返回 None
+
+        还没有解析出 aid 就被停止的任务没有临时文件。
+        """
+        key = os.path.normcase(os.path.abspath(work_dir))
+        self._running[key] -= 1
+        if stopped and aid:
+            aids = self._stopped.setdefault(key, {})
+            aids[aid] = min(started, aids.get(aid, started))
+        if self._running[key] > 0:
+            return None
+        del self._running[key]
+        return self._stopped.pop(key, {})
+
+
+_cleaner = None
+
+
+def get_cleaner():
+    """进程内共用的 TempCleaner（只在界面线程使用）"""
+    global _cleaner
+    if _cleaner is None:
+        _cleaner = TempCleaner()
+    return _cleaner
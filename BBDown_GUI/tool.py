@@ -15,6 +15,13 @@ def get_bbdown_executable():
         return "BBDown.exe"
     return "BBDown"
 
+def add_exe_suffix(filename):
+    """根据平台动态添加 .exe 后缀"""
+    if sys.platform == 'win32':
+        if not filename.endswith(".exe"):
+            return filename + ".exe"
+    return filename
+
 def get_bbdowndir():
     bbdowndir = os.path.join(get_workdir(), get_bbdown_executable())
     return bbdowndir
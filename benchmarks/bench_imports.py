@@ -0,0 +1,73 @@
+"""启动过程耗时：各时间点和导入最慢的模块（取多次运行的中位数）
+
+    python benchmarks/bench_imports.py              # 默认运行 10 次
+    python benchmarks/bench_imports.py -n 20 --top 30
+
+每次在新的子进程中以 --profile-startup --exit-after-startup 启动图形界面，
+汇总 BBDown_GUI.startup 写出的报告。没有显示器时可以设置 QT_QPA_PLATFORM=offscreen。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_report(text):
+    marks, modules = {}, {}
+    section = None
+    for line in text.splitlines():
+        if line.startswith("#"):
+            section = "imports" if "模块导入" in line else "marks"
+            continue
+        if section == "marks":
+            t, name = line.split(None, 1)
+            marks[name] = float(t)
+        elif section == "imports":
+            self_time, total, name = line.split("|")
+            modules[name.strip()] = (float(self_time), float(total))
+    return marks, modules
+
+
+def run_once():
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        subprocess.run([sys.executable, "-m", "BBDown_GUI", "--profile-startup", path, "--exit-after-startup"],
+                       cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        with open(path, "r", encoding="utf-8") as f:
+            return parse_report(f.read())
+    finally:
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10, help="运行次数")
+    parser.add_argument("--top", type=int, default=20, help="列出累计耗时最多的模块数")
+    args = parser.parse_args()
+
+    marks, modules = {}, {}
+    for _ in range(args.n):
+        m, mods = run_once()
+        for name, t in m.items():
+            marks.setdefault(name, []).append(t)
+        for name, t in mods.items():
+            modules.setdefault(name, []).append(t)
+
+    print("时间点（毫秒，中位数）")
+    for name, times in marks.items():
+        print(f"{statistics.median(times):10.1f}  {name}")
+    print(f"\n累计耗时最多的 {args.top} 个模块（毫秒，中位数）")
+    print(f"{'自身':>10}{'累计':>10}  模块")
+    rows = [(statistics.median(t[1] for t in times), statistics.median(t[0] for t in times), name)
+            for name, times in modules.items()]
+    for total, self_time, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{self_time:10.2f}{total:10.2f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
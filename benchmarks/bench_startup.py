@@ -0,0 +1,73 @@
+"""主界面启动耗时：从创建 FormMain 到窗口第一次绘制完成
+
+    python benchmarks/bench_startup.py            # 默认各运行 10 次
+    python benchmarks/bench_startup.py -n 20
+
+每次在新的子进程中测量，对比高级选项面板延迟创建（lazy）和启动时立即创建（eager）。
+没有显示器时可以设置 QT_QPA_PLATFORM=offscreen。
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(mode):
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtCore import QObject, QEvent
+    from PyQt5.QtWidgets import QApplication
+    from BBDown_GUI.Form.form_main import FormMain
+
+    app = QApplication(sys.argv[:1])
+    result = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and "paint" not in result:
+                result["paint"] = time.perf_counter()
+                app.quit()
+            return False
+
+    start = time.perf_counter()
+    win = FormMain()
+    if mode == "eager" and win.widget_advanced is None:
+        win.build_advanced()
+    result["init"] = time.perf_counter()
+    watcher = PaintWatcher()
+    win.installEventFilter(watcher)
+    win.show()
+    app.exec_()
+    print((result["init"] - start) * 1000, (result["paint"] - start) * 1000)
+
+
+def run(mode, n):
+    init, paint = [], []
+    for _ in range(n):
+        out = subprocess.run([sys.executable, __file__, "--child", mode], check=True,
+                             stdout=subprocess.PIPE, universal_newlines=True).stdout
+        a, b = map(float, out.split()[-2:])
+        init.append(a)
+        paint.append(b)
+    return init, paint
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10, help="每种模式运行次数")
+    parser.add_argument("--child", choices=["lazy", "eager"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child)
+        return
+    print(f"{'模式':<8}{'创建窗口(ms)':>14}{'首次绘制(ms)':>14}")
+    for mode in ("eager", "lazy"):
+        init, paint = run(mode, args.n)
+        print(f"{mode:<8}{statistics.median(init):>14.1f}{statistics.median(paint):>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,16 +14,14 @@ setup(
     packages=['BBDown_GUI', 'BBDown_GUI.UI', 'BBDown_GUI.Form'],
     include_package_data=True,
     install_requires=['PyQt5==5.15.6'],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
     classifiers=[
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Operating System :: POSIX :: Linux',
         'Operating System :: Microsoft :: Windows',
         'Operating System :: MacOS :: MacOS X',
@@ -34,6 +32,7 @@ setup(
             'BBDownGUI = BBDown_GUI.gui:main',
             'bbdown_gui = BBDown_GUI.gui:main',
             'BBDown_GUI = BBDown_GUI.gui:main',
+            'bbdown_gui_cli = BBDown_GUI.cli:main',
         ],
     },
 )
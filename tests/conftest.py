@@ -0,0 +1,34 @@
+import os
+import sys
+
+# 不安装也能从仓库根目录导入 BBDown_GUI
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_fixture(*names):
+    """录制的 BBDown 输出，按行返回（保留行尾）"""
+    with open(os.path.join(FIXTURES, *names), encoding="utf-8") as f:
+        return f.readlines()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--request", action="append", default=[], metavar="ID",
+                     help="只运行标记为对应需求（如 user-016）的测试，可重复")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "request(id): 测试覆盖的需求编号，如 user-016")
+
+
+def pytest_collection_modifyitems(config, items):
+    wanted = set(config.getoption("--request"))
+    if not wanted:
+        return
+    selected, deselected = [], []
+    for item in items:
+        ids = {arg for mark in item.iter_markers("request") for arg in mark.args}
+        (selected if ids & wanted else deselected).append(item)
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
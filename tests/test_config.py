@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+
+import BBDown_GUI.config as config_module
+from BBDown_GUI.config import CONFIG_VERSION, ConfigWriter, load_config, save_config
+from BBDown_GUI.options import default_config
+
+pytestmark = pytest.mark.request("user-009")
+
+
+def test_load_migrates_old_config(tmp_path):
+    path = tmp_path / "config.json"
+    # 1.x 的文件：没有 version，保存了参数预览框，个别取值类型不对
+    path.write_text(json.dumps({
+        "lineEdit_param": "BBDown av1", "lineEdit_dir": "/tmp/下载", "checkBox_danmaku": True,
+        "comboBox_source": "2", "radioButton_p_all": 1, "advanced": 1, "unknown": "x",
+    }), encoding="utf-8")
+    config, saved = load_config(str(path))
+    assert saved["lineEdit_param"] == "BBDown av1"
+    assert "lineEdit_param" not in config and "unknown" not in config
+    assert (config["lineEdit_dir"], config["checkBox_danmaku"], config["advanced"]) == ("/tmp/下载", True, True)
+    # 类型不符的项取初始值
+    assert "comboBox_source" not in config and "radioButton_p_all" not in config
+    assert config["checkBox_ffmpeg"] == default_config()["checkBox_ffmpeg"]
+
+
+def test_load_missing_file(tmp_path):
+    assert load_config(str(tmp_path / "config.json")) == (default_config(), None)
+
+
+def test_save_is_atomic(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    save_config(str(path), {"lineEdit_dir": "/tmp/a"})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"version": CONFIG_VERSION, "lineEdit_dir": "/tmp/a"}
+
+    def broken_dump(data, f, **kwargs):
+        f.write('{"version": ')
+        raise OSError("磁盘已满")
+
+    monkeypatch.setattr(config_module.json, "dump", broken_dump)
+    with pytest.raises(OSError):
+        save_config(str(path), {"lineEdit_dir": "/tmp/b"})
+    # 原文件不变，临时文件已删除
+    assert json.loads(path.read_text(encoding="utf-8"))["lineEdit_dir"] == "/tmp/a"
+    assert os.listdir(tmp_path) == ["config.json"]
+
+
+def test_writer_skips_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / "config.json")
+    writes = []
+
+    def counting_save(path, config):
+        writes.append(config)
+        return save_config(path, config)
+
+    monkeypatch.setattr(config_module, "save_config", counting_save)
+    _, saved = load_config(path)
+    writer = ConfigWriter(path, saved)
+    writer.save({"lineEdit_dir": "/tmp/a"})
+    writer.flush(5)
+    writer.save({"lineEdit_dir": "/tmp/a"})
+    writer.flush(5)
+    assert writes == [{"lineEdit_dir": "/tmp/a"}]
+    # 启动时读到的内容相同时也不写
+    _, saved = load_config(path)
+    writer = ConfigWriter(path, saved)
+    writer.save({"lineEdit_dir": "/tmp/a"})
+    writer.flush(5)
+    assert len(writes) == 1
+    writer.save({"lineEdit_dir": "/tmp/b"})
+    writer.flush(5)
+    assert load_config(path)[1]["lineEdit_dir"] == "/tmp/b"
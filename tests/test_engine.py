@@ -0,0 +1,134 @@
+import os
+
+import pytest
+from conftest import read_fixture
+
+import BBDown_GUI.engine as engine_module
+from BBDown_GUI.engine import Engine, JobSettings, DOWNLOADED, DUPLICATE
+from BBDown_GUI.history import History
+from BBDown_GUI.jobqueue import DONE, FAILED, EXPRESS_SLOTS
+from BBDown_GUI.journal import Journal
+from BBDown_GUI.metadata import MetadataCache, parse_info
+from BBDown_GUI.options import BBDownOptions
+
+
+class Front:
+    """记录 Engine 的调用，不启动 BBDown"""
+    def __init__(self):
+        self.launched = []
+        self.status = {}
+        self.released = []
+
+    def launch(self, job, options, record):
+        self.launched.append((job, options))
+
+    def probe(self, job):
+        raise AssertionError("分P 列表已缓存，不应再解析")
+
+    def show_status(self, job, text):
+        self.status[job.id] = text
+
+    def write_log(self, job, text):
+        pass
+
+    def deliver(self, callback, *args):
+        callback(*args)
+
+    def release(self, job):
+        self.released.append(job)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    history = History(str(tmp_path / "history.db"))
+    metadata = MetadataCache(str(tmp_path / "metadata.db"))
+    metadata.put(parse_info("BV1xx411c7mD", read_fixture("bbdown", "info.txt")))
+    monkeypatch.setattr(engine_module, "get_history", lambda: history)
+    monkeypatch.setattr(engine_module, "get_metadata", lambda: metadata)
+    return Engine(Front(), 2, Journal(str(tmp_path / "queue.journal")))
+
+
+@pytest.mark.request("user-020")
+def test_limits_shared_with_express_slots(engine, tmp_path):
+    engine.limits.connections = 12
+    engine.add(BBDownOptions(url="av1", use_aria2c=True, work_dir=str(tmp_path)), JobSettings())
+    engine.schedule()
+    (job, options), = engine.front.launched
+    assert f"-x{12 // (2 + EXPRESS_SLOTS)} " in options.aria2c_args
+    assert engine.front.status[job.id] == "下载中"
+
+
+@pytest.mark.request("user-007")
+def test_duplicate_and_finished(engine, tmp_path):
+    job = engine.add(BBDownOptions(url="av1", work_dir=str(tmp_path)), JobSettings())
+    assert engine.add(BBDownOptions(url="av1", work_dir=str(tmp_path)), JobSettings()) == DUPLICATE
+    engine.schedule()
+    engine.finished(job, 0)
+    assert engine.front.status[job.id] == "已完成"
+    assert engine.front.released == [job]
+    engine.journal.close()
+    # 结束的任务不再恢复，已下载的任务按下载记录跳过
+    assert Journal(str(tmp_path / "queue.journal")).recover() == []
+    assert engine.add(BBDownOptions(url="av1", work_dir=str(tmp_path)), JobSettings()) == DOWNLOADED
+
+
+@pytest.mark.request("user-022")
+def test_resumed_split_with_all_parts_done(engine, tmp_path):
+    options = BBDownOptions(url="BV1xx411c7mD", pages="1-3", work_dir=str(tmp_path))
+    key = engine.journal.add(options)
+    job = engine.add(options, JobSettings(chunk=1), key=key, parts=frozenset({1, 2, 3}))
+    engine.schedule()
+    # 分P 都已下载完成时直接结束，不启动 BBDown
+    assert engine.front.launched == []
+    assert job.status == DONE
+    assert not engine.queue.running
+    engine.journal.close()
+    assert Journal(str(tmp_path / "queue.journal")).recover() == []
+
+
+@pytest.mark.request("user-019")
+def test_resumed_all_pages_expanded_with_page_count(engine, tmp_path):
+    options = BBDownOptions(url="BV1xx411c7mD", pages="ALL", work_dir=str(tmp_path))
+    key = engine.journal.add(options)
+    engine.add(options, JobSettings(), key=key, parts=frozenset({1}))
+    engine.schedule()
+    # 按缓存的分P 总数展开后去掉已完成的分P
+    (job, launched), = engine.front.launched
+    assert launched.pages == "2-3"
+
+
+@pytest.mark.request("user-016")
+def test_start_error_fails_only_that_job(engine, tmp_path):
+    # 下载目录是一个文件，无法创建暂存目录
+    blocked = tmp_path / "blocked"
+    blocked.write_text("")
+    bad = engine.add(BBDownOptions(url="av1", work_dir=str(blocked)), JobSettings(defer_mux=True))
+    good = engine.add(BBDownOptions(url="av2", work_dir=str(tmp_path)), JobSettings())
+    engine.schedule()
+    assert bad.status == FAILED
+    assert engine.front.status[bad.id].startswith("失败（")
+    assert engine.front.released == [bad]
+    assert [job for job, options in engine.front.launched] == [good]
+
+
+@pytest.mark.request("user-023")
+def test_outputs_attributed_per_job(engine, tmp_path):
+    # 同时下载到同一目录的两个任务各自下载到暂存目录
+    work_dir = tmp_path / "downloads"
+    first = engine.add(BBDownOptions(url="av1", work_dir=str(work_dir)), JobSettings())
+    second = engine.add(BBDownOptions(url="av2", work_dir=str(work_dir)), JobSettings())
+    engine.schedule()
+    staged = {}
+    for job, options in engine.front.launched:
+        staged[job.id] = os.path.join(options.work_dir, f"{job.options.url}.mp4")
+        with open(staged[job.id], "w"):
+            pass
+    engine.finished(first, 0)
+    assert os.listdir(work_dir / ".bbdown_gui") == [second.key]
+    assert os.path.exists(staged[second.id])
+    engine.finished(second, 0)
+    # 完成后移到下载目录，删除空的暂存目录
+    assert sorted(os.listdir(work_dir)) == ["av1.mp4", "av2.mp4"]
+    history = engine_module.get_history()
+    assert history.find(first.options)["files"] == [str(work_dir / "av1.mp4")]
+    assert history.find(second.options)["files"] == [str(work_dir / "av2.mp4")]
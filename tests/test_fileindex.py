@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from BBDown_GUI.fileindex import FileIndex, NAME, DOWNLOAD
+from BBDown_GUI.options import BBDownOptions
+
+pytestmark = pytest.mark.request("user-025")
+
+
+def test_guessed_id_keeps_id_from_file_name(tmp_path):
+    work_dir = tmp_path / "downloads"
+    work_dir.mkdir()
+    named = work_dir / "BV1xx411c7mD.mp4"
+    named.write_text("V")
+    other = work_dir / "标题.mp4"
+    other.write_text("V")
+    index = FileIndex(str(tmp_path / "files.db"))
+    index.scan(BBDownOptions(url="", work_dir=str(work_dir), file_pattern="<bvid>"))
+    # 默认模板不含视频 ID，归属只能按任务地址推断
+    index.record(BBDownOptions(url="BV1yy411c7yy", work_dir=str(work_dir)), [str(named), str(other)])
+    assert [entry.path for entry in index.find("BV1xx411c7mD")] == [str(named)]
+    assert [entry.path for entry in index.find("BV1yy411c7yy")] == [str(other)]
+    sources = dict(index._connect().execute("SELECT path, source FROM files"))
+    assert sources == {str(named): NAME, str(other): DOWNLOAD}
+    index.close()
+
+
+def make_files(work_dir, names):
+    work_dir.mkdir(exist_ok=True)
+    for name in names:
+        path = work_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("V")
+    return [str(work_dir / name) for name in names]
+
+
+def test_find_by_part_quality_and_codec(tmp_path):
+    work_dir = tmp_path / "downloads"
+    options = BBDownOptions(url="BV1xx411c7mD", pages="1-2", work_dir=str(work_dir))
+    files = make_files(work_dir, ["合集/[P1]第一集.mp4", "合集/[P2]第二集.mp4", "合集/[P2]第二集.zh-Hans.srt"])
+    index = FileIndex(str(tmp_path / "files.db"))
+    index.record(options, files, {1: ("1080P 高清", "HEVC"), 2: ("720P 高清", "AVC")})
+    assert [(e.part, e.kind) for e in index.find("BV1xx411c7mD")] == [(1, "video"), (2, "video"), (2, "subtitle")]
+    assert [e.path for e in index.find("BV1xx411c7mD", quality="1080P", codec="HEVC")] == [files[0]]
+    assert index.find("BV1xx411c7mD", part=2, kind="video")[0].quality == "720P 高清"
+    assert index.find("BV1xx411c7mD", work_dir=str(tmp_path)) == []
+    index.close()
+
+
+def test_covers(tmp_path):
+    work_dir = tmp_path / "downloads"
+    options = BBDownOptions(url="BV1xx411c7mD", pages="1-2", work_dir=str(work_dir), encoding_priority="HEVC")
+    files = make_files(work_dir, ["合集/[P1]第一集.mp4", "合集/[P2]第二集.mp4"])
+    index = FileIndex(str(tmp_path / "files.db"))
+    index.record(options, files[:1], {1: ("1080P 高清", "HEVC")})
+    # 还缺 P2
+    assert index.covers(options) is None
+    index.record(options, files[1:], {2: ("1080P 高清", "HEVC")})
+    assert index.covers(options) == files
+    assert index.covers(options._replace(encoding_priority="AV1")) is None
+    # 分P 总数未知时无法确认
+    assert index.covers(options._replace(pages="ALL")) is None
+    # 文件被删除后不再视为已下载
+    os.remove(files[1])
+    assert index.covers(options) is None
+    index.close()
+
+
+def test_covers_single_part_video(tmp_path):
+    work_dir = tmp_path / "downloads"
+    options = BBDownOptions(url="BV1xx411c7mD", work_dir=str(work_dir))
+    files = make_files(work_dir, ["标题.mp4"])
+    index = FileIndex(str(tmp_path / "files.db"))
+    index.record(options, files)
+    assert index.covers(options) == files
+    assert index.covers(options._replace(pages="1")) == files
+    index.close()
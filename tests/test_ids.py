@@ -0,0 +1,54 @@
+import pytest
+
+from BBDown_GUI.ids import video_id, normalize, find_ids, find_links, selects_part
+
+pytestmark = pytest.mark.request("user-016")
+
+
+def test_video_id():
+    assert video_id("https://www.bilibili.com/video/BV1xx411c7mD/?spm=1") == "BV1xx411c7mD"
+    assert video_id("AV170001") == "av170001"
+    assert video_id("https://www.bilibili.com/bangumi/play/ep12345") == "ep12345"
+    assert video_id("ss678") == "ss678"
+    assert video_id("Java1 sleep2") is None
+
+
+def test_normalize():
+    assert normalize("  https://www.bilibili.com/video/BV1xx411c7mD  ") == "BV1xx411c7mD"
+    assert normalize("https://b23.tv/AbCd123") == "https://b23.tv/AbCd123"
+    assert normalize("b23.tv/AbCd123") == "https://b23.tv/AbCd123"
+    # 带分P 参数的地址保留原样
+    assert normalize("https://www.bilibili.com/video/BV1xx411c7mD?p=3") == "https://www.bilibili.com/video/BV1xx411c7mD?p=3"
+    # 课程地址只留 ID 会被当作番剧
+    assert normalize("https://www.bilibili.com/cheese/play/ss1234") == "https://www.bilibili.com/cheese/play/ss1234"
+    assert normalize("") is None
+
+
+def test_find_ids():
+    text = '{"bvid": "BV1xx411c7mD", "link": "https://b23.tv/xyz"}, av2'
+    assert list(find_ids(text)) == ["BV1xx411c7mD", "https://b23.tv/xyz", "av2"]
+
+
+def test_find_ids_keeps_page_and_cheese_urls():
+    text = ('url,title\n"https://www.bilibili.com/video/BV1xx411c7mD?p=3",第三集\n'
+            "https://www.bilibili.com/cheese/play/ep5678,课程\n"
+            "https://www.bilibili.com/video/BV1xx411c7mD/?spm_id_from=333,首页\n"
+            "https://space.bilibili.com/1/favlist,收藏夹\n")
+    assert list(find_ids(text)) == ["https://www.bilibili.com/video/BV1xx411c7mD?p=3",
+                                    "https://www.bilibili.com/cheese/play/ep5678", "BV1xx411c7mD"]
+
+
+def test_find_links_is_strict():
+    text = "今天看了 ep1 的番\nhttps://www.bilibili.com/video/BV1xx411c7mD\nav2"
+    assert list(find_links(text)) == ["BV1xx411c7mD", "av2"]
+    # 地址旁边的文字不当作 ID，分P 参数和课程地址保留
+    text = "今天看了 ep1 https://www.bilibili.com/video/BV1xx411c7mD?p=2\n课程 https://www.bilibili.com/cheese/play/ss1234"
+    assert list(find_links(text)) == ["https://www.bilibili.com/video/BV1xx411c7mD?p=2",
+                                      "https://www.bilibili.com/cheese/play/ss1234"]
+
+
+def test_selects_part():
+    assert selects_part("https://www.bilibili.com/video/BV1xx411c7mD?p=3")
+    assert selects_part("ep12345")
+    assert not selects_part("BV1xx411c7mD")
+    assert not selects_part("ss678")
@@ -0,0 +1,50 @@
+import io
+import json
+
+import pytest
+
+import BBDown_GUI.importer as importer_module
+from BBDown_GUI.importer import iter_chunks, iter_file, iter_lines, unique
+
+pytestmark = pytest.mark.request("user-016")
+
+
+def test_iter_lines_normalizes_and_skips_comments():
+    lines = ["# 收藏\n", "\n", "https://www.bilibili.com/video/BV1xx411c7mD/?spm_id_from=1\n", "  av2  \n",
+             "https://www.bilibili.com/video/BV1xx411c7mD?p=3\n"]
+    assert list(iter_lines(lines)) == ["BV1xx411c7mD", "av2", "https://www.bilibili.com/video/BV1xx411c7mD?p=3"]
+
+
+def test_csv_with_bom(tmp_path):
+    path = tmp_path / "list.csv"
+    path.write_text("标题,地址\n第一集,https://www.bilibili.com/video/BV1xx411c7mD?p=1\n课程,"
+                    "\"https://www.bilibili.com/cheese/play/ep5678\"\n备注 ep1 之后,av2\n", encoding="utf-8-sig")
+    assert list(iter_file(str(path))) == ["https://www.bilibili.com/video/BV1xx411c7mD?p=1",
+                                          "https://www.bilibili.com/cheese/play/ep5678", "ep1", "av2"]
+
+
+def test_json_chunks_do_not_split_ids(monkeypatch):
+    # 很小的块：ID 和地址跨块也能完整找到
+    monkeypatch.setattr(importer_module, "CHUNK_SIZE", 7)
+    data = json.dumps({"medias": [{"bvid": "BV1xx411c7mD"}, {"link": "https://www.bilibili.com/video/av170001?p=2"},
+                                  {"short": "https://b23.tv/AbCd123"}]})
+    assert list(iter_chunks(io.StringIO(data))) == ["BV1xx411c7mD", "https://www.bilibili.com/video/av170001?p=2",
+                                                    "https://b23.tv/AbCd123"]
+    # 其他程序导出的 JSON 可能把 / 转义为 \/
+    assert list(iter_chunks(io.StringIO(data.replace("/", "\\/")))) == list(iter_chunks(io.StringIO(data)))
+
+
+def test_unique_streams_and_shares_seen():
+    seen = set()
+    first = unique(iter(["av1", "av2", "av1"]), seen)
+    # 生成器逐个取出，不先读完整个输入
+    assert next(first) == "av1"
+    assert list(first) == ["av2"]
+    assert list(unique(["av2", "av3"], seen)) == ["av3"]
+
+
+def test_bad_encoding_raises_value_error(tmp_path):
+    path = tmp_path / "list.txt"
+    path.write_bytes("av1\n".encode("utf-16"))
+    with pytest.raises(ValueError):
+        list(iter_file(str(path)))
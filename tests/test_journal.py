@@ -0,0 +1,55 @@
+import pytest
+
+from BBDown_GUI.journal import Journal, remaining_pages
+from BBDown_GUI.options import BBDownOptions
+
+pytestmark = pytest.mark.request("user-019")
+
+
+def test_remaining_pages():
+    assert remaining_pages("1-5", frozenset()) == "1-5"
+    assert remaining_pages("1-5", frozenset({2, 3})) == "1,4-5"
+    assert remaining_pages("1-2", frozenset({1, 2})) is None
+    # 分P 总数未知时无法展开的取值原样返回
+    assert remaining_pages("ALL", frozenset({1})) == "ALL"
+    assert remaining_pages("NEW", frozenset({1}), 5) == "NEW"
+
+
+def test_remaining_pages_with_page_count():
+    assert remaining_pages("ALL", frozenset({1, 2}), 5) == "3-5"
+    assert remaining_pages("", frozenset({2}), 3) == "1,3"
+    assert remaining_pages("LAST", frozenset({5}), 5) is None
+    # 超出分P 总数的序号不再下载
+    assert remaining_pages("4-8", frozenset({4}), 5) == "5"
+
+
+def test_recover_unfinished(tmp_path):
+    path = str(tmp_path / "queue.journal")
+    journal = Journal(path)
+    done = journal.add(BBDownOptions(url="av1"))
+    pending = journal.add(BBDownOptions(url="av2", pages="1-3"), priority=5, profile="存档")
+    journal.part_done(pending, 2)
+    journal.end(done, "done")
+    journal.flush()
+    journal.close()
+    # 崩溃时写了一半的最后一行
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "key": "x", "opti')
+
+    entries = Journal(path).recover()
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.key == pending
+    assert entry.options["url"] == "av2"
+    assert (entry.priority, entry.profile, entry.parts) == (5, "存档", frozenset({2}))
+    # 日志已压缩为只包含未完成的任务
+    assert Journal(path).recover() == entries
+
+
+def test_recover_removes_empty_journal(tmp_path):
+    path = tmp_path / "queue.journal"
+    journal = Journal(str(path))
+    journal.end(journal.add(BBDownOptions(url="av1")), "failed")
+    journal.close()
+    assert Journal(str(path)).recover() == []
+    assert not path.exists()
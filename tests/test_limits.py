@@ -0,0 +1,41 @@
+import datetime
+
+import pytest
+
+from BBDown_GUI.limits import Limits, parse_rate, parse_windows, rate_at, aria2c_args
+from BBDown_GUI.options import BBDownOptions
+
+pytestmark = pytest.mark.request("user-020")
+
+
+def test_parse_rate():
+    assert parse_rate("0") == 0
+    assert parse_rate("500K") == 500 * 1024
+    assert parse_rate("1.5m") == int(1.5 * 1024 ** 2)
+    with pytest.raises(ValueError):
+        parse_rate("fast")
+
+
+def test_windows_across_midnight():
+    windows = parse_windows("08:00-23:00=2M, 23:00-08:00=0")
+    assert windows == [(480, 1380, 2 * 1024 ** 2), (1380, 480, 0)]
+    assert rate_at(windows, datetime.datetime(2024, 1, 1, 12, 0)) == 2 * 1024 ** 2
+    assert rate_at(windows, datetime.datetime(2024, 1, 1, 2, 0)) == 0
+    assert rate_at(parse_windows("01:00-02:00=1M"), datetime.datetime(2024, 1, 1, 3, 0)) == 0
+    with pytest.raises(ValueError):
+        parse_windows("25:00-26:00=1M")
+
+
+def test_aria2c_args_replaces_limits():
+    assert aria2c_args("-x16 -s16 --file-allocation=none", 4, 1024) == \
+        "--file-allocation=none -x4 -s4 --max-overall-download-limit=1024"
+    assert aria2c_args("-x16", 0, 0) == "-x16"
+
+
+def test_apply_divides_by_slots():
+    limits = Limits(32, parse_windows("00:00-24:00=4M"))
+    options = BBDownOptions(url="av1", use_aria2c=True)
+    applied = limits.apply(options, 4, now=datetime.datetime(2024, 1, 1, 12, 0))
+    assert applied.aria2c_args == f"-x8 -s8 --max-overall-download-limit={1024 ** 2}"
+    # 不使用 aria2c 的任务不变
+    assert limits.apply(options._replace(use_aria2c=False), 4) == options._replace(use_aria2c=False)
@@ -0,0 +1,35 @@
+import pytest
+from conftest import read_fixture
+
+from BBDown_GUI.metadata import VideoInfo, parse_info, format_info
+from BBDown_GUI.tempfiles import parse_aid
+
+pytestmark = pytest.mark.request("user-021")
+
+
+def test_parse_info():
+    info = parse_info("BV1xx411c7mD", read_fixture("bbdown", "info.txt"), fetched=1.0)
+    assert info.title == "解析示例"
+    assert info.aid == "170004"
+    assert info.page_count == 3
+    assert [p["index"] for p in info.parts] == [1, 2, 3]
+    assert info.parts[1] == {"index": 2, "cid": "1002", "title": "第二集", "duration": "05m00s"}
+    assert info.qualities() == ["1080P 高清", "720P 高清"]
+    assert [s["codec"] for s in info.video_streams] == ["HEVC", "AVC"]
+    assert info.audio_streams[0]["codec"] == "mp4a.40.2"
+
+
+def test_parse_info_without_parts():
+    assert parse_info("av1", read_fixture("bbdown", "failed.txt")) is None
+
+
+def test_round_trip():
+    info = parse_info("BV1xx411c7mD", read_fixture("bbdown", "info.txt"), fetched=1.0)
+    assert VideoInfo.from_dict(info.to_dict()) == info
+    # 显示缓存的结果时格式与 BBDown 相近，可以再次解析
+    again = parse_info(info.key, format_info(info), fetched=1.0)
+    assert again.parts == info.parts and again.video_streams == info.video_streams
+
+
+def test_parse_aid():
+    assert [a for a in map(parse_aid, read_fixture("bbdown", "single_part.txt")) if a] == ["170001"]
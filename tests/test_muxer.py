@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+import BBDown_GUI.supervisor as supervisor_module
+from BBDown_GUI.muxer import (MuxQueue, MuxResult, MuxTask, STAGING, find_tracks, mux_argv, muxed_files, publish,
+                              staged_options, staging_dir, temp_output)
+from BBDown_GUI.options import BBDownOptions
+
+pytestmark = pytest.mark.request("user-024")
+
+
+class Supervisor:
+    """记录启动的混流进程，由测试决定何时结束"""
+    def __init__(self):
+        self.spawned = []
+
+    def spawn(self, argv, on_line, on_exit):
+        self.spawned.append((argv, on_exit))
+
+    def exit(self, index, returncode):
+        argv, on_exit = self.spawned[index]
+        if returncode == 0:
+            with open(argv[-1], "w"):
+                pass
+        on_exit(returncode)
+
+
+def test_find_tracks_pairs_by_name():
+    files = ["/d/a.mp4", "/d/a.m4a", "/d/b.mp4", "/d/c.M4A", "/d/a.srt"]
+    assert find_tracks(files) == [MuxTask("/d/a.mp4", "/d/a.m4a", "/d/a.mp4")]
+
+
+def test_mux_argv():
+    task = MuxTask("/d/a b.mp4", "/d/a b.m4a", "/d/a b.mp4")
+    argv = mux_argv(task, temp_output(task))
+    assert argv[0] == "ffmpeg" and argv[-1] == "/d/a b.muxing.mp4"
+    assert argv[argv.index("-c") + 1] == "copy"
+    argv = mux_argv(task, "/d/out.mp4", "", "MP4Box")
+    assert argv == ["MP4Box", "-quiet", "-add", "/d/a b.mp4#video", "-add", "/d/a b.m4a#audio", "-new", "/d/out.mp4"]
+
+
+def test_muxed_files_drops_merged_tracks():
+    ok = MuxTask("/d/a.mp4", "/d/a.m4a", "/d/a.mp4")
+    failed = MuxTask("/d/b.mp4", "/d/b.m4a", "/d/b.mp4")
+    files = ["/d/a.mp4", "/d/a.m4a", "/d/b.mp4", "/d/b.m4a", "/d/a.xml"]
+    results = [MuxResult(ok, 0, ()), MuxResult(failed, 1, ())]
+    # 混流失败的轨道原样保留
+    assert muxed_files(files, results) == ["/d/b.mp4", "/d/b.m4a", "/d/a.xml", "/d/a.mp4"]
+
+
+def test_staging_and_publish(tmp_path):
+    options = BBDownOptions(url="BV1xx411c7mD", pages="1-3", work_dir=str(tmp_path))
+    # 拆分的子任务（分P 不同）共用原任务的暂存目录
+    assert staging_dir(options) == staging_dir(options._replace(pages="4"))
+    assert staging_dir(options, "key") == str(tmp_path / STAGING / "key")
+    staged = staged_options(options._replace(pages="2"), options, "key")
+    assert (staged.work_dir, staged.skip_mux, staged.pages) == (str(tmp_path / STAGING / "key"), True, "2")
+    assert staged_options(options, name="key", skip_mux=False).skip_mux is False
+    os.makedirs(os.path.join(staged.work_dir, "标题"))
+    track = os.path.join(staged.work_dir, "标题", "[P2]第二集.mp4")
+    with open(track, "w"):
+        pass
+    # 保留子目录，移走后删除空的暂存目录
+    assert publish(options, [track], "key") == [str(tmp_path / "标题" / "[P2]第二集.mp4")]
+    assert os.listdir(tmp_path) == ["标题"]
+
+
+def test_queue_runs_at_most_workers(tmp_path, monkeypatch):
+    supervisor = Supervisor()
+    monkeypatch.setattr(supervisor_module, "get_supervisor", lambda: supervisor)
+    tasks = []
+    for name in ("a", "b", "c"):
+        for ext in (".mp4", ".m4a"):
+            with open(tmp_path / f"{name}{ext}", "w"):
+                pass
+        tasks.append(MuxTask(str(tmp_path / f"{name}.mp4"), str(tmp_path / f"{name}.m4a"), str(tmp_path / f"{name}.mp4")))
+    done = []
+    queue = MuxQueue(workers=2)
+    queue.submit(tasks[:2], ("ffmpeg", ""), done.append)
+    queue.submit(tasks[2:], ("ffmpeg", ""), done.append)
+    assert len(supervisor.spawned) == 2
+    supervisor.exit(0, 0)
+    # 一个结束后才启动下一个
+    assert len(supervisor.spawned) == 3 and done == []
+    supervisor.exit(1, 1)
+    (first,) = done
+    assert [result.returncode for result in first] == [0, 1]
+    supervisor.exit(2, 0)
+    assert [result.task for result in done[1]] == [tasks[2]]
+    # 成功的替换视频轨道并删除音频轨道，失败的轨道和临时文件不留下多余文件
+    assert sorted(os.listdir(tmp_path)) == ["a.mp4", "b.m4a", "b.mp4", "c.mp4"]
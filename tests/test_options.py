@@ -0,0 +1,77 @@
+import shlex
+import sys
+
+import pytest
+
+from BBDown_GUI.options import BBDownOptions, format_argv
+
+pytestmark = pytest.mark.request("user-008")
+
+
+def test_to_argv_keeps_spaces_and_quotes_in_one_argument():
+    options = BBDownOptions(url="BV1xx411c7mD", work_dir="/tmp/my videos/\"new\"", file_pattern="<videoTitle> '<bvid>'",
+                            dfn_priority="1080P 高清")
+    argv = options.to_argv()
+    assert argv[0] == "BV1xx411c7mD"
+    assert argv[argv.index("--work-dir") + 1] == "/tmp/my videos/\"new\""
+    assert argv[argv.index("-F") + 1] == "<videoTitle> '<bvid>'"
+    assert argv[argv.index("--dfn-priority") + 1] == "1080P 高清"
+
+
+def test_to_argv_leaves_out_empty_fields():
+    assert BBDownOptions(url="av1").to_argv() == ["av1"]
+    argv = BBDownOptions(url="av1", multi_thread=False, force_http=True, skip_ai=None).to_argv()
+    assert argv == ["av1", "-mt", "false", "--force-http", "true"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Windows 使用 list2cmdline 的引号规则")
+def test_format_argv_round_trips_through_shell():
+    argv = BBDownOptions(url="av1", work_dir="/tmp/a b/it's", cookie="SESSDATA=x; bili_jct=\"y\"").to_argv()
+    assert shlex.split(format_argv(argv)) == argv
+
+
+def test_from_config():
+    config = {
+        "lineEdit_url": " BV1xx411c7mD ",
+        "radioButton_dfn_1080P": True,
+        "comboBox_encoding": 3,
+        "checkBox_ffmpeg": True,
+        "lineEdit_ffmpeg": "/opt/ffmpeg bin/ffmpeg",
+        "radioButton_p_all": True,
+        "lineEdit_dir": "/tmp/下载",
+    }
+    options = BBDownOptions.from_config(config)
+    assert options == BBDownOptions(url="BV1xx411c7mD", dfn_priority="1080P 高清", encoding_priority="HEVC",
+                                    ffmpeg_path="/opt/ffmpeg bin/ffmpeg", pages="ALL", work_dir="/tmp/下载")
+    # 高级选项未展开时其中的设置不生效
+    assert BBDownOptions.from_config(dict(config, checkBox_audio_only=True)).audio_only is False
+    advanced = dict(config, advanced=True, checkBox_p=True, lineEdit_p="1, 3-5", checkBox_audio_only=True)
+    options = BBDownOptions.from_config(advanced)
+    assert (options.pages, options.audio_only) == ("1,3-5", True)
+
+
+@pytest.mark.parametrize("fields", [
+    {"url": ""},
+    {"url": "av1", "pages": "1-"},
+    {"url": "av1", "source": "web"},
+    {"url": "av1", "encoding_priority": "VP9"},
+    {"url": "av1", "delay_per_page": "1.5"},
+    {"url": "av1", "host": "a b"},
+])
+def test_invalid_options_raise_value_error(fields):
+    with pytest.raises(ValueError):
+        BBDownOptions(**fields).validate()
+    with pytest.raises(ValueError):
+        BBDownOptions.from_dict(fields)
+
+
+def test_from_config_validation():
+    with pytest.raises(ValueError):
+        BBDownOptions.from_config({"lineEdit_url": "  "})
+    # 只需要下载目录等设置时不检查参数
+    assert BBDownOptions.from_config({"lineEdit_dir": "/tmp"}, "", validate=False).work_dir == "/tmp"
+
+
+def test_dict_round_trip_ignores_unknown_fields():
+    options = BBDownOptions(url="av1", pages="2", skip_ai=True, work_dir="/tmp/a b")
+    assert BBDownOptions.from_dict(dict(options.to_dict(), removed_field=1)) == options
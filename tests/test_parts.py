@@ -0,0 +1,58 @@
+import pytest
+
+from BBDown_GUI.metadata import VideoInfo
+from BBDown_GUI.options import BBDownOptions
+from BBDown_GUI.parts import expand_pages, format_pages, can_split, split_options
+
+pytestmark = pytest.mark.request("user-022")
+
+INFO = VideoInfo("BV1xx411c7mD", page_count=12)
+
+
+def pages(chunks):
+    return None if chunks is None else [o.pages for o in chunks]
+
+
+def test_expand_pages():
+    assert expand_pages("1,3-5,4") == [1, 3, 4, 5]
+    assert expand_pages("ALL", 3) == [1, 2, 3]
+    assert expand_pages("", 2) == [1, 2]
+    assert expand_pages("last", 7) == [7]
+    assert expand_pages("ALL") is None
+    assert expand_pages("NEW", 3) is None
+    assert expand_pages("1,x") is None
+
+
+def test_format_pages():
+    assert format_pages([1, 2, 3, 5, 7, 8]) == "1-3,5,7-8"
+    assert format_pages([]) == ""
+
+
+def test_split():
+    options = BBDownOptions(url="BV1xx411c7mD", pages="ALL")
+    assert pages(split_options(options, INFO, 5)) == ["1-5", "6-10", "11-12"]
+    assert pages(split_options(options._replace(pages="2-4"), INFO, 5)) is None
+    assert pages(split_options(options, INFO, 0)) is None
+    assert pages(split_options(options, None, 5)) is None
+
+
+def test_split_skips_done_parts():
+    options = BBDownOptions(url="BV1xx411c7mD", pages="1-6")
+    assert pages(split_options(options, INFO, 2, frozenset({1, 2, 4}))) == ["3,5", "6"]
+    assert split_options(options, INFO, 2, frozenset(range(1, 7))) == []
+
+
+def test_out_of_range_is_not_done():
+    options = BBDownOptions(url="BV1xx411c7mD", pages="50")
+    assert split_options(options, INFO, 2) is None
+    assert split_options(options, INFO, 2, frozenset({1})) is None
+
+
+def test_url_selects_part():
+    # 不加 -p 时地址中的 ?p= 和 ep 号只下载一个分P，不能拆分
+    assert can_split(BBDownOptions(url="BV1xx411c7mD"))
+    assert not can_split(BBDownOptions(url="https://www.bilibili.com/video/BV1xx411c7mD?p=3"))
+    assert not can_split(BBDownOptions(url="ep12345"))
+    assert can_split(BBDownOptions(url="ep12345", pages="ALL"))
+    assert not can_split(BBDownOptions(url="BV1xx411c7mD", pages="NEW"))
+    assert not can_split(BBDownOptions(url="BV1xx411c7mD", only_show_info=True))
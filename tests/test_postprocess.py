@@ -0,0 +1,35 @@
+import os
+import queue
+
+import pytest
+
+from BBDown_GUI.postprocess import PostProcessor, PostTask
+
+pytestmark = pytest.mark.request("user-023")
+
+
+def crash(task, files, arg, log):
+    """模拟处理进程意外退出"""
+    os._exit(1)
+
+
+def test_broken_pool_fails_only_that_task(tmp_path):
+    path = tmp_path / "av1.mp4"
+    path.write_text("V")
+    processor = PostProcessor(1)
+    results = queue.Queue()
+    try:
+        processor.submit(PostTask("av0", "av0", str(tmp_path), (), ((f"{__name__}:crash", ""),)),
+                         lambda result: results.put(("av0", result)))
+        processor.submit(PostTask("av1", "av1", str(tmp_path), (str(path),), (("checksum", "md5"),)),
+                         lambda result: results.put(("av1", result)))
+        done = dict(results.get(timeout=60) for _ in range(2))
+        # 同一进程池中的其他处理重新提交后照常完成
+        assert done["av0"].error
+        assert not done["av1"].error
+        assert os.path.exists(f"{path}.md5")
+        # 之后提交的处理使用新的进程池
+        processor.submit(PostTask("av2", "av2", str(tmp_path), (), ()), results.put)
+        assert not results.get(timeout=60).error
+    finally:
+        processor.shutdown()
@@ -0,0 +1,87 @@
+import itertools
+
+import pytest
+from conftest import read_fixture
+
+from BBDown_GUI.progress import (ProgressParser, PART, TRACK, STAGE, PROGRESS, MUX, DONE, ERROR, FAILED,
+                                 format_speed, format_eta)
+
+pytestmark = pytest.mark.request("user-004")
+
+
+def feed(name, returncode=0):
+    # 每行前进 1 秒，估算的剩余时间可以预测
+    clock = itertools.count()
+    parser = ProgressParser(clock=lambda: next(clock))
+    events = [e for e in map(parser.feed, read_fixture("bbdown", name)) if e is not None]
+    events.append(parser.finish(returncode))
+    return parser, events
+
+
+def kinds(events):
+    return [e.kind for e in events]
+
+
+def test_single_part():
+    parser, events = feed("single_part.txt")
+    assert kinds(events) == [PART, TRACK, TRACK, STAGE, PROGRESS, PROGRESS, PROGRESS, PROGRESS,
+                             STAGE, PROGRESS, PROGRESS, MUX, DONE, DONE]
+    assert events[0].value == 1
+    assert events[1].value == ("视频", "[1080P 高清] [1920x1080] [AVC] [30.000] [2371 kbps] [~69.49 MB]")
+    assert events[3].value == "视频"
+    percent, speed, eta = events[5].value
+    assert percent == 25.0
+    assert speed == 8.5 * 1024 ** 2
+    assert eta == 3.0
+    assert events[9].value[1] == 900 * 1024
+    assert parser.done and not parser.failed
+
+
+def test_parts_and_stages():
+    _, events = feed("multi_part_retry.txt")
+    assert [e.value for e in events if e.kind == PART] == [1, 3]
+    assert [e.value for e in events if e.kind == STAGE] == ["视频", "音频", "视频", "音频"]
+    videos = [e.value[1] for e in events if e.kind == TRACK and e.value[0] == "视频"]
+    assert len(videos) == 2 and "[HEVC]" in videos[0] and "[AVC]" in videos[1]
+
+
+def test_transient_error_does_not_fail():
+    parser, events = feed("multi_part_retry.txt")
+    assert ERROR in kinds(events)
+    assert events[-1].kind == DONE
+    assert not parser.failed
+
+
+def test_failure_uses_returncode():
+    parser, events = feed("failed.txt", returncode=1)
+    assert kinds(events) == [ERROR, FAILED]
+    assert events[-1].value.startswith("退出码 1: System.Exception")
+    assert parser.failed
+
+
+def test_nonzero_exit_without_error_lines():
+    _, events = feed("single_part.txt", returncode=2)
+    assert events[-1] == (FAILED, "退出码 2")
+
+
+def test_progress_restart_resets_eta():
+    clock = itertools.count()
+    parser = ProgressParser(clock=lambda: next(clock))
+    parser.feed(" 50.00% @ 1 MB/s")
+    # 百分比变小（重新开始）时重新计时
+    assert parser.feed(" 10.00% @ 1 MB/s").value[2] is None
+    assert parser.feed(" 20.00% @ 1 MB/s").value[2] == 8.0
+
+
+def test_ignores_unrelated_lines():
+    parser = ProgressParser()
+    assert parser.feed("") is None
+    assert parser.feed("BBDown version 1.6.1, Bilibili Downloader.") is None
+    assert parser.feed("[2023-10-01 12:00:00.001] - 检测账号登录...") is None
+
+
+def test_format():
+    assert format_speed(512) == "512.00 B/s"
+    assert format_speed(1536) == "1.50 KB/s"
+    assert format_eta(65) == "01:05"
+    assert format_eta(3725) == "01:02:05"